@@ -1,24 +1,24 @@
 # main.py
-# Voraussetzungen: pip install PySide6
-# Start: python main.py
+# Voraussetzungen: pip install PySide6   (optional für die Statistik: pip install numpy)
+# Start: python main.py   (Startzeit-Report: python main.py --startup-report oder QUIZ_STARTUP_REPORT=1)
 
 from __future__ import annotations
+import time
+_T0 = time.perf_counter()  # vor allen schweren Importen: Basis für den Startzeit-Report
+
+import os
 import sys
-from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QListWidget, QPushButton, QLabel, QMessageBox
+from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QPushButton, QLabel, QMessageBox
 from PySide6.QtCore import Qt
 
-# Module (Editor optional, falls vorhanden)
-from quiz_blindpick import BlindPickQuiz
-try:
-    from quiz_blindpick_editor import BlindPickEditor
-except Exception:
-    BlindPickEditor = None
+from quiz_registry import ModuleInfo, StartupReport, discover_modules
+
+REPORT = StartupReport(_T0, enabled="--startup-report" in sys.argv or bool(os.environ.get("QUIZ_STARTUP_REPORT")))
+REPORT.mark("PySide6 + Registry importiert")
 
-QUIZ_REGISTRY = {
-    "Blind Pick": BlindPickQuiz
-}
-if BlindPickEditor:
-    QUIZ_REGISTRY["Blind Pick — Editor"] = BlindPickEditor
+# Module werden nur beschrieben (MODULE_INFO), importiert wird erst bei "Starten"
+QUIZ_REGISTRY = {m.name: m for m in discover_modules()}
+REPORT.mark(f"Module gefunden ({len(QUIZ_REGISTRY)})")
 
 class StartScreen(QWidget):
     def __init__(self):
@@ -29,15 +29,25 @@ class StartScreen(QWidget):
 
         v.addWidget(QLabel("Quiz-/Tool-Modul auswählen:"))
         self.list_mods = QListWidget()
-        for name in QUIZ_REGISTRY.keys():
+        for name, info in QUIZ_REGISTRY.items():
             self.list_mods.addItem(name)
+            if info.description:
+                self.list_mods.item(self.list_mods.count() - 1).setToolTip(info.description)
         v.addWidget(self.list_mods, 1)
 
+        hb = QHBoxLayout()
+        self.btn_stats = QPushButton("Statistik …")
+        self.btn_stats.setToolTip("Ranglisten und Auswertungen über alle aufgezeichneten Blind-Pick-Shows")
+        self.btn_stats.clicked.connect(self.show_stats)
         self.btn_start = QPushButton("Starten")
         self.btn_start.clicked.connect(self.start_selected)
-        v.addWidget(self.btn_start, alignment=Qt.AlignRight)
+        hb.addWidget(self.btn_stats)
+        hb.addStretch(1)
+        hb.addWidget(self.btn_start)
+        v.addLayout(hb)
 
         self.module_win = None
+        self.stats_win = None
 
     def start_selected(self):
         row = self.list_mods.currentRow()
@@ -45,16 +55,47 @@ class StartScreen(QWidget):
             QMessageBox.critical(self, "Info", "Bitte ein Modul wählen.")
             return
         mod_name = self.list_mods.currentItem().text()
-        cls = QUIZ_REGISTRY[mod_name]
+        info: ModuleInfo = QUIZ_REGISTRY[mod_name]
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            cls = info.load()
+        except Exception as e:
+            QMessageBox.critical(self, "Fehler", f"Modul '{mod_name}' konnte nicht geladen werden:\n{e}")
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        REPORT.mark(f"{mod_name}: Modul importiert")
         self.hide()
         self.module_win = cls(on_close=self.on_module_closed)
         self.module_win.show()
+        REPORT.mark(f"{mod_name}: Fenster erstellt")
+        REPORT.watch_first_paint(QApplication.instance(), f"{mod_name}: erstes Bild")
+
+    def show_stats(self):
+        # erst hier importieren: NumPy/Statistik belasten den Start nicht
+        import quiz_blindpick_stats as stats
+        if not stats.available():
+            QMessageBox.information(self, "Statistik", "Für die Statistik wird NumPy benötigt:\npip install numpy")
+            return
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            if self.stats_win is None:
+                self.stats_win = stats.StatsWindow()
+            else:
+                self.stats_win.reload()
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.stats_win.show()
+        self.stats_win.raise_()
 
     def on_module_closed(self):
         self.show()
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    REPORT.mark("QApplication erstellt")
     w = StartScreen()
+    REPORT.mark("Startscreen erstellt")
+    REPORT.watch_first_paint(w, "Startscreen: erstes Bild")
     w.show()
     sys.exit(app.exec())
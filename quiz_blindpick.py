@@ -1,29 +1,55 @@
 # quiz_blindpick.py
 # Implementiert:
-# - SetupDialog: Spielernamen + Template-JSON laden (rounds [{title, video, truth}])
+# - SetupDialog: Spielernamen + Template-JSON laden (rounds [{title, video, truth}], gestreamt im Hintergrund), Videos prüfen
 # - AudienceWindow: Video oben, mittig Antworten als gerahmte Zeilen mit rechts ausgerichteten, NON-interaktiven Auswahlspalten, unten quadratische Kamera-/Score-Overlays
+#   (ab TABLE_VIEW_MIN_PLAYERS Spielern als virtualisierte Model/View-Tabelle, siehe quiz_blindpick_views.py)
 # - ControlWindow: Moderatorsteuerung mit Eingabe, Mischen & Anzeigen, ButtonGroup-Single-Choice, gezieltem Aufdecken (Button wird grün/"Aufgedeckt"), Punktevergabe
 # - Lautstärke-Slider im Moderationsfenster (steuert QAudioOutput des Zuschauerfensters)
+# - Videos der Nachbarrunden werden vorgeladen (MediaDeck, siehe quiz_blindpick_media.py)
+# - Spiellogik (Mischen, Auswahl, Aufdecken, Punkte) liegt in quiz_blindpick_engine.py; ControlWindow beobachtet die Engine
+#   und gibt Änderungen an das Zuschauerfenster weiter
 # - BlindPickQuiz: Wrapper mit rückwärtskompatibler __init__
+# - QtMultimedia wird erst mit dem Zuschauerfenster geladen (Startscreen/Registry importieren nur MODULE_INFO)
+# - Optional: Zuschauerfenster in eigenen Prozessen, gespeist über einen lokalen Socket (AUDIENCE_PROCESSES, quiz_blindpick_remote.py)
+# - Optional: Antwort-Server im LAN — Spieler antworten/stimmen per Browser (Button "Antwort-Server", quiz_blindpick_server.py)
+# - Vorbereitung im Leerlauf: Raster der nächsten Runde (Moderator + Zuschauer) und ihre Mischung entstehen in 0-ms-Timer-Häppchen
+#   (quiz_blindpick_idle.py); "Mischen und Anzeigen" setzt dann nur noch Texte/Auswahl ein
+# - Raster, Antwortfelder und Spieler-Slots kommen aus einem WidgetPool je Fenster und werden zurückgegeben statt gelöscht
+#   (quiz_blindpick_pool.py) — nach der ersten Runde entstehen keine neuen Widgets mehr
+# - Auswahl, Aufdecken und Punkte im Zuschauerfenster werden gesammelt und einmal pro Bildschirm-Frame angewendet
+#   (quiz_blindpick_frames.py) — viele Stimmen auf einmal kosten nur einen Repaint
+# - Sitzungsprotokoll: jede Änderung am Spielstand wird mitgeschrieben; nach einem Absturz bietet das Moderatorfenster
+#   das Fortsetzen an (SESSION_LOG, quiz_blindpick_session.py)
+# - Optional: Latenz-Panel + Trace-Export im Moderatorfenster (LATENCY_OVERLAY / QUIZ_LATENCY=1, quiz_blindpick_latency.py)
+# - Aussehen kommt aus einem zentralen App-Stylesheet (quiz_blindpick_theme.py): Widgets tragen nur objectName/Properties,
+#   der Aufdecken-Zustand ist ein Property-Wechsel + Neu-Polieren
+# - Stimmenzahl je Antwort live bei Moderator und Zuschauern (Engine führt je Zeile die Wähler nach, Event "votes";
+#   AUDIENCE_VOTE_COUNTS schaltet die Anzeige im Zuschauerfenster ab)
+# - Optional: Live-Bilder in den Kamera-Slots (PLAYER_FEEDS / QUIZ_FEEDS: "test", "camera" oder Ordner mit Bild/Video je Spieler),
+#   einmal auf SQUARE_MAX verkleinert, mit FPS-Obergrenze je Slot und Zeitbudget je Frame (quiz_blindpick_feeds.py)
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field
-from pathlib import Path
+import os
+from dataclasses import dataclass
 from typing import List, Dict, Optional
-from collections import deque
-import random
 
-from PySide6.QtCore import Qt, QUrl, QSize
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QRect, QSize, QTimer
+from PySide6.QtGui import QImage, QPainter
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QVBoxLayout, QHBoxLayout, QPushButton,
     QGridLayout, QGroupBox, QSpacerItem, QSizePolicy, QDialog, QPlainTextEdit,
-    QFileDialog, QLineEdit, QMessageBox, QButtonGroup, QScrollArea, QCheckBox, QFrame, QSlider
+    QFileDialog, QLineEdit, QMessageBox, QButtonGroup, QScrollArea, QCheckBox, QFrame, QSlider,
+    QStackedWidget, QListView, QProgressBar, QDockWidget
 )
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
-from PySide6.QtMultimediaWidgets import QVideoWidget
+from quiz_blindpick_probe import MediaProber, MediaInfo
+from quiz_blindpick_loader import TemplateLoader, LazyRounds
+from quiz_blindpick_views import AnswersTableView, SelectionGridView, MediaListModel, count_votes, votes_text
+from quiz_blindpick_engine import BlindPickEngine, RoundRuntime
+from quiz_blindpick_idle import IdleQueue
+from quiz_blindpick_pool import WidgetPool
+from quiz_blindpick_frames import FrameBatcher
+import quiz_blindpick_theme as theme
 
 # =========================
 # Konfiguration (anpassen)
@@ -36,8 +62,18 @@ CHK_PADDING = 1           # Padding pro Checkboxzelle (px) — hier anpassen
 BTN_COLOR_SHOW = "#0d6efd"  # hellblau: "Aufdecken" — hier anpassen
 BTN_COLOR_DONE = "#2e7d32"  # grün: "Aufgedeckt" — hier anpassen
 DEFAULT_VOLUME = 70       # Startlautstärke in Prozent — hier anpassen
+TABLE_VIEW_MIN_PLAYERS = 12  # ab dieser Spielerzahl virtualisierte Tabellen (Zuschauer + Moderator) statt Widget-Raster — hier anpassen
+AUDIENCE_PROCESSES = 0    # 0 = Zuschauerfenster im selben Prozess, n = n eigene Anzeige-Prozesse (auch QUIZ_AUDIENCE_PROCESSES=n) — hier anpassen
+LATENCY_OVERLAY = False   # Latenz-Panel + Trace im Moderatorfenster (alternativ Umgebungsvariable QUIZ_LATENCY=1) — hier anpassen
+SESSION_LOG = True        # Spielstand laufend protokollieren und nach Absturz Fortsetzen anbieten — hier anpassen
+AUDIENCE_VOTE_COUNTS = True   # Stimmenzahl je Antwort auch im Zuschauerfenster zeigen (vor dem Aufdecken) — hier anpassen
+PLAYER_FEEDS = ""         # Kamera-Slots: "" = leer, "test", "camera" oder Ordner mit <Spieler>.<png|jpg|mp4…> (auch QUIZ_FEEDS=…) — hier anpassen
 # =========================
 
+# Eintrag für den Startscreen (quiz_registry.py liest das per ast, ohne dieses Modul zu importieren)
+MODULE_INFO = {"name": "Blind Pick", "entry": "BlindPickQuiz", "order": 10,
+               "description": "Antworten mischen, blind wählen, aufdecken — mit Zuschauerfenster"}
+
 # ------------------------
 # Datenstrukturen
 # ------------------------
@@ -48,12 +84,13 @@ class RoundTemplate:
     video: str
     truth: str
 
-@dataclass
-class RoundRuntime:
-    players_answers: List[str] = field(default_factory=list)            # Länge = len(players)
-    shuffled_order: List[int] = field(default_factory=list)             # Permutation über range(len(players)+1)
-    revealed: List[bool] = field(default_factory=list)                  # Sichtbarkeit pro Zeile (Anzeige-Reihenfolge)
-    selections: Dict[str, Optional[int]] = field(default_factory=dict)  # player -> Zeilenindex (Anzeige-Reihenfolge)
+def normalize_round(index: int, r: Dict[str, str]) -> tuple:
+    """Runde aus dem Template -> (title, video, truth); läuft im Loader-Thread."""
+    title = r.get("title") or f"Runde {index + 1}"
+    video = r.get("video") or ""
+    # Hinweis: Dieses Feld heißt im Editor i.d.R. "truth"; falls dort "Richtige Antwort" verwendet wird, bitte angleichen.
+    truth = r.get("Richtige Antwort") or r.get("truth") or ""
+    return (title, video, truth)
 
 # ------------------------
 # Setup-Dialog
@@ -79,6 +116,32 @@ class SetupDialog(QDialog):
         hv.addWidget(self.template_edit, 1)
         hv.addWidget(self.btn_browse)
         v.addLayout(hv)
+        self.template_edit.editingFinished.connect(self.start_loading)
+
+        # Ladefortschritt (Template wird im Hintergrund gestreamt)
+        hl = QHBoxLayout()
+        self.load_label = QLabel("Template: –")
+        self.load_bar = QProgressBar()
+        self.load_bar.setRange(0, 1000)
+        self.load_bar.setTextVisible(False)
+        self.load_bar.setVisible(False)
+        hl.addWidget(self.load_label, 1)
+        hl.addWidget(self.load_bar)
+        v.addLayout(hl)
+
+        # Medienstatus je Runde (Hintergrundprüfung, Ergebnisse im Sidecar-Cache)
+        self.media_label = QLabel("Medienstatus: –")
+        v.addWidget(self.media_label)
+        self.media_model = MediaListModel(self)   # eine Zeile je Runde, ohne Widget je Eintrag
+        self.media_list = QListView()
+        self.media_list.setUniformItemSizes(True)
+        self.media_list.setModel(self.media_model)
+        v.addWidget(self.media_list, 1)
+        self.prober = MediaProber(self)
+        self.prober.probed.connect(self.on_probed)
+        self.prober.finished.connect(self.update_media_label)
+        self.media_infos: Dict[int, MediaInfo] = {}
+        self.media_bad = 0   # Anzahl fehlerhafter Einträge in media_infos (laufend mitgezählt)
 
         hb = QHBoxLayout()
         self.btn_cancel = QPushButton("Abbrechen")
@@ -91,13 +154,115 @@ class SetupDialog(QDialog):
         v.addLayout(hb)
 
         self.players: List[str] = []
-        self.template: List[RoundTemplate] = []
+        self.template: LazyRounds = LazyRounds(RoundTemplate)
+        self.loader: Optional[TemplateLoader] = None
+        self.loaded_path = ""
+        self.load_state = "idle"      # idle | loading | done | failed
+        self.load_error = ""
+        self.load_warnings: List[str] = []
+        self._accept_pending = False
 
     def choose_template(self):
         path, _ = QFileDialog.getOpenFileName(self, "Template öffnen", "", "JSON (*.json)")
         if not path:
             return
         self.template_edit.setText(path)
+        self.start_loading()
+
+    # ----- Template laden (gestreamt) + Medienprüfung -----
+
+    def start_loading(self):
+        path = self.template_edit.text().strip()
+        if not path or path == self.loaded_path:
+            return
+        if self.loader is not None:
+            self.loader.cancel()
+        self.loaded_path = path
+        self.template = LazyRounds(RoundTemplate)
+        self.media_infos = {}
+        self.media_bad = 0
+        self.media_model.reset(self.template, self.media_infos)
+        self.load_state = "loading"
+        self.load_error = ""
+        self.load_warnings = []
+        self.load_label.setText("Template: lade …")
+        self.load_bar.setValue(0)
+        self.load_bar.setVisible(True)
+        self.update_media_label()
+        self.prober.start(path)
+        self.loader = TemplateLoader(path, normalize_round, self)
+        self.loader.batch.connect(self.on_batch)
+        self.loader.progress.connect(self.on_progress)
+        self.loader.finished_ok.connect(self.on_loaded)
+        self.loader.failed.connect(self.on_load_failed)
+        self.loader.start()
+
+    def _is_current(self) -> bool:
+        return self.sender() is self.loader
+
+    def on_batch(self, raw: List[tuple]):
+        if not self._is_current():
+            return
+        first = len(self.template)
+        self.template.extend_raw(raw)
+        if not self.isVisible():
+            return  # Dialog schon geschlossen: nur die Rundenliste wächst weiter
+        self.media_model.rounds_appended(len(raw))
+        self.prober.add(first, [t[1] for t in raw])
+        self.load_label.setText(f"Template: {len(self.template)} Runden geladen …")
+        self.update_media_label()
+        if self._accept_pending:
+            self._finish_accept()
+
+    def on_progress(self, done: int, total: int):
+        if self._is_current() and total > 0:
+            self.load_bar.setValue(int(done * 1000 / total))
+
+    def on_loaded(self, count: int, warnings: List[str]):
+        if not self._is_current():
+            return
+        self.load_state = "done"
+        self.load_warnings = warnings
+        self.load_bar.setVisible(False)
+        extra = f", {len(warnings)} Warnung(en)" if warnings else ""
+        self.load_label.setText(f"Template: {count} Runden{extra}")
+        if warnings:
+            self.load_label.setToolTip("\n".join(warnings[:50]))
+        self.prober.close_input()
+        if self._accept_pending:
+            self._finish_accept()
+
+    def on_load_failed(self, msg: str):
+        if not self._is_current():
+            return
+        self.load_state = "failed"
+        self.load_error = msg
+        self.load_bar.setVisible(False)
+        self.load_label.setText("Template: Fehler beim Laden")
+        self.prober.close_input()
+        if self._accept_pending:
+            self._accept_pending = False
+            QMessageBox.critical(self, "Fehler", f"Konnte Template nicht laden:\n{msg}")
+
+    def on_probed(self, results: List[tuple]):
+        if not results:
+            return
+        for index, info in results:
+            old = self.media_infos.get(index)
+            self.media_bad += (not info.ok) - (old is not None and not old.ok)
+            self.media_infos[index] = info
+        self.media_model.infos_changed(min(i for i, _ in results), max(i for i, _ in results))
+        self.update_media_label()   # einmal je Block
+
+    def update_media_label(self):
+        total = self.media_model.rowCount()
+        self.media_label.setText(f"Medienstatus: {len(self.media_infos)}/{total} geprüft, {self.media_bad} Problem(e)")
+
+    def done(self, r: int):
+        self.prober.cancel()
+        if r != QDialog.Accepted and self.loader is not None:
+            self.loader.cancel()
+        super().done(r)
 
     def accept(self):
         raw = self.players_edit.toPlainText().splitlines()
@@ -109,25 +274,32 @@ class SetupDialog(QDialog):
         if not path:
             QMessageBox.information(self, "Hinweis", "Bitte ein Template-JSON wählen.")
             return
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception as e:
-            QMessageBox.critical(self, "Fehler", f"Konnte Template nicht laden:\n{e}")
-            return
-        rounds = data.get("rounds", [])
-        if not isinstance(rounds, list) or not rounds:
-            QMessageBox.information(self, "Hinweis", "Das Template enthält keine Runden.")
-            return
-        templ: List[RoundTemplate] = []
-        for i, r in enumerate(rounds, start=1):
-            title = r.get("title") or f"Runde {i}"
-            video = r.get("video") or ""
-            # Hinweis: Dieses Feld heißt im Editor i.d.R. "truth"; falls dort "Richtige Antwort" verwendet wird, bitte angleichen.
-            truth = r.get("Richtige Antwort") or r.get("truth") or ""
-            templ.append(RoundTemplate(title=title, video=video, truth=truth))
         self.players = players
-        self.template = templ
+        self.start_loading()
+        if self.load_state == "failed":
+            QMessageBox.critical(self, "Fehler", f"Konnte Template nicht laden:\n{self.load_error}")
+            return
+        if not len(self.template):
+            if self.load_state == "done":
+                QMessageBox.information(self, "Hinweis", "Das Template enthält keine Runden.")
+                return
+            # Start, sobald die erste Runde da ist — der Rest lädt im Hintergrund weiter
+            self._accept_pending = True
+            self.load_label.setText("Template: starte nach der ersten Runde …")
+            return
+        self._finish_accept()
+
+    def _finish_accept(self):
+        self._accept_pending = False
+        bad = sorted(i for i, info in self.media_infos.items() if not info.ok)
+        if bad:
+            ret = QMessageBox.question(
+                self, "Medienprobleme",
+                f"{len(bad)} Runde(n) mit fehlerhaftem Video (z.B. {self.template[bad[0]].title}). Trotzdem starten?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if ret != QMessageBox.Yes:
+                return
         super().accept()
 
 # ------------------------
@@ -135,6 +307,30 @@ class SetupDialog(QDialog):
 # ------------------------
 
 class SquareWidget(QWidget):
+    """Kamera-Slot: zeigt das zuletzt gelieferte Bild (schon quadratisch und verkleinert, siehe quiz_blindpick_feeds.py)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._frame: Optional[QImage] = None
+
+    def set_frame(self, img: Optional[QImage]):
+        if img is None and self._frame is None:
+            return
+        self._frame = img   # nur Referenz (implizit geteilt), keine Kopie
+        self.update()
+
+    def paintEvent(self, e):
+        if self._frame is None:
+            return
+        side = min(self.width(), self.height())
+        x, y = (self.width() - side) // 2, (self.height() - side) // 2
+        p = QPainter(self)
+        if side == self._frame.width():
+            p.drawImage(x, y, self._frame)
+        else:
+            p.drawImage(QRect(x, y, side, side), self._frame)
+        p.end()
+
     def sizeHint(self) -> QSize:
         return QSize(min(240, SQUARE_MAX), min(240, SQUARE_MAX))
     def hasHeightForWidth(self) -> bool:
@@ -142,10 +338,371 @@ class SquareWidget(QWidget):
     def heightForWidth(self, w: int) -> int:
         return min(w, SQUARE_MAX)
 
-def style_button(btn: QPushButton, color: str):
-    btn.setStyleSheet(
-        f"QPushButton {{ background-color: {color}; color: white; border: none; padding: 6px 10px; border-radius: 6px; }}"
-    )
+class _PlayerSlot:
+    """Kamera-Slot + Punkte eines Spielers im Zuschauerfenster (aus dem WidgetPool)."""
+
+    __slots__ = ("widget", "square", "score")
+
+    def __init__(self):
+        self.widget = QGroupBox()
+        vb = QVBoxLayout(self.widget)
+        self.square = SquareWidget()
+        self.square.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        self.square.setMaximumSize(QSize(SQUARE_MAX, SQUARE_MAX))  # Begrenzung
+        vb.addWidget(self.square)
+        self.score = QLabel("Punkte: 0", alignment=Qt.AlignCenter)
+        self.score.setObjectName("scoreLabel")
+        vb.addWidget(self.score)
+
+    def reset(self):
+        self.score.setText("Punkte: 0")
+        self.square.set_frame(None)
+
+def install_theme():
+    """App-Stylesheet mit den hier konfigurierten Farben installieren (mehrfacher Aufruf ist harmlos)."""
+    theme.install(BTN_COLOR_SHOW, BTN_COLOR_DONE, CHK_PADDING)
+
+def set_reveal_state(btn: QPushButton, state: str):
+    """Aufdecken-Button umschalten: "show" (BTN_COLOR_SHOW) oder "done" (BTN_COLOR_DONE)."""
+    theme.set_state(btn, state)
+
+# ------------------------
+# Vorbereitete Raster (im Leerlauf gebaut, beim Anzeigen nur befüllt)
+# ------------------------
+
+class _AnswerRow:
+    """Gerahmte Antwortzeile des Zuschauerfensters (Autor + Text + eine Checkbox je Spalte)."""
+
+    __slots__ = ("widget", "inner", "author", "votes", "body", "boxes")
+
+    def __init__(self):
+        self.widget = QFrame()
+        self.widget.setObjectName("answerRow")
+        self.inner = QGridLayout(self.widget)
+        self.inner.setContentsMargins(ANSWER_ROW_PADDING, ANSWER_ROW_PADDING, ANSWER_ROW_PADDING, ANSWER_ROW_PADDING)
+        self.inner.setHorizontalSpacing(COL_SPACING)
+        self.inner.setVerticalSpacing(0)
+
+        # Linke Zelle: Autor + Text (Texte setzt AudienceWindow.set_answers_grid)
+        leftw = QWidget(); lh = QVBoxLayout(leftw); lh.setContentsMargins(0,0,0,0); lh.setSpacing(5)
+        self.author = QLabel("Autor: ???")
+        self.author.setObjectName("answerAuthor")
+        self.votes = QLabel(alignment=Qt.AlignRight | Qt.AlignVCenter)
+        self.votes.setObjectName("voteCount")
+        self.votes.setVisible(AUDIENCE_VOTE_COUNTS)
+        top = QHBoxLayout(); top.setContentsMargins(0, 0, 0, 0)
+        top.addWidget(self.author)
+        top.addWidget(self.votes)
+        self.body = QLabel()
+        self.body.setWordWrap(True)
+        self.body.setObjectName("answerBody")
+        self.body.setFixedWidth(1000)
+        lh.addLayout(top)
+        lh.addWidget(self.body)
+        self.inner.addWidget(leftw, 0, 0)
+        self.boxes: List[QCheckBox] = []   # Spalte c-1 (Checkboxen aus dem Pool)
+
+    def reset(self):
+        self.author.setText("Autor: ???")
+        self.votes.clear()
+        self.body.clear()
+        for cb in self.boxes:
+            cb.setChecked(False)
+
+
+class _AnswerPage:
+    """Antwortenraster des Zuschauerfensters (Kopfzeile + gerahmte Zeilen) für eine Spaltenreihenfolge und Zeilenzahl.
+    Kommt aus dem WidgetPool des Fensters und behält beim Zurückgeben seine Zeilen: bei gleicher Größe werden beim
+    nächsten Mal nur Spaltenköpfe umbenannt, sonst überzählige Zeilen/Checkboxen zurückgegeben bzw. fehlende geholt."""
+
+    __slots__ = ("pool", "key", "widget", "grid", "headers", "rows", "author_labels", "body_labels", "vote_labels",
+                 "sel_boxes")
+
+    def __init__(self, pool: WidgetPool):
+        self.pool = pool
+        self.key = ((), 0)
+        self.widget = QWidget()
+        self.grid = QGridLayout(self.widget)
+        self.grid.setContentsMargins(0, 0, 0, 0)
+        self.grid.setHorizontalSpacing(COL_SPACING)
+        self.grid.setVerticalSpacing(ROW_SPACING)
+        hdr_ans = QLabel("Antworten")
+        hdr_ans.setObjectName("answerHeader")
+        hdr_ans.setWordWrap(True)
+        hdr_ans.setFixedWidth(1000)
+        hdr_ans.setContentsMargins(20, 0, 0, 0)
+        self.grid.addWidget(hdr_ans, 0, 0)
+        self.headers: List[QLabel] = []
+        self.rows: List[_AnswerRow] = []
+        self.author_labels: List[QLabel] = []            # "Autor: …"-Label pro Zeile (Anzeige-Reihenfolge)
+        self.body_labels: List[QLabel] = []
+        self.vote_labels: List[QLabel] = []
+        self.sel_boxes: Dict[str, List[QCheckBox]] = {}
+
+    @staticmethod
+    def register(pool: WidgetPool):
+        pool.register("answerPage", lambda: _AnswerPage(pool), _AnswerPage.reset, park=False)
+        pool.register("answerRow", _AnswerRow, _AnswerRow.reset)
+        pool.register("columnHeader", _new_column_header)
+        pool.register("audienceBox", _new_audience_box, _uncheck)
+
+    @staticmethod
+    def acquire(pool: WidgetPool, col_players: List[str], n_rows: int, parent: QWidget) -> "_AnswerPage":
+        page: _AnswerPage = pool.acquire("answerPage")
+        page.key = (tuple(col_players), n_rows)
+        if page.widget.parentWidget() is not parent:
+            page.widget.setParent(parent)   # gleich am Ziel-Container (kein Umhängen eines Fensters)
+        page.widget.hide()                  # bis zur Übernahme versteckt
+        while len(page.headers) > len(col_players):
+            pool.release("columnHeader", page.headers.pop())
+        while len(page.headers) < len(col_players):
+            lab: QLabel = pool.acquire("columnHeader")
+            page.headers.append(lab)
+            page.grid.addWidget(lab, 0, len(page.headers))
+        for lab, pname in zip(page.headers, col_players):
+            lab.setText(pname)
+        return page
+
+    def reset(self):
+        """Beim Zurückgeben: Texte/Häkchen leeren, Zeilen bleiben für die nächste Runde stehen."""
+        for row in self.rows:
+            row.reset()
+
+    def _release_row(self, row: _AnswerRow):
+        self.pool.release_all("audienceBox", row.boxes)
+        row.boxes = []
+        self.pool.release("answerRow", row)
+
+    def build(self):
+        """Generator: eine Zeile je Schritt (IdleQueue); vollständig durchlaufen = Raster fertig."""
+        col_players, n_rows = self.key
+        n_cols = len(col_players)
+        while len(self.rows) > n_rows:
+            self._release_row(self.rows.pop())
+        for r in range(n_rows):
+            if r < len(self.rows):
+                row = self.rows[r]
+                if len(row.boxes) == n_cols:
+                    continue   # passt schon (Normalfall ab der zweiten Runde)
+                self.grid.removeWidget(row.widget)
+            else:
+                row = self.pool.acquire("answerRow")
+                self.rows.append(row)
+
+            # Rechts: Checkbox-Spalten (nur Anzeige)
+            while len(row.boxes) > n_cols:
+                self.pool.release("audienceBox", row.boxes.pop())
+            while len(row.boxes) < n_cols:
+                cb: QCheckBox = self.pool.acquire("audienceBox")
+                row.boxes.append(cb)
+                row.inner.addWidget(cb, 0, len(row.boxes), alignment=Qt.AlignCenter)
+
+            # Den Rahmen über alle Spalten legen
+            self.grid.addWidget(row.widget, r + 1, 0, 1, n_cols + 1)
+            row.widget.ensurePolished()   # Theme-Auflösung auch schon im Leerlauf
+            yield
+        self.author_labels = [row.author for row in self.rows]
+        self.body_labels = [row.body for row in self.rows]
+        self.vote_labels = [row.votes for row in self.rows]
+        self.sel_boxes = {pname: [row.boxes[c] for row in self.rows] for c, pname in enumerate(col_players)}
+
+
+class _PickPage:
+    """Auswahlraster des Moderators (Kopfzeile, ButtonGroups, Aufdecken-Buttons) für eine Spaltenreihenfolge.
+    Wie _AnswerPage aus dem WidgetPool und mit stehenbleibenden Zeilen; die ButtonGroups werden beim Übernehmen
+    mit den Spielern der neuen Spaltenreihenfolge verbunden."""
+
+    __slots__ = ("pool", "key", "widget", "grid", "hdr_status", "hdr_votes", "headers", "group_list", "groups",
+                 "box_rows", "info_labels", "reveal_buttons", "vote_labels", "_pick_handler", "_on_reveal")
+
+    def __init__(self, pool: WidgetPool, pick_handler, on_reveal):
+        self.pool = pool
+        self.key = ((), 0)
+        self.widget = QWidget()
+        self.grid = QGridLayout(self.widget)
+        self.grid.setContentsMargins(0, 0, 0, 0)
+        self.grid.setHorizontalSpacing(5)
+        self.grid.setVerticalSpacing(5)
+        self.grid.addWidget(QLabel("Autor / Antwort"), 0, 0)
+        self.hdr_status = QLabel("Status")
+        self.grid.addWidget(self.hdr_status, 0, 1)
+        self.hdr_votes = QLabel("Stimmen")
+        self.grid.addWidget(self.hdr_votes, 0, 2)
+        self.headers: List[QLabel] = []
+        self.group_list: List[QButtonGroup] = []       # ButtonGroup je Spalte
+        self.groups: Dict[str, QButtonGroup] = {}
+        self.box_rows: List[List[QCheckBox]] = []      # Checkboxen je Zeile (Spalte c-1)
+        self.info_labels: List[QLabel] = []
+        self.reveal_buttons: List[QPushButton] = []
+        self.vote_labels: List[QLabel] = []            # Stimmenzahl je Zeile (setzt ControlWindow)
+        self._pick_handler = pick_handler
+        self._on_reveal = on_reveal
+
+    @staticmethod
+    def register(pool: WidgetPool, pick_handler, on_reveal):
+        pool.register("pickPage", lambda: _PickPage(pool, pick_handler, on_reveal), _PickPage.reset, park=False)
+        pool.register("pickHeader", _new_pick_header)
+        pool.register("pickInfo", QLabel, QLabel.clear)
+        pool.register("pickVotes", _new_pick_votes, QLabel.clear)
+        pool.register("pickBox", _new_pick_box, _release_pick_box)
+        pool.register("pickGroup", _new_pick_group, _reset_pick_group)
+        pool.register("revealButton", _new_reveal_button, _reset_reveal_button)
+
+    @staticmethod
+    def acquire(pool: WidgetPool, col_players: List[str], n_rows: int, parent: QWidget) -> "_PickPage":
+        page: _PickPage = pool.acquire("pickPage")
+        page.key = (tuple(col_players), n_rows)
+        if page.widget.parentWidget() is not parent:
+            page.widget.setParent(parent)
+        page.widget.hide()
+        n_cols = len(col_players)
+
+        # Kopfzeile + ButtonGroups (eine je Spalte)
+        if len(page.headers) != n_cols:
+            page.grid.removeWidget(page.hdr_status)
+            page.grid.removeWidget(page.hdr_votes)
+            page.grid.addWidget(page.hdr_status, 0, n_cols + 1)
+            page.grid.addWidget(page.hdr_votes, 0, n_cols + 2)
+        while len(page.headers) > n_cols:
+            pool.release("pickHeader", page.headers.pop())
+            pool.release("pickGroup", page.group_list.pop())
+        while len(page.headers) < n_cols:
+            lab: QLabel = pool.acquire("pickHeader")
+            page.headers.append(lab)
+            page.grid.addWidget(lab, 0, len(page.headers))
+            page.group_list.append(pool.acquire("pickGroup"))
+        page.groups = {}
+        for lab, grp, pname in zip(page.headers, page.group_list, col_players):
+            lab.setText(pname)
+            grp.idClicked.connect(page._pick_handler(pname))
+            page.groups[pname] = grp
+        return page
+
+    def reset(self):
+        """Beim Zurückgeben: Auswahl/Aufdecken zurücksetzen und Klick-Handler trennen; Zeilen bleiben stehen."""
+        for grp in self.group_list:
+            grp.idClicked.disconnect()
+            checked = grp.checkedButton()
+            if checked is not None:   # in einer exklusiven Gruppe lässt sich das Häkchen nur so entfernen
+                grp.setExclusive(False)
+                checked.setChecked(False)
+                grp.setExclusive(True)
+        for btn in self.reveal_buttons:
+            _restore_reveal_button(btn)
+        for info in self.info_labels:
+            info.clear()
+        for lab in self.vote_labels:
+            lab.clear()
+        self.groups = {}
+
+    def _release_row(self):
+        self.pool.release_all("pickBox", self.box_rows.pop())
+        self.pool.release("pickInfo", self.info_labels.pop())
+        self.pool.release("revealButton", self.reveal_buttons.pop())
+        self.pool.release("pickVotes", self.vote_labels.pop())
+
+    def build(self):
+        """Generator: eine Zeile je Schritt (IdleQueue)."""
+        col_players, n_rows = self.key
+        n_cols = len(col_players)
+        while len(self.box_rows) > n_rows:
+            self._release_row()
+        for r in range(n_rows):
+            if r < len(self.box_rows):
+                boxes = self.box_rows[r]
+                if len(boxes) == n_cols:
+                    continue   # passt schon
+                btn = self.reveal_buttons[r]
+                self.grid.removeWidget(btn)
+                self.grid.removeWidget(self.vote_labels[r])
+            else:
+                # Autor + Antwort (Moderator sieht Autor; Text setzt ControlWindow._rebuild_checkboxes)
+                info: QLabel = self.pool.acquire("pickInfo")
+                self.info_labels.append(info)
+                self.grid.addWidget(info, r + 1, 0)
+                btn = self.pool.acquire("revealButton")
+                btn.clicked.connect(lambda _, i=r: self._on_reveal(i))
+                self.reveal_buttons.append(btn)
+                self.vote_labels.append(self.pool.acquire("pickVotes"))
+                boxes = []
+                self.box_rows.append(boxes)
+
+            # Auswahlspalten
+            while len(boxes) > n_cols:
+                self.pool.release("pickBox", boxes.pop())
+            while len(boxes) < n_cols:
+                cb = self.pool.acquire("pickBox")
+                self.group_list[len(boxes)].addButton(cb, r)
+                boxes.append(cb)
+                self.grid.addWidget(cb, r + 1, len(boxes), alignment=Qt.AlignCenter)
+
+            # Aufdecken-Button + Stimmenzahl
+            self.grid.addWidget(btn, r + 1, n_cols + 1)
+            self.grid.addWidget(self.vote_labels[r], r + 1, n_cols + 2)
+            for w in (self.info_labels[r], btn, self.vote_labels[r], *boxes):
+                w.ensurePolished()   # Theme-Auflösung auch schon im Leerlauf
+            yield
+
+
+# Factories/Reset für den WidgetPool
+
+def _new_column_header() -> QLabel:
+    lab = QLabel(); lab.setAlignment(Qt.AlignCenter)
+    lab.setObjectName("columnHeader")
+    return lab
+
+def _new_audience_box() -> QCheckBox:
+    cb = QCheckBox()
+    cb.setEnabled(False)  # nur Anzeige
+    cb.setObjectName("audienceBox")
+    return cb
+
+def _new_pick_header() -> QLabel:
+    lab = QLabel(); lab.setAlignment(Qt.AlignCenter)
+    return lab
+
+def _new_pick_votes() -> QLabel:
+    lab = QLabel(); lab.setAlignment(Qt.AlignCenter)
+    lab.setObjectName("voteCount")
+    return lab
+
+def _new_pick_box() -> QCheckBox:
+    cb = QCheckBox()
+    cb.setObjectName("pickBox")
+    return cb
+
+def _uncheck(cb: QCheckBox):
+    cb.setChecked(False)
+
+def _release_pick_box(cb: QCheckBox):
+    grp = cb.group()
+    if grp is not None:
+        grp.removeButton(cb)
+    cb.setChecked(False)
+
+def _new_pick_group() -> QButtonGroup:
+    grp = QButtonGroup()
+    grp.setExclusive(True)
+    return grp
+
+def _reset_pick_group(grp: QButtonGroup):
+    for b in grp.buttons():
+        grp.removeButton(b)
+
+def _new_reveal_button() -> QPushButton:
+    btn = QPushButton("Aufdecken")
+    btn.setObjectName("revealButton")
+    btn.setProperty("state", "show")
+    return btn
+
+def _restore_reveal_button(btn: QPushButton):
+    btn.setText("Aufdecken")
+    btn.setEnabled(True)
+    set_reveal_state(btn, "show")
+
+def _reset_reveal_button(btn: QPushButton):
+    btn.clicked.disconnect()   # Zeilenindex hängt an der Verbindung
+    _restore_reveal_button(btn)
 
 # ------------------------
 # Zuschauerfenster
@@ -154,6 +711,7 @@ def style_button(btn: QPushButton, color: str):
 class AudienceWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        install_theme()
         self.setWindowTitle("Blind Pick — Zuschauer")
         self.resize(2043, 1392)
 
@@ -163,12 +721,13 @@ class AudienceWindow(QMainWindow):
 
         # Globaler Vorbereitungshinweis (nur vor Setup)
         self.prep_label = QLabel("Das Quiz wird vorbereitet …", alignment=Qt.AlignCenter)
-        self.prep_label.setStyleSheet("font-size: 28px;")
+        self.prep_label.setObjectName("prepLabel")
         root.addWidget(self.prep_label)
 
-        # Video
-        self.video_widget = QVideoWidget()
-        root.addWidget(self.video_widget, 6)
+        # Video (mehrere Decks: aktives + vorgeladene Standby-Videos)
+        from quiz_blindpick_media import MediaDeck  # lädt QtMultimedia (Backend-Init) erst hier
+        self.media = MediaDeck()
+        root.addWidget(self.media, 6)
 
         # Antwortenbereich (Scroll + Grid)
         self.answers_area = QScrollArea()
@@ -179,154 +738,241 @@ class AudienceWindow(QMainWindow):
         self.answers_grid.setHorizontalSpacing(COL_SPACING)
         self.answers_grid.setVerticalSpacing(ROW_SPACING)
         self.answers_area.setWidget(self.answers_container)
-        root.addWidget(self.answers_area, 5)
+
+        # Alternative Ansicht für große Runden: Model/View-Tabelle ohne Widget pro Zelle
+        self.answers_table = AnswersTableView()
+        self.answers_table.answers_model.show_votes = AUDIENCE_VOTE_COUNTS
+        self.answers_stack = QStackedWidget()
+        self.answers_stack.addWidget(self.answers_area)
+        self.answers_stack.addWidget(self.answers_table)
+        root.addWidget(self.answers_stack, 5)
 
         # Platzhalter in der Mitte bis zum Mischen
         self.wait_label = QLabel("Warte auf Antworten …", alignment=Qt.AlignCenter)
-        self.wait_label.setStyleSheet("font-size: 22px; color: #AAA;")
+        self.wait_label.setObjectName("waitLabel")
 
         # Score/Overlay mit quadratischen Slots
         self.overlay = QWidget()
         self.overlay_grid = QGridLayout(self.overlay)
         root.addWidget(self.overlay, 2)
 
-        # Media
-        self.player = QMediaPlayer(self)
-        self.audio = QAudioOutput(self)
-        self.player.setAudioOutput(self.audio)
-        self.player.setVideoOutput(self.video_widget)
-
         # Laufzeit
         self.players: List[str] = []
         self.col_players: List[str] = []
         self.score_labels: Dict[str, QLabel] = {}
+        self.score_values: Dict[str, int] = {}           # zuletzt gesetzte Punkte (Diff-Update)
         self.sel_boxes: Dict[str, List[QCheckBox]] = {}  # pname -> list[checkbox per row]
+        self.sel_rows: Dict[str, Optional[int]] = {}     # pname -> aktuell angezeigte Auswahl
+        self.author_labels: List[QLabel] = []            # "Autor: …"-Label pro Zeile (Anzeige-Reihenfolge)
+        self.vote_labels: List[QLabel] = []              # Stimmenzahl pro Zeile
+        self.idle = IdleQueue(self)
+        self.player_slots: List[_PlayerSlot] = []
+        self.pool = WidgetPool(self)
+        _AnswerPage.register(self.pool)
+        self.pool.register("playerSlot", _PlayerSlot, _PlayerSlot.reset)
+        self._page: Optional[_AnswerPage] = None         # angezeigtes Raster (geht beim nächsten Aufbau an den Pool)
+        self._staged: Optional[_AnswerPage] = None       # im Leerlauf vorbereitetes Raster (prepare_grid)
+        self.updates = FrameBatcher(self)                 # Diff-Updates gesammelt je Frame (stats(): angewendet/zusammengefasst)
+        self.feeds = None                                 # FeedHub für die Kamera-Slots (nur mit PLAYER_FEEDS/QUIZ_FEEDS)
 
         self.set_global_preparing(True)
 
     # Sichtbarkeit
     def set_global_preparing(self, on: bool):
         self.prep_label.setVisible(on)
-        self.video_widget.setVisible(not on)
-        self.answers_area.setVisible(not on)
+        self.media.setVisible(not on)
+        self.answers_stack.setVisible(not on)
         self.overlay.setVisible(not on)
 
+    def _use_table(self) -> bool:
+        return self.answers_stack.currentWidget() is self.answers_table
+
     def show_waiting_center(self):
+        self.updates.flush()
         self._clear_answers_grid()
+        self.answers_table.answers_model.clear()
+        self.answers_stack.setCurrentWidget(self.answers_area)
         self.answers_grid.addWidget(self.wait_label, 0, 0, 1, 1, alignment=Qt.AlignCenter)
 
     # Konfiguration
     def configure_players(self, players: List[str]):
+        self.updates.flush()
         self.players = list(players)
-        for i in reversed(range(self.overlay_grid.count())):
-            it = self.overlay_grid.takeAt(i)
-            if it.widget():
-                it.widget().deleteLater()
+        self.pool.release_all("playerSlot", self.player_slots)
+        self.player_slots = []
         self.score_labels.clear()
+        self.score_values.clear()
         for c, name in enumerate(players):
-            box = QGroupBox(name)
-            vb = QVBoxLayout(box)
-            sq = SquareWidget()
-            sq.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-            sq.setMaximumSize(QSize(SQUARE_MAX, SQUARE_MAX))  # Begrenzung
-            vb.addWidget(sq)
-            score = QLabel("Punkte: 0", alignment=Qt.AlignCenter)
-            score.setFont(QFont("", 12, QFont.Bold))
-            vb.addWidget(score)
-            self.score_labels[name] = score
-            self.overlay_grid.addWidget(box, 0, c)
+            slot: _PlayerSlot = self.pool.acquire("playerSlot")
+            slot.widget.setTitle(name)
+            self.player_slots.append(slot)
+            self.score_labels[name] = slot.score
+            self.overlay_grid.addWidget(slot.widget, 0, c)
+        self._attach_feeds()
+
+    def _attach_feeds(self):
+        spec = os.environ.get("QUIZ_FEEDS", PLAYER_FEEDS)
+        if self.feeds is not None:
+            self.feeds.clear()
+        if not spec:
+            return
+        from quiz_blindpick_feeds import FeedHub, make_sources
+        if self.feeds is None:
+            self.feeds = FeedHub(SQUARE_MAX, self)
+        for slot, src in zip(self.player_slots, make_sources(spec, self.players, SQUARE_MAX, self.feeds)):
+            self.feeds.attach(src, slot.square)
+
+    def closeEvent(self, e):
+        if self.feeds is not None:
+            self.feeds.clear()
+        super().closeEvent(e)
 
     # Medien
     def set_video(self, path: str):
-        url = QUrl.fromLocalFile(str(Path(path).absolute()))
-        self.player.setSource(url)
+        self.media.show_video(path)
+
+    def preload_videos(self, paths: List[str]):
+        self.media.preload(paths)
 
-    def play(self): self.player.play()
-    def pause(self): self.player.pause()
-    def stop(self): self.player.stop()
+    def set_volume(self, vol: float):
+        self.media.set_volume(vol)
+
+    def play(self): self.media.play()
+    def pause(self): self.media.pause()
+    def stop(self): self.media.stop()
 
     # Antwortenraster
     def _clear_answers_grid(self):
         for i in reversed(range(self.answers_grid.count())):
             it = self.answers_grid.takeAt(i)
-            if it.widget():
-                it.widget().deleteLater()
+            w = it.widget()
+            if w is self.wait_label:
+                w.setParent(None)  # wiederverwendbar, nicht löschen
+            elif w is not None and not (self._page is not None and w is self._page.widget):
+                w.deleteLater()
+        if self._page is not None:
+            self.pool.release("answerPage", self._page)
+            self._page = None
+        self.sel_boxes = {}
+        self.sel_rows = {}
+        self.author_labels = []
+        self.vote_labels = []
+
+    def prepare_grid(self, col_players: List[str], n_rows: int):
+        """Raster für das nächste set_answers_grid im Leerlauf vorbauen (nur Widget-Ansicht)."""
+        key = (tuple(col_players), n_rows)
+        if len(col_players) >= TABLE_VIEW_MIN_PLAYERS or (self._staged is not None and self._staged.key == key):
+            return
+        self._discard_staged()
+        self._staged = _AnswerPage.acquire(self.pool, col_players, n_rows, self.answers_container)
+        self.idle.submit("grid", self._staged.build())
+
+    def _discard_staged(self):
+        if self._staged is not None:
+            self.idle.cancel("grid")
+            self.pool.release("answerPage", self._staged)   # auch halb gebaut; die Zeilen bleiben an der Seite
+            self._staged = None
+
+    def _take_page(self, col_players: List[str], n_rows: int) -> _AnswerPage:
+        page = self._staged
+        if page is not None and page.key == (tuple(col_players), n_rows):
+            self._staged = None
+            self.idle.finish("grid")   # falls der Leerlauf noch nicht fertig war
+            return page
+        self._discard_staged()
+        page = _AnswerPage.acquire(self.pool, col_players, n_rows, self.answers_container)
+        for _ in page.build():
+            pass
+        return page
 
     def set_answers_grid(self, slots: List[Dict], revealed: List[bool], col_players: List[str], selections: Dict[str, Optional[int]]):
+        """Neues Layout (Mischen & Anzeigen): vorbereitetes Raster übernehmen (sonst jetzt bauen) und befüllen.
+        Spätere Änderungen laufen über reveal_answer / update_selection / set_scores."""
+        self.updates.flush()   # offene Diffs gehören noch zum alten Raster
         self._clear_answers_grid()
         self.col_players = list(col_players)
 
-        # Kopfzeile
-        hdr_ans = QLabel("Antworten")
-        hdr_ans.setStyleSheet("font-weight: bold;font-size: 16px;")
-        hdr_ans.setWordWrap(True)
-        hdr_ans.setFixedWidth(1000)
-        hdr_ans.setContentsMargins(20, 0, 0, 0)
-        self.answers_grid.addWidget(hdr_ans, 0, 0)
-        for c, pname in enumerate(self.col_players, start=1):
-            lab = QLabel(pname); lab.setAlignment(Qt.AlignCenter)
-            lab.setStyleSheet("font-weight: bold;font-size: 14px;")
-            self.answers_grid.addWidget(lab, 0, c)
-
-        # Checkboxen-Container
-        self.sel_boxes = {p: [] for p in self.col_players}
-
-        # Zeilen (je Zeile ein gerahmter Container)
-        for r, slot in enumerate(slots, start=1):
-            row_frame = QFrame()
-            row_frame.setObjectName("answerRow")
-            row_frame.setStyleSheet(
-                "#answerRow { border: 1px solid #777; border-radius: 8px; background: rgba(255,255,255,0.03); }"
-            )
-            inner = QGridLayout(row_frame)
-            inner.setContentsMargins(ANSWER_ROW_PADDING, ANSWER_ROW_PADDING, ANSWER_ROW_PADDING, ANSWER_ROW_PADDING)
-            inner.setHorizontalSpacing(COL_SPACING)
-            inner.setVerticalSpacing(0)
-
-            # Linke Zelle: Autor + Text
-            author = slot["author"]
-            text = slot["text"]
-            leftw = QWidget(); lh = QVBoxLayout(leftw); lh.setContentsMargins(0,0,0,0); lh.setSpacing(5)
-            left_top = QLabel(f"Autor: {author if revealed[r-1] else '???'}")
-            left_top.setStyleSheet("color: #CCC;font-size: 14px;")
-            left_body = QLabel(text or "(leer)")
-            left_body.setWordWrap(True)
-            left_body.setStyleSheet("font-size: 20px;")
-            left_body.setFixedWidth(1000)
-            lh.addWidget(left_top)
-            lh.addWidget(left_body)
-            inner.addWidget(leftw, 0, 0)
-
-            # Rechts: Checkbox-Spalten
-            for c, pname in enumerate(self.col_players, start=1):
-                cell = QWidget(); ch = QHBoxLayout(cell)
-                ch.setContentsMargins(CHK_PADDING, 0, CHK_PADDING, 0)
-                ch.setAlignment(Qt.AlignCenter)
-                cb = QCheckBox()
-                cb.setEnabled(False)  # nur Anzeige
-                cell.setStyleSheet("QCheckBox { margin: 0px; }")  # Konsistenter Look
-                self.sel_boxes[pname].append(cb)
-                ch.addWidget(cb, alignment=Qt.AlignCenter)
-                inner.addWidget(cell, 0, c, alignment=Qt.AlignCenter)
-
-            # Den Rahmen über alle Spalten des äußeren Grids legen
-            self.answers_grid.addWidget(row_frame, r, 0, 1, len(self.col_players)+1)
+        if len(self.col_players) >= TABLE_VIEW_MIN_PLAYERS:
+            self.answers_table.answers_model.set_layout(slots, revealed, self.col_players, selections)
+            self.answers_stack.setCurrentWidget(self.answers_table)
+            return
+        self.answers_table.answers_model.clear()
+        self.answers_stack.setCurrentWidget(self.answers_area)
+
+        page = self._take_page(self.col_players, len(slots))
+        for r, slot in enumerate(slots):
+            page.author_labels[r].setText(f"Autor: {slot['author'] if revealed[r] else '???'}")
+            page.body_labels[r].setText(slot["text"] or "(leer)")
+        self.answers_grid.addWidget(page.widget, 0, 0)
+        page.widget.show()
+        self._page = page
+        self.sel_boxes = page.sel_boxes
+        self.sel_rows = {p: None for p in self.col_players}
+        self.author_labels = page.author_labels
+        self.vote_labels = page.vote_labels
 
         # Selektionen nach Neuaufbau wiederherstellen (Persistenz)
         for pname, sel in selections.items():
-            self.update_selection(pname, sel)
+            self._apply_selection(pname, sel)
+        if AUDIENCE_VOTE_COUNTS:
+            for r, n in enumerate(count_votes(len(slots), selections)):
+                self._apply_votes(r, n)
+
+    # Diff-Updates (ändern nur die betroffenen Widgets; angewendet im nächsten Frame, gleicher Schlüssel wird zusammengefasst)
+    def reveal_answer(self, row_index: int, author: str):
+        self.updates.schedule(("reveal", row_index), self._apply_reveal, row_index, author, target=self._diff_area())
 
     def update_selection(self, pname: str, selected_row: Optional[int]):
-        boxes = self.sel_boxes.get(pname)
-        if not boxes:
-            return
-        for i, cb in enumerate(boxes):
-            cb.setChecked(i == selected_row if selected_row is not None else False)
+        self.updates.schedule(("sel", pname), self._apply_selection, pname, selected_row, target=self._diff_area())
+
+    def set_votes(self, row_index: int, n: int):
+        if AUDIENCE_VOTE_COUNTS:
+            self.updates.schedule(("votes", row_index), self._apply_votes, row_index, n, target=self._diff_area())
 
     def set_scores(self, scores: Dict[str, int]):
         for name, val in scores.items():
-            if name in self.score_labels:
-                self.score_labels[name].setText(f"Punkte: {val}")
+            if name in self.score_labels and self.score_values.get(name) != val:
+                self.score_values[name] = val   # Sollwert, sichtbar ab dem nächsten Frame
+                self.updates.schedule(("score", name), self._apply_score, name, target=self.overlay)
+
+    def _diff_area(self) -> QWidget:
+        """Kleinster Bereich, den Auswahl/Aufdecken neu zeichnen (Raster-Seite bzw. Tabellen-Viewport)."""
+        if self._use_table():
+            return self.answers_table.viewport()
+        return self._page.widget if self._page is not None else self.answers_stack
+
+    def _apply_reveal(self, row_index: int, author: str):
+        if self._use_table():
+            self.answers_table.answers_model.reveal(row_index, author)
+            return
+        if 0 <= row_index < len(self.author_labels):
+            self.author_labels[row_index].setText(f"Autor: {author}")
+
+    def _apply_selection(self, pname: str, selected_row: Optional[int]):
+        if self._use_table():
+            self.answers_table.answers_model.set_selection(pname, selected_row)
+            return
+        boxes = self.sel_boxes.get(pname)
+        if not boxes:
+            return
+        prev = self.sel_rows.get(pname)
+        if prev == selected_row:
+            return
+        if prev is not None and 0 <= prev < len(boxes):
+            boxes[prev].setChecked(False)
+        if selected_row is not None and 0 <= selected_row < len(boxes):
+            boxes[selected_row].setChecked(True)
+        self.sel_rows[pname] = selected_row
+
+    def _apply_votes(self, row_index: int, n: int):
+        if self._use_table():
+            self.answers_table.answers_model.set_votes(row_index, n)
+        elif 0 <= row_index < len(self.vote_labels):
+            self.vote_labels[row_index].setText(votes_text(n))
+
+    def _apply_score(self, name: str):
+        if name in self.score_labels:
+            self.score_labels[name].setText(f"Punkte: {self.score_values[name]}")
 
 # ------------------------
 # Moderatorfenster
@@ -335,20 +981,52 @@ class AudienceWindow(QMainWindow):
 class ControlWindow(QMainWindow):
     def __init__(self, on_close, audience: AudienceWindow):
         super().__init__()
+        install_theme()
         self.setWindowTitle("Blind Pick — Moderator")
         self.resize(1280, 960)
 
         self.on_close = on_close
         self.audience = audience
 
-        # Setup-Daten
-        self.players: List[str] = []
-        self.templates: List[RoundTemplate] = []
-        self.scores: Dict[str, int] = {}
-        self.round_index: int = 0
-
-        # Laufzeit je Runde
-        self.runtime: RoundRuntime = RoundRuntime()
+        # Spielzustand (Spieler, Runden, Punkte, Laufzeit je Runde) liegt in der Engine
+        self.engine = BlindPickEngine()
+        self.engine.subscribe(self._on_engine_event)
+        self.loader: Optional[TemplateLoader] = None
+        self.server = None   # AnswerServer, solange der Antwort-Server läuft
+
+        # Sitzungsprotokoll (Fortsetzen nach Absturz); _pending_resume: Zustand wartet auf seine Runde im Template,
+        # _resume_rounds: Rundenliste, die beim Fortsetzen vom eigenen Loader befüllt wird
+        self.recorder = None
+        self._pending_resume = None
+        self._resume_rounds: Optional[LazyRounds] = None
+        if SESSION_LOG:
+            from quiz_blindpick_session import SessionRecorder
+            self.recorder = SessionRecorder(self.engine)
+
+        # Vorbereitung der nächsten Runde im Leerlauf
+        self.idle = IdleQueue(self)
+        self._pick_page: Optional[_PickPage] = None     # angezeigtes Auswahlraster (geht beim nächsten Aufbau an den Pool)
+        self._staged_pick: Optional[_PickPage] = None
+        self._answer_players: List[str] = []   # Spieler, für die die Antwortfelder gebaut sind
+        # reveal_row erst beim Klick nachschlagen (wird ggf. von der Latenz-Messung umhüllt)
+        self._reveal_cb = lambda i: self.reveal_row(i)
+        # Stimmenzahlen einmal pro Frame nachziehen (bei vielen Stimmen nicht zwei Zellen je Stimme neu melden)
+        self.vote_updates = FrameBatcher(self)
+
+        # Wiederverwendbare Widgets (Auswahlraster, Antwortfelder)
+        self.pool = WidgetPool(self)
+        _PickPage.register(self.pool, self._on_group_clicked_factory, self._reveal_cb)
+        self.pool.register("inputLabel", QLabel)
+        self.pool.register("answerEdit", QLineEdit, QLineEdit.clear)
+
+        # Latenz-Messung (opt-in): Slots umhüllen, bevor sie mit Signalen verbunden werden
+        self.latency = None
+        if LATENCY_OVERLAY or os.environ.get("QUIZ_LATENCY"):
+            from quiz_blindpick_latency import LatencyMonitor
+            self.latency = LatencyMonitor(self)
+            for name in ("shuffle_and_show", "reveal_row", "refresh_round", "prev_round", "next_round"):
+                setattr(self, name, self.latency.wrap(name, getattr(self, name)))
+            self._on_table_selection = self.latency.wrap("Auswahl-Klick", self._on_table_selection)
 
         # UI
         central = QWidget(); self.setCentralWidget(central)
@@ -360,7 +1038,16 @@ class ControlWindow(QMainWindow):
         self.btn_prev = QPushButton("← Runde")
         self.btn_next = QPushButton("Runde →")
         self.lbl_round = QLabel("Runde: –")
+        self.lbl_loading = QLabel("")
+        self.btn_server = QPushButton("Antwort-Server")
+        self.btn_server.setCheckable(True)
+        self.btn_server.setToolTip("Spieler schicken Antworten und Stimmen vom eigenen Gerät (Browser im selben Netz)")
+        self.lbl_server = QLabel("")
+        self.lbl_server.setTextInteractionFlags(Qt.TextSelectableByMouse)
         top.addWidget(self.btn_setup)
+        top.addWidget(self.lbl_loading)
+        top.addStretch(1)
+        top.addWidget(self.btn_server); top.addWidget(self.lbl_server)
         top.addStretch(1)
         top.addWidget(self.btn_prev); top.addWidget(self.btn_next); top.addWidget(self.lbl_round)
         root.addLayout(top)
@@ -386,7 +1073,13 @@ class ControlWindow(QMainWindow):
         # Antwort-Eingaben
         self.answers_group = QGroupBox("Antworten eingeben (für aktuelle Runde)")
         agl = QGridLayout(self.answers_group)
+        self.lbl_answer_round = QLabel("Aktuelle Runde: ")
+        self.lbl_truth_title = QLabel("Richtige Antwort (aus Template):")
+        self.lbl_truth = QLabel()
+        self.lbl_truth.setObjectName("truthLabel")
+        agl.addWidget(self.lbl_answer_round, 0, 0, 1, 2)
         self.answer_edits: Dict[str, QLineEdit] = {}
+        self._input_labels: List[QLabel] = []   # "Name:" vor jedem Antwortfeld
         root.addWidget(self.answers_group)
 
         # Mischen & Anzeigen
@@ -398,10 +1091,22 @@ class ControlWindow(QMainWindow):
 
         # Checkbox-Raster + per-Zeile-Aufdecken
         self.chk_group = QGroupBox("Auswahl je Spieler (Autor + Antwort links, Spalten rotiert)")
-        self.chk_grid = QGridLayout(self.chk_group)
+        self.chk_widget = QWidget()
+        self.chk_grid = QGridLayout(self.chk_widget)
+        self.chk_grid.setContentsMargins(0, 0, 0, 0)
         self.chk_grid.setHorizontalSpacing(5)
         self.chk_grid.setVerticalSpacing(5)
-        root.addWidget(self.chk_group)
+        self.chk_hint = QLabel("Bitte 'Mischen & anzeigen' nutzen.", self.chk_widget)
+        self.chk_hint.hide()
+        # Große Runden: modellbasiertes Raster, einmal pro Sitzung erzeugt und nur neu befüllt
+        self.sel_table = SelectionGridView(BTN_COLOR_SHOW, BTN_COLOR_DONE)
+        self.sel_table.grid_model.selection_changed.connect(self._on_table_selection)
+        self.sel_table.grid_model.reveal_requested.connect(self.reveal_row)
+        self.chk_stack = QStackedWidget()
+        self.chk_stack.addWidget(self.chk_widget)
+        self.chk_stack.addWidget(self.sel_table)
+        QVBoxLayout(self.chk_group).addWidget(self.chk_stack)
+        root.addWidget(self.chk_group, 1)
 
         # Signale
         self.btn_setup.clicked.connect(self.run_setup)
@@ -411,6 +1116,7 @@ class ControlWindow(QMainWindow):
         self.btn_pause.clicked.connect(self.audience.pause)
         self.btn_stop.clicked.connect(self.audience.stop)
         self.btn_shuffle.clicked.connect(self.shuffle_and_show)
+        self.btn_server.toggled.connect(self.toggle_server)
         self.vol_slider.valueChanged.connect(self.on_volume_changed)
 
         # ButtonGroups pro Spieler
@@ -421,7 +1127,72 @@ class ControlWindow(QMainWindow):
         # initiale Lautstärke setzen
         self.on_volume_changed(self.vol_slider.value())
 
+        if self.latency is not None:
+            from quiz_blindpick_latency import LatencyPanel
+            dock = QDockWidget("Latenz (ms)", self)
+            dock.setObjectName("latencyDock")
+            dock.setWidget(LatencyPanel(self.latency))
+            self.addDockWidget(Qt.RightDockWidgetArea, dock)
+
         self.audience.set_global_preparing(True)
+        if self.recorder is not None:
+            QTimer.singleShot(0, self._check_resume)
+
+    # ----- Engine-Zustand (nur lesend; Änderungen über self.engine) -----
+
+    @property
+    def players(self) -> List[str]:
+        return self.engine.players
+
+    @property
+    def templates(self):
+        return self.engine.templates
+
+    @property
+    def round_index(self) -> int:
+        return self.engine.round_index
+
+    @property
+    def runtime(self) -> RoundRuntime:
+        return self.engine.runtime
+
+    @property
+    def scores(self) -> Dict[str, int]:
+        return self.engine.scores_dict()
+
+    def _on_engine_event(self, event: str, *args):
+        # Engine -> Moderator-UI + Zuschauerfenster
+        if event == "setup":
+            self.audience.configure_players(self.players)
+            self.audience.set_global_preparing(False)
+        elif event == "round":
+            self.refresh_round()
+            self._stage_next(self.round_index)
+        elif event == "shuffle":
+            self._rebuild_checkboxes(self.runtime.shuffled_order)
+            self.audience.set_answers_grid(self.engine.view_slots(), list(self.runtime.revealed),
+                                           self.col_players, self.engine.selections_dict())
+            self.audience.set_scores(self.scores)
+            self._stage_next(self.round_index + 1)
+        elif event == "select":
+            pname, row_index = args
+            self._show_selection(pname, row_index)
+            self.audience.update_selection(pname, row_index)
+        elif event == "votes":
+            (changed,) = args
+            for row_index, n in changed.items():
+                self._show_votes(row_index, n)
+                self.audience.set_votes(row_index, n)
+        elif event == "reveal":
+            row_index, author, _gained = args
+            # Zuschauer: nur die betroffene Zeile und die Punkte aktualisieren (kein Neuaufbau)
+            self.audience.reveal_answer(row_index, author)
+            self.audience.set_scores(self.scores)
+            # Button "Aufgedeckt" markieren
+            if self._use_table():
+                self.sel_table.grid_model.set_revealed(row_index)
+            elif 0 <= row_index < len(self.reveal_buttons):
+                self._mark_revealed_button(self.reveal_buttons[row_index])
 
     # ----- Volume -----
 
@@ -429,9 +1200,11 @@ class ControlWindow(QMainWindow):
         # QAudioOutput erwartet 0.0–1.0; UI liefert 0–100
         vol = max(0.0, min(1.0, value / 100.0))
         try:
-            self.audience.audio.setVolume(vol)
+            self.audience.set_volume(vol)
         except Exception:
             pass
+        if self.recorder is not None:
+            self.recorder.set_volume(vol)
         self.vol_label.setText(f"{value}%")
 
     # ----- Setup / Navigation -----
@@ -440,41 +1213,190 @@ class ControlWindow(QMainWindow):
         dlg = SetupDialog(self)
         if dlg.exec() != QDialog.Accepted:
             return
-        self.players = dlg.players
-        self.templates = dlg.template
-        self.scores = {p: 0 for p in self.players}
-        self.round_index = 0
-        self.audience.configure_players(self.players)
-        self.audience.set_global_preparing(False)
+        if self.loader is not None and self.loader is not dlg.loader:
+            self.loader.cancel()
+        self.loader = dlg.loader
+        self._pending_resume = None
+        self._resume_rounds = None
+        n = len(dlg.template)
+        self.lbl_loading.setText(f"({n} Runden)")
+        if self.loader is not None and self.loader.isRunning():
+            self.lbl_loading.setText(f"({n} Runden, lädt …)")
+            self.loader.batch.connect(self._on_templates_batch)
+            self.loader.finished_ok.connect(self._on_templates_loaded)
+            self.loader.failed.connect(self._on_templates_failed)
+        # Template wächst weiter, solange der Loader läuft; setup() meldet "setup" + "round"
+        if self.recorder is not None:
+            self.recorder.template_path = dlg.loaded_path
+        self.engine.setup(dlg.players, dlg.template)
+        self._report_recorder_error()
         # nach Setup sicherstellen, dass Lautstärke gesetzt ist
         self.on_volume_changed(self.vol_slider.value())
-        self.refresh_round()
+
+    def _on_templates_batch(self, raw: List[tuple]):
+        if self.sender() is not self.loader:
+            return
+        if self._resume_rounds is not None:
+            self._resume_rounds.extend_raw(raw)
+            if self._pending_resume is not None:
+                self._try_resume()
+                return
+        self.lbl_loading.setText(f"({len(self.templates)} Runden, lädt …)")
+        # Nächste Runde ist gerade erst eingetroffen -> jetzt vorladen
+        if len(self.templates) - len(raw) <= self.round_index + 1 < len(self.templates):
+            self._preload_neighbours()
+
+    def _on_templates_loaded(self, count: int, warnings: List[str]):
+        if self.sender() is self.loader:
+            self._try_resume(force=True)
+            self.lbl_loading.setText(f"({count} Runden)")
+
+    def _on_templates_failed(self, msg: str):
+        if self.sender() is self.loader:
+            self._try_resume(force=True)
+            self.lbl_loading.setText(f"({len(self.templates)} Runden, Ladefehler)")
+            QMessageBox.warning(self, "Template", f"Template nur teilweise geladen:\n{msg}")
 
     def prev_round(self):
         if not self.templates:
             QMessageBox.information(self, "Hinweis", "Bitte zuerst Setup ausführen.")
             return
-        if self.round_index > 0:
-            self.round_index -= 1
-            self.refresh_round()
+        self.engine.prev_round()
 
     def next_round(self):
         if not self.templates:
             QMessageBox.information(self, "Hinweis", "Bitte zuerst Setup ausführen.")
             return
-        if self.round_index < len(self.templates) - 1:
-            self.round_index += 1
-            self.refresh_round()
+        self.engine.next_round()
 
     def closeEvent(self, e):
+        if self.loader is not None:
+            self.loader.cancel()
+            self.loader.wait()
+        if self.server is not None:
+            self.server.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.latency is not None:
+            self.latency.stop()
+            try:
+                self.latency.export()
+            except OSError:
+                pass  # Trace ist nur Diagnose; Schließen nicht blockieren
         if self.on_close:
             self.on_close()
         super().closeEvent(e)
 
+    # ----- Sitzung fortsetzen (nach Absturz) -----
+
+    def _check_resume(self):
+        from quiz_blindpick_session import session_log, read_session, clear_session
+        from quiz_blindpick_journal import file_key
+        path = session_log()
+        if not path or self.players:
+            return
+        try:
+            header, state, replayed = read_session(path)
+        except (OSError, ValueError):
+            clear_session(path)
+            return
+        if state.get("ended"):
+            clear_session(path)
+            return
+        tpath = header.get("template") or ""
+        changed = "" if file_key(tpath) == header.get("key") else \
+            "\n\nAchtung: Das Template wurde seitdem verändert — Runden/Antworten können abweichen."
+        ret = QMessageBox.question(
+            self, "Sitzung fortsetzen",
+            f"Nicht beendete Show gefunden ({header.get('started', '?')}):\n"
+            f"{len(header.get('players', []))} Spieler, Runde {state['round'] + 1}, "
+            f"{sum(state['revealed'])} Zeile(n) aufgedeckt, Punkte: {sum(state['scores'])}\n"
+            f"Template: {tpath}{changed}\n\nFortsetzen?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+        )
+        if ret != QMessageBox.Yes:
+            clear_session(path)
+            return
+        if not os.path.exists(tpath):
+            QMessageBox.critical(self, "Fehler", f"Template nicht gefunden:\n{tpath}")
+            return
+        # Template wie im Setup streamen; Zustand wird übernommen, sobald die aktuelle Runde geladen ist
+        self._pending_resume = (path, header, state)
+        self._resume_rounds = LazyRounds(RoundTemplate)
+        self.loader = TemplateLoader(tpath, normalize_round, self)
+        self.loader.batch.connect(self._on_templates_batch)
+        self.loader.finished_ok.connect(self._on_templates_loaded)
+        self.loader.failed.connect(self._on_templates_failed)
+        self.lbl_loading.setText("(Sitzung wird fortgesetzt …)")
+        self.loader.start()
+
+    def _try_resume(self, force: bool = False):
+        if self._pending_resume is None:
+            return
+        path, header, state = self._pending_resume
+        templates = self._resume_rounds
+        if not force and len(templates) <= state["round"]:
+            return
+        self._pending_resume = None
+        try:
+            self.recorder.resume(path, header, templates, state)
+        except (KeyError, TypeError, ValueError) as e:
+            QMessageBox.critical(self, "Fehler", f"Sitzung nicht fortsetzbar:\n{e}")
+            return
+        for pname, text in zip(self.players, self.runtime.players_answers):
+            if pname in self.answer_edits:
+                self.answer_edits[pname].setText(text)
+        self.lbl_loading.setText(f"({len(templates)} Runden, lädt …)")
+        if state.get("volume") is not None:
+            self.vol_slider.setValue(round(state["volume"] * 100))
+        self.on_volume_changed(self.vol_slider.value())
+        self._report_recorder_error()
+
+    def _report_recorder_error(self):
+        if self.recorder is not None and self.recorder.error:
+            self.statusBar().showMessage(f"Sitzungsprotokoll nicht schreibbar: {self.recorder.error}", 8000)
+
+    # ----- Antwort-Server -----
+
+    def toggle_server(self, on: bool):
+        if not on:
+            if self.server is not None:
+                self.server.stop()
+                self.server.deleteLater()
+                self.server = None
+            self.lbl_server.setText("")
+            return
+        from quiz_blindpick_server import AnswerServer, local_url
+        server = AnswerServer(self.engine, parent=self)
+        try:
+            server.start()
+        except OSError as e:
+            server.stop()
+            server.deleteLater()
+            self.btn_server.setChecked(False)
+            QMessageBox.warning(self, "Antwort-Server", f"Server konnte nicht starten:\n{e}")
+            return
+        server.batch.connect(self._apply_server_batch)
+        self.server = server
+        self.server_url = local_url(server.port)
+        self.lbl_server.setText(self.server_url)
+
+    def _apply_server_batch(self, answers: Dict[str, str], votes: Dict[str, int]):
+        # gebündelt: Antworten landen in den Eingabefeldern (Moderator kann korrigieren), Stimmen direkt in der Engine
+        for pname, text in answers.items():
+            edit = self.answer_edits.get(pname)
+            if edit is not None:
+                edit.setText(text)
+        for pname, row in votes.items():
+            self.engine.select(pname, row)
+        if self.server is not None:
+            self.lbl_server.setText(f"{self.server_url}  ({self.server.hub.accepted} Eingaben)")
+
     # ----- Rundensicht -----
 
     def refresh_round(self):
-        templ = self.templates[self.round_index] if self.templates else None
+        # Laufzeit wurde von der Engine bereits zurückgesetzt (goto_round/setup)
+        templ = self.engine.template
         if not templ:
             self.lbl_round.setText("Runde: –")
             self._rebuild_answer_inputs()
@@ -484,39 +1406,85 @@ class ControlWindow(QMainWindow):
 
         self.lbl_round.setText(f"Runde: {templ.title}")
         self.audience.set_video(templ.video)
+        self._preload_neighbours()
         self._rebuild_answer_inputs()
-
-        self.runtime = RoundRuntime(
-            players_answers=["" for _ in self.players],
-            shuffled_order=[],
-            revealed=[],
-            selections={p: None for p in self.players},
-        )
-
         self._rebuild_checkboxes([])
         self.audience.show_waiting_center()
         self.audience.set_scores(self.scores)
 
+    def _preload_neighbours(self):
+        # Nächste und vorige Runde im Hintergrund vorladen (Umschalten ohne schwarzen Frame)
+        paths = []
+        for i in (self.round_index + 1, self.round_index - 1):
+            if 0 <= i < len(self.templates):
+                paths.append(self.templates[i].video)
+        self.audience.preload_videos(paths)
+
     def _rebuild_answer_inputs(self):
         layout: QGridLayout = self.answers_group.layout()
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        templ_title = self.templates[self.round_index].title if self.templates else ""
+        truth = self.templates[self.round_index].truth if self.templates else ""
+        self.lbl_answer_round.setText(f"Aktuelle Runde: {templ_title}")
+        self.lbl_truth.setText(truth)
+        if self.players and self._answer_players == self.players:
+            # gleiche Spieler: Felder behalten, nur leeren
+            for e in self.answer_edits.values():
+                e.clear()
+            return
+        # andere Spieler: Namen + Felder gehen an den Pool und werden für die neue Besetzung wieder geholt
+        self.pool.release_all("inputLabel", self._input_labels)
+        self.pool.release_all("answerEdit", self.answer_edits.values())
+        self._input_labels = []
         self.answer_edits.clear()
+        self._answer_players = list(self.players)
 
-        templ_title = self.templates[self.round_index].title if self.templates else ""
-        layout.addWidget(QLabel(f"Aktuelle Runde: {templ_title}"), 0, 0, 1, 2)
         for i, p in enumerate(self.players, start=1):
-            layout.addWidget(QLabel(f"{p}:"), i, 0)
-            e = QLineEdit()
+            lab: QLabel = self.pool.acquire("inputLabel")
+            lab.setText(f"{p}:")
+            self._input_labels.append(lab)
+            layout.addWidget(lab, i, 0)
+            e: QLineEdit = self.pool.acquire("answerEdit")
             e.setPlaceholderText(f"Antwort von {p}")
             self.answer_edits[p] = e
             layout.addWidget(e, i, 1)
-        layout.addWidget(QLabel("Richtige Antwort (aus Template):"), len(self.players)+1, 0)
-        truth_lab = QLabel(self.templates[self.round_index].truth if self.templates else "")
-        truth_lab.setStyleSheet("font-style: italic;")
-        layout.addWidget(truth_lab, len(self.players)+1, 1)
+        layout.removeWidget(self.lbl_truth_title)
+        layout.removeWidget(self.lbl_truth)
+        layout.addWidget(self.lbl_truth_title, len(self.players)+1, 0)
+        layout.addWidget(self.lbl_truth, len(self.players)+1, 1)
+
+    def _stage_next(self, round_index: int):
+        """Raster für das nächste Mischen (Runde `round_index`) im Leerlauf vorbauen — Moderator + Zuschauer —
+        und die Mischung vorab ziehen."""
+        if not (0 <= round_index < len(self.templates)) or not self.players:
+            return
+        self.engine.plan_shuffle()
+        n = len(self.players)
+        if n >= TABLE_VIEW_MIN_PLAYERS:
+            return  # Tabellenansicht: Modelle werden ohnehin nur neu befüllt
+        cols = self.engine.rotated_players(round_index)
+        if self._staged_pick is None or self._staged_pick.key != (tuple(cols), n + 1):
+            self._discard_staged_pick()
+            self._staged_pick = _PickPage.acquire(self.pool, cols, n + 1, self.chk_widget)
+            self.idle.submit("pick", self._staged_pick.build())
+        self.audience.prepare_grid(cols, n + 1)
+
+    def _discard_staged_pick(self):
+        if self._staged_pick is not None:
+            self.idle.cancel("pick")
+            self.pool.release("pickPage", self._staged_pick)
+            self._staged_pick = None
+
+    def _take_pick_page(self, cols: List[str], n_rows: int) -> _PickPage:
+        page = self._staged_pick
+        if page is not None and page.key == (tuple(cols), n_rows):
+            self._staged_pick = None
+            self.idle.finish("pick")
+            return page
+        self._discard_staged_pick()
+        page = _PickPage.acquire(self.pool, cols, n_rows, self.chk_widget)
+        for _ in page.build():
+            pass
+        return page
 
     # ----- Mischen & Anzeigen / Auswahl / Aufdecken -----
 
@@ -524,86 +1492,55 @@ class ControlWindow(QMainWindow):
         if not self.templates:
             QMessageBox.information(self, "Hinweis", "Bitte zuerst Setup ausführen.")
             return
-        templ = self.templates[self.round_index]
-        players_ans = [self.answer_edits[p].text() for p in self.players]
-        slots = [{"author": p, "text": players_ans[i]} for i, p in enumerate(self.players)]
-        slots.append({"author": "Richtige Antwort", "text": templ.truth})
+        # Engine mischt und meldet "shuffle" -> Raster + Zuschauer werden in _on_engine_event aufgebaut
+        self.engine.shuffle([self.answer_edits[p].text() for p in self.players])
 
-        order = list(range(len(slots)))
-        random.shuffle(order)
-        revealed = [False] * len(order)
-        self.runtime.players_answers = players_ans
-        self.runtime.shuffled_order = order
-        self.runtime.revealed = revealed
-        self.runtime.selections = {p: None for p in self.players}
-
-        self.col_players = self._rotated_players()
-        self._rebuild_checkboxes(order)
-
-        view_slots = [slots[i] for i in order]
-        self.audience.set_answers_grid(view_slots, revealed, self.col_players, self.runtime.selections)
-        self.audience.set_scores(self.scores)
-
-    def _rotated_players(self) -> List[str]:
-        dq = deque(self.players)
-        dq.rotate(self.round_index % (len(self.players) if self.players else 1))
-        return list(dq)
+    def _use_table(self) -> bool:
+        return self.chk_stack.currentWidget() is self.sel_table
 
     def _rebuild_checkboxes(self, order: List[int]):
+        self.vote_updates.flush()   # offene Stimmenzahlen gehören noch zum alten Raster
         for i in reversed(range(self.chk_grid.count())):
-            item = self.chk_grid.takeAt(i)
-            if item.widget():
-                item.widget().deleteLater()
+            self.chk_grid.takeAt(i)
+        self.chk_hint.hide()
+        if self._pick_page is not None:
+            self.pool.release("pickPage", self._pick_page)   # samt ButtonGroups
+            self._pick_page = None
         self.groups = {}
         self.reveal_buttons = []
+        self.sel_table.grid_model.clear()
+        self.chk_stack.setCurrentWidget(self.chk_widget)
 
         if not order:
-            self.chk_grid.addWidget(QLabel("Bitte 'Mischen & anzeigen' nutzen."), 0, 0)
-            return
-
-        templ = self.templates[self.round_index]
-        base_slots = [{"author": p, "text": self.runtime.players_answers[i]} for i, p in enumerate(self.players)]
-        base_slots.append({"author": "Richtige Antwort", "text": templ.truth})
-        slots = [base_slots[i] for i in order]
-
-        # Kopfzeile
-        self.chk_grid.addWidget(QLabel("Autor / Antwort"), 0, 0)
-        self.col_players = self._rotated_players()
-        for c, pname in enumerate(self.col_players, start=1):
-            lab = QLabel(pname); lab.setAlignment(Qt.AlignCenter)
-            self.chk_grid.addWidget(lab, 0, c)
-        self.chk_grid.addWidget(QLabel("Status"), 0, len(self.col_players)+1)
-
-        # ButtonGroups
-        for pname in self.col_players:
-            grp = QButtonGroup(self)
-            grp.setExclusive(True)
-            grp.idClicked.connect(self._on_group_clicked_factory(pname))
-            self.groups[pname] = grp
-
-        # Zeilen
-        for r, slot in enumerate(slots, start=1):
-            # Autor + Antwort (Moderator sieht Autor)
-            text = slot['text'] or "(leer)"
-            author = slot['author']
-            info = QLabel(f"{author} — {text[:100]}")
-            self.chk_grid.addWidget(info, r, 0)
+            self.chk_grid.addWidget(self.chk_hint, 0, 0)
+            self.chk_hint.show()
+            return
 
-            # Auswahlspalten
-            for c, pname in enumerate(self.col_players, start=1):
-                cb = QCheckBox()
-                cb.setStyleSheet(f"QCheckBox {{ margin: {CHK_PADDING}px; }}")
-                self.groups[pname].addButton(cb, r-1)
-                self.chk_grid.addWidget(cb, r, c, alignment=Qt.AlignCenter)
-                if self.runtime.selections.get(pname) == (r-1):
-                    cb.setChecked(True)
-
-            # Aufdecken-Button
-            btn = QPushButton("Aufdecken")
-            style_button(btn, BTN_COLOR_SHOW)
-            btn.clicked.connect(lambda _, i=r-1: self.reveal_row(i))
-            self.reveal_buttons.append(btn)
-            self.chk_grid.addWidget(btn, r, len(self.col_players)+1)
+        slots = self.engine.view_slots()
+        selections = self.engine.selections_dict()
+        self.col_players = self.engine.rotated_players()
+
+        if len(self.players) >= TABLE_VIEW_MIN_PLAYERS:
+            self.sel_table.grid_model.set_layout(slots, self.runtime.revealed, self.col_players, selections)
+            self.chk_stack.setCurrentWidget(self.sel_table)
+            return
+
+        # Vorbereitete Seite übernehmen (sonst jetzt bauen) und nur noch befüllen
+        page = self._take_pick_page(self.col_players, len(slots))
+        for r, slot in enumerate(slots):
+            text = slot['text'] or "(leer)"
+            page.info_labels[r].setText(f"{slot['author']} — {text[:100]}")
+        for pname, sel in selections.items():
+            btn = page.groups[pname].button(sel) if sel is not None else None
+            if btn is not None:
+                btn.setChecked(True)
+        self.groups = page.groups
+        self.reveal_buttons = page.reveal_buttons
+        for lab, n in zip(page.vote_labels, self.engine.tallies()):
+            lab.setText(str(n))
+        self.chk_grid.addWidget(page.widget, 0, 0)
+        page.widget.show()
+        self._pick_page = page
 
         # Bereits aufgedeckte Zeilen einfärben
         for idx, done in enumerate(self.runtime.revealed):
@@ -612,51 +1549,43 @@ class ControlWindow(QMainWindow):
 
     def _mark_revealed_button(self, btn: QPushButton):
         btn.setText("Aufgedeckt")
-        style_button(btn, BTN_COLOR_DONE)
+        set_reveal_state(btn, "done")
         btn.setEnabled(False)
 
+    def _on_table_selection(self, pname: str, row_index: int):
+        self.engine.select(pname, row_index)
+
     def _on_group_clicked_factory(self, pname: str):
         def handler(row_index: int):
-            self.runtime.selections[pname] = row_index
-            self.audience.update_selection(pname, row_index)
-        return handler
+            self.engine.select(pname, row_index)
+        return self.latency.wrap("Auswahl-Klick", handler) if self.latency is not None else handler
 
-    def reveal_row(self, row_index: int):
-        if not self.runtime.shuffled_order:
-            QMessageBox.information(self, "Hinweis", "Bitte zuerst 'Mischen & anzeigen' nutzen.")
-            return
-        if not (0 <= row_index < len(self.runtime.revealed)):
-            return
-        if self.runtime.revealed[row_index]:
+    def _show_selection(self, pname: str, row_index: int):
+        # Moderator-Raster nachziehen (bei Klicks im Raster bereits gesetzt -> kein Effekt)
+        if self._use_table():
+            self.sel_table.grid_model.set_selection(pname, row_index)
             return
+        grp = self.groups.get(pname)
+        btn = grp.button(row_index) if grp is not None else None
+        if btn is not None and not btn.isChecked():
+            btn.setChecked(True)
 
-        templ = self.templates[self.round_index]
-        base_slots = [{"author": p, "text": self.runtime.players_answers[i]} for i, p in enumerate(self.players)]
-        base_slots.append({"author": "Richtige Antwort", "text": templ.truth})
-        abs_idx = self.runtime.shuffled_order[row_index]
-        slot = base_slots[abs_idx]
+    def _show_votes(self, row_index: int, n: int):
+        target = self.sel_table.viewport() if self._use_table() else self.chk_widget
+        self.vote_updates.schedule(("votes", row_index), self._apply_votes, row_index, n, target=target)
 
-        # Punkte
-        if slot["author"] == "Richtige Antwort":
-            for p, grp in self.groups.items():
-                if grp.checkedId() == row_index:
-                    self.scores[p] = self.scores.get(p, 0) + 1
-        else:
-            author = slot["author"]
-            for p, grp in self.groups.items():
-                if grp.checkedId() == row_index and p != author:
-                    self.scores[author] = self.scores.get(author, 0) + 1
-
-        self.runtime.revealed[row_index] = True
-
-        # Zuschauer-Grid neu aufbauen (Autor sichtbar machen) und Selektionen persistieren
-        view_slots = [base_slots[i] for i in self.runtime.shuffled_order]
-        self.audience.set_answers_grid(view_slots, self.runtime.revealed, self.col_players, self.runtime.selections)
-        self.audience.set_scores(self.scores)
+    def _apply_votes(self, row_index: int, n: int):
+        if self._use_table():
+            self.sel_table.grid_model.set_votes(row_index, n)
+        elif self._pick_page is not None and 0 <= row_index < len(self._pick_page.vote_labels):
+            self._pick_page.vote_labels[row_index].setText(str(n))
 
-        # Button "Aufgedeckt" markieren
-        if 0 <= row_index < len(self.reveal_buttons):
-            self._mark_revealed_button(self.reveal_buttons[row_index])
+    def reveal_row(self, row_index: int):
+        if not self.runtime.shuffled:
+            QMessageBox.information(self, "Hinweis", "Bitte zuerst 'Mischen & anzeigen' nutzen.")
+            return
+        # Punktevergabe in der Engine; Anzeige folgt über das "reveal"-Ereignis
+        self.engine.reveal(row_index)
 
 # ------------------------
 # Wrapper (rückwärtskompatible Signatur)
@@ -668,7 +1597,12 @@ class BlindPickQuiz(QWidget):
         self.setWindowTitle("Blind Pick — Wrapper")
         self.on_close = on_close
 
-        self.audience = AudienceWindow()
+        displays = int(os.environ.get("QUIZ_AUDIENCE_PROCESSES", AUDIENCE_PROCESSES) or 0)
+        if displays > 0:
+            from quiz_blindpick_remote import RemoteAudience
+            self.audience = RemoteAudience(displays, parent=self)
+        else:
+            self.audience = AudienceWindow()
         self.ctrl = ControlWindow(on_close=self.close_both, audience=self.audience)
 
         self.audience.show()
@@ -0,0 +1,302 @@
+# quiz_blindpick_bench.py
+# Benchmark der GUI-Hotpaths (offscreen, ohne sichtbare Fenster)
+# - Zuschauer: AudienceWindow.set_answers_grid, Stimmen-Schwall (alle Spieler stimmen BENCH_BURST-mal, dann ein Frame)
+#   | Moderator: _rebuild_checkboxes, shuffle_and_show, reveal_row (je Spielerzahl)
+# - Zuschauer-Diffs laufen sonst gesammelt zum nächsten Frame; hier wird jeweils sofort geflusht und mitgemessen
+# - Editor: BlindPickEditor._rebuild_list (je Rundenzahl)
+# - Ohne Sitzungsprotokoll (SESSION_LOG aus): keine Einträge in der Liga-Statistik, keine Fortsetzen-Rückfrage
+# - Gemessen je Operation: Wall-Time, Nachlaufzeit (deleteLater & Co.), Peak-RSS, lebende QObjects vorher/nachher,
+#   Füllstand der WidgetPools von Moderator- und Zuschauerfenster ("pools"), Zähler der Frame-Updates ("audience_updates")
+# - Ergebnis als JSON (bench-results/…), Vergleich mit einem früheren Lauf: --compare alt.json (Exit-Code 1 bei Regression)
+# Start: python quiz_blindpick_bench.py [--quick] [--players 2,8,32] [--rounds 10,1000] [--repeat 5] [--compare alt.json]
+
+from __future__ import annotations
+
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # vor dem ersten Qt-Import
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from PySide6 import __version__ as PYSIDE_VERSION
+from PySide6.QtCore import QCoreApplication, QEvent, QObject
+from PySide6.QtWidgets import QApplication
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+BENCH_PLAYERS = (2, 4, 8, 12, 16, 32, 64, 100, 200)   # Spielerzahlen für Zuschauer/Moderator — hier anpassen
+BENCH_ROUNDS = (10, 100, 1_000, 10_000, 100_000)       # Rundenzahlen für die Editor-Liste — hier anpassen
+BENCH_QUICK_PLAYERS = (2, 8, 32)                       # --quick — hier anpassen
+BENCH_QUICK_ROUNDS = (10, 1_000)                       # --quick — hier anpassen
+BENCH_REPEAT = 5                                       # Wiederholungen je Messpunkt — hier anpassen
+BENCH_BURST = 10                                       # Stimmen je Spieler im Stimmen-Schwall — hier anpassen
+BENCH_OUT_DIR = "bench-results"                        # Zielordner für JSON-Ergebnisse — hier anpassen
+BENCH_REGRESSION = 1.25                                # Median langsamer als Faktor -> Regression — hier anpassen
+BENCH_MIN_MS = 0.5                                     # kleinere Mediane nicht vergleichen (Messrauschen) — hier anpassen
+# =========================
+
+RESULT_VERSION = 1
+OPS_PLAYERS = ("audience.set_answers_grid", "audience.vote_burst", "control._rebuild_checkboxes", "control.shuffle_and_show",
+               "control.reveal_row")
+OPS_ROUNDS = ("editor._rebuild_list",)
+
+# ------------------------
+# Messgrößen
+# ------------------------
+
+def peak_rss_kb() -> Optional[int]:
+    """Höchststand des Speicherbedarfs des Prozesses (KiB); None, wenn nicht ermittelbar (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS: Bytes, Linux: KiB
+
+
+def live_qobjects() -> int:
+    """Lebende QObjects unterhalb der Anwendung und aller Top-Level-Fenster."""
+    app = QApplication.instance()
+    n = 1 + len(app.findChildren(QObject))
+    for w in app.topLevelWidgets():
+        n += 1 + len(w.findChildren(QObject))
+    return n
+
+
+def _flush():
+    # ausstehende deleteLater/Layout-Events abarbeiten, ohne Timer laufen zu lassen (keine Dialoge)
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+    QCoreApplication.sendPostedEvents()
+
+
+def _stats(values: List[float]) -> Dict[str, float]:
+    ms = [v * 1000.0 for v in values]
+    return {"min": round(min(ms), 4), "median": round(statistics.median(ms), 4),
+            "mean": round(statistics.fmean(ms), 4), "max": round(max(ms), 4), "n": len(ms)}
+
+
+def measure(op: str, param: str, value: int, run: Callable[[], Optional[List[float]]],
+            repeat: int, prepare: Optional[Callable[[], None]] = None) -> Dict:
+    """Führt `run` `repeat`-mal aus. `run` misst selbst und liefert Einzelzeiten (s) oder None
+    (dann zählt die Gesamtdauer des Aufrufs)."""
+    times: List[float] = []
+    flush_times: List[float] = []
+    _flush()
+    gc.collect()
+    objs_before = live_qobjects()
+    peak_before = peak_rss_kb()
+    for _ in range(repeat):
+        if prepare is not None:
+            prepare()
+            _flush()
+        gc.collect()
+        t0 = time.perf_counter()
+        inner = run()
+        t1 = time.perf_counter()
+        _flush()
+        flush_times.append(time.perf_counter() - t1)
+        times.extend(inner if inner is not None else [t1 - t0])
+    peak_after = peak_rss_kb()
+    return {
+        "op": op, "param": param, "value": value, "repeat": repeat,
+        "wall_ms": _stats(times),
+        "flush_ms": _stats(flush_times),
+        "rss_peak_kb": peak_after,
+        "rss_peak_growth_kb": None if peak_after is None or peak_before is None else peak_after - peak_before,
+        "qobjects_before": objs_before,
+        "qobjects_after": live_qobjects(),
+    }
+
+# ------------------------
+# Szenarien
+# ------------------------
+
+def bench_players(counts: Sequence[int], repeat: int, ops: Sequence[str], log) -> List[Dict]:
+    import quiz_blindpick as qb
+
+    # Kein Sitzungsprotokoll: Bench-Runden wären sonst echte Sitzungen in ~/.blindpick-sessions (Liga-Statistik) und
+    # ein liegengebliebener Fortsetzen-Zeiger würde offscreen eine modale Rückfrage öffnen (_check_resume hängt am Recorder)
+    qb.SESSION_LOG = False
+    results = []
+    templates = [qb.RoundTemplate(f"Runde {i + 1}", "", f"Richtige Antwort {i + 1}") for i in range(20)]
+    for n in counts:
+        players = [f"Spieler {i + 1}" for i in range(n)]
+        rng = random.Random(n)
+        audience = qb.AudienceWindow()
+        ctrl = qb.ControlWindow(on_close=None, audience=audience)
+        ctrl.engine.setup(players, templates)
+        answers = [f"Antwort von {p} " + "x" * rng.randrange(5, 60) for p in players]
+
+        def fill_answers():
+            for p, a in zip(players, answers):
+                ctrl.answer_edits[p].setText(a)
+
+        def shuffle_only():
+            ctrl.shuffle_and_show()
+            audience.updates.flush()
+
+        def shuffle():
+            fill_answers()
+            shuffle_only()
+
+        def select_all():
+            shuffle()
+            rows = len(ctrl.runtime.shuffled_order)
+            for p in players:
+                ctrl.engine.select(p, rng.randrange(rows))
+
+        def reveal_all() -> List[float]:
+            out = []
+            for row in range(len(ctrl.runtime.revealed)):
+                t0 = time.perf_counter()
+                ctrl.reveal_row(row)
+                audience.updates.flush()   # ungünstigster Fall: ein Frame je Aufdecken
+                out.append(time.perf_counter() - t0)
+            return out
+
+        def vote_burst():
+            rows = len(ctrl.runtime.shuffled_order)
+            for _ in range(BENCH_BURST):
+                for p in players:
+                    ctrl.engine.select(p, rng.randrange(rows))
+            audience.updates.flush()
+            ctrl.vote_updates.flush()
+
+        shuffle()
+        plan = {
+            "audience.set_answers_grid": (lambda: audience.set_answers_grid(
+                ctrl.engine.view_slots(), ctrl.runtime.revealed, ctrl.col_players, ctrl.engine.selections_dict()), None),
+            "control._rebuild_checkboxes": (lambda: ctrl._rebuild_checkboxes(ctrl.runtime.shuffled_order), None),
+            "audience.vote_burst": (vote_burst, None),
+            "control.shuffle_and_show": (shuffle_only, fill_answers),
+            "control.reveal_row": (reveal_all, select_all),
+        }
+        for op in OPS_PLAYERS:
+            if op not in ops:
+                continue
+            run, prepare = plan[op]
+            res = measure(op, "players", n, run, repeat, prepare)
+            res["pools"] = {"control": ctrl.pool.stats(), "audience": audience.pool.stats()}
+            res["audience_updates"] = audience.updates.stats()
+            results.append(res)
+            log(res)
+        u = audience.updates.stats()
+        print(f"{'':32} Pools: Moderator {ctrl.pool.summary() or '–'} | Zuschauer {audience.pool.summary() or '–'}\n"
+              f"{'':32} Zuschauer-Updates: {u['applied']} angewendet, {u['coalesced']} zusammengefasst, {u['frames']} Frames",
+              flush=True)
+        ctrl.close(); audience.close()
+        ctrl.deleteLater(); audience.deleteLater()
+        _flush()
+    return results
+
+
+def bench_rounds(counts: Sequence[int], repeat: int, ops: Sequence[str], log) -> List[Dict]:
+    if "editor._rebuild_list" not in ops:
+        return []
+    import quiz_blindpick_editor as qe
+
+    results = []
+    for n in counts:
+        ed = qe.BlindPickEditor()
+        ed.rounds = [qe.Round(f"Runde {i + 1}", f"videos/runde_{i + 1}.mp4", f"Antwort {i + 1}") for i in range(n)]
+        res = measure("editor._rebuild_list", "rounds", n, ed._rebuild_list, repeat)
+        results.append(res)
+        log(res)
+        ed.dirty = False
+        ed.close()
+        ed.deleteLater()
+        _flush()
+    return results
+
+# ------------------------
+# Ergebnisse / Vergleich
+# ------------------------
+
+def environment() -> Dict:
+    return {
+        "python": platform.python_version(),
+        "pyside6": PYSIDE_VERSION,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "qpa": QApplication.platformName(),
+    }
+
+
+def compare(old: Dict, new: Dict, factor: float = BENCH_REGRESSION) -> List[str]:
+    """Vergleicht die Mediane je (Operation, Messpunkt); liefert Zeilen für Regressionen."""
+    base = {(r["op"], r["value"]): r for r in old.get("results", [])}
+    regressions = []
+    print(f"\n{'Operation':32} {'Punkt':>8} {'alt ms':>10} {'neu ms':>10} {'Faktor':>7}")
+    for r in new["results"]:
+        o = base.get((r["op"], r["value"]))
+        if o is None:
+            continue
+        a, b = o["wall_ms"]["median"], r["wall_ms"]["median"]
+        ratio = b / a if a > 0 else float("inf")
+        flag = ""
+        if ratio > factor and max(a, b) >= BENCH_MIN_MS:
+            flag = "  <-- Regression"
+            regressions.append(f"{r['op']} @ {r['param']}={r['value']}: {a:.2f} -> {b:.2f} ms (x{ratio:.2f})")
+        print(f"{r['op']:32} {r['value']:>8} {a:>10.3f} {b:>10.3f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def _int_list(text: str) -> List[int]:
+    return [int(x) for x in text.replace("_", "").split(",") if x.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark der Blind-Pick-GUI-Hotpaths (offscreen)")
+    ap.add_argument("--players", type=_int_list, help="Spielerzahlen, z.B. 2,8,32")
+    ap.add_argument("--rounds", type=_int_list, help="Rundenzahlen für den Editor, z.B. 10,1000")
+    ap.add_argument("--repeat", type=int, default=BENCH_REPEAT)
+    ap.add_argument("--ops", help="nur diese Operationen (kommagetrennt)")
+    ap.add_argument("--quick", action="store_true", help="kleiner Sweep für schnelle Kontrollen")
+    ap.add_argument("--out", help="Ergebnisdatei (Standard: bench-results/blindpick-<Zeit>.json)")
+    ap.add_argument("--compare", help="früheres Ergebnis; Exit-Code 1 bei Regression")
+    args = ap.parse_args(argv)
+
+    players = args.players or (BENCH_QUICK_PLAYERS if args.quick else BENCH_PLAYERS)
+    rounds = args.rounds or (BENCH_QUICK_ROUNDS if args.quick else BENCH_ROUNDS)
+    ops = args.ops.split(",") if args.ops else OPS_PLAYERS + OPS_ROUNDS
+    unknown = set(ops) - set(OPS_PLAYERS + OPS_ROUNDS)
+    if unknown:
+        ap.error(f"unbekannte Operation(en): {', '.join(sorted(unknown))}")
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841 (muss bis zum Ende leben)
+
+    def log(r: Dict):
+        w = r["wall_ms"]
+        print(f"{r['op']:32} {r['param']}={r['value']:<7} median {w['median']:9.3f} ms  max {w['max']:9.3f} ms  "
+              f"QObjects {r['qobjects_before']}->{r['qobjects_after']}  Peak-RSS {r['rss_peak_kb']} KiB", flush=True)
+
+    started = time.strftime("%Y-%m-%dT%H:%M:%S")
+    results = bench_players(players, args.repeat, ops, log) + bench_rounds(rounds, args.repeat, ops, log)
+    doc = {"version": RESULT_VERSION, "created": started, "environment": environment(), "results": results}
+
+    out = args.out or os.path.join(BENCH_OUT_DIR, f"blindpick-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, indent=2)
+    print(f"\nErgebnis: {out}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            old = json.load(f)
+        regressions = compare(old, doc)
+        if regressions:
+            print("\nRegressionen:\n  " + "\n  ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
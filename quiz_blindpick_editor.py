@@ -1,21 +1,37 @@
 # quiz_editor.py
 # Integrierter Runden-Editor als Modul-Klasse (kein eigenständiges Script)
 # Template-JSON: {"quiz_type":"blindpick","rounds":[{"title": "...","video": "...","truth":"..."}]}
+# Große Dateien werden im Hintergrund gestreamt (quiz_blindpick_loader.py); die erste Runde ist sofort bearbeitbar.
+# Optional: Runden-Datenbank (SQLite, quiz_blindpick_store.py) für sehr große Kataloge, mit JSON-Import/-Export.
+# Rundenliste als Model/View (nur sichtbare Zeilen) mit Suchfeld über Titel, Antwort und Video (quiz_blindpick_search.py).
+# Jede Änderung landet sofort im Autosave-Journal (quiz_blindpick_journal.py); nach einem Absturz wird es beim Start angeboten.
+# Speichern läuft atomar im Hintergrund (quiz_blindpick_save.py); die GUI übergibt nur einen Snapshot.
 
 from __future__ import annotations
 
-import json
+import os
 import sys
 import copy
-from dataclasses import dataclass, asdict
-from typing import List, Optional
+from dataclasses import dataclass, astuple
+from typing import Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QCoreApplication, QEvent, QSize, QTimer
 from PySide6.QtGui import QAction, QCloseEvent
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QListWidgetItem, QPushButton, QLabel, QLineEdit,
-    QFileDialog, QMessageBox, QGridLayout, QSplitter, QSizePolicy, QCheckBox
+    QListView, QPushButton, QLabel, QLineEdit,
+    QFileDialog, QMessageBox, QGridLayout, QSplitter, QSizePolicy, QCheckBox, QProgressBar
+)
+
+from quiz_blindpick_loader import TemplateLoader, LazyRounds
+from quiz_blindpick_store import RoundStore, is_store_path
+from quiz_blindpick_search import SearchIndex
+from quiz_blindpick_views import RoundListModel
+from quiz_blindpick_save import TemplateWriter
+from quiz_blindpick_journal import (
+    Journal, JOURNAL_COMPACT_OPS, JOURNAL_COMPACT_INTERVAL_S,
+    journal_path_for, snapshot_path_for, session_journal, read_journal, read_snapshot,
+    apply_ops, discard_journal, file_key
 )
 
 @dataclass
@@ -24,9 +40,16 @@ class Round:
     video: str
     truth: str
 
+MODULE_INFO = {"name": "Blind Pick — Editor", "entry": "BlindPickEditor", "order": 20,
+               "description": "Runden-Templates anlegen und bearbeiten"}
+
 def default_round(n: int) -> Round:
     return Round(title=f"Runde {n}", video="", truth="")
 
+def normalize_round(index: int, r: dict) -> tuple:
+    """Runde aus dem Template -> (title, video, truth); läuft im Loader-Thread."""
+    return (r.get("title") or f"Runde {index + 1}", r.get("video") or "", r.get("truth") or "")
+
 class BlindPickEditor(QMainWindow):
     # on_close callback kompatibel mit Startscreen
     def __init__(self, on_close=None):
@@ -42,6 +65,14 @@ class BlindPickEditor(QMainWindow):
         self.dirty: bool = False
         self._selection_changing: bool = False
         self._fields_updating: bool = False
+        self.loader: Optional[TemplateLoader] = None
+        self.search: Optional[SearchIndex] = None       # wird bei der ersten Suche aufgebaut
+        self._search_pos: Optional[Dict[int, int]] = None  # id(Runde) -> Index, nach Strukturänderungen neu
+        self.journal: Optional[Journal] = None          # beginnt mit der ersten Änderung
+        self._recovery: Optional[Tuple[str, Dict, List[Dict]]] = None  # wartet auf fertig geladene Basis
+        self.writer = TemplateWriter(self)
+        self.writer.saved.connect(self._on_saved)
+        self.writer.failed.connect(self._on_save_failed)
 
         # Menüs/Aktionen
         self._build_menu()
@@ -54,11 +85,20 @@ class BlindPickEditor(QMainWindow):
 
         # Linke Seite: Rundenliste + Buttons
         lv = QVBoxLayout(left)
-        self.list = QListWidget()
-        self.list.model().rowsMoved.connect(self._on_rows_moved)
-        self.list.currentRowChanged.connect(self._on_select_round)
-
-        lv.addWidget(QLabel("Runden"))
+        self.list_model = RoundListModel(self)
+        self.list = QListView()
+        self.list.setUniformItemSizes(True)  # Zeilenhöhe nicht pro Runde messen
+        self.list.setModel(self.list_model)
+        self.list.selectionModel().currentRowChanged.connect(self._on_current_row_changed)
+
+        self.ed_search = QLineEdit()
+        self.ed_search.setPlaceholderText("Suchen (Titel, Antwort, Video) …")
+        self.ed_search.setClearButtonEnabled(True)
+        self.ed_search.textChanged.connect(self._apply_filter)
+
+        self.lbl_rounds = QLabel("Runden")
+        lv.addWidget(self.lbl_rounds)
+        lv.addWidget(self.ed_search)
         lv.addWidget(self.list, 1)
 
         hb = QHBoxLayout()
@@ -120,8 +160,28 @@ class BlindPickEditor(QMainWindow):
         splitter.addWidget(right)
         self.setCentralWidget(splitter)
 
+        # Ladefortschritt in der Statusleiste (nur während gestreamt geladen wird)
+        self.load_bar = QProgressBar()
+        self.load_bar.setRange(0, 1000)
+        self.load_bar.setMaximumWidth(200)
+        self.btn_load_cancel = QPushButton("Laden abbrechen")
+        self.btn_load_cancel.clicked.connect(self._cancel_loading)
+        self.lbl_save = QLabel("")
+        self.statusBar().addPermanentWidget(self.lbl_save)
+        self.statusBar().addPermanentWidget(self.load_bar)
+        self.statusBar().addPermanentWidget(self.btn_load_cancel)
+        self.load_bar.hide()
+        self.btn_load_cancel.hide()
+
+        # Journal regelmäßig kompaktieren (Wiederherstellung bleibt kurz)
+        self.compact_timer = QTimer(self)
+        self.compact_timer.setInterval(JOURNAL_COMPACT_INTERVAL_S * 1000)
+        self.compact_timer.timeout.connect(self._journal_compact)
+        self.compact_timer.start()
+
         # Neu starten
         self._new_document()
+        QTimer.singleShot(0, self._check_recovery)
 
     # ---------- Menü ----------
 
@@ -131,13 +191,19 @@ class BlindPickEditor(QMainWindow):
         act_open = QAction("Öffnen …", self); act_open.triggered.connect(self._open_document)
         act_save = QAction("Speichern", self); act_save.triggered.connect(self._save_document)
         act_save_as = QAction("Speichern unter …", self); act_save_as.triggered.connect(self._save_document_as)
+        self.act_save, self.act_save_as = act_save, act_save_as
         act_quit = QAction("Schließen", self); act_quit.triggered.connect(self.close)
+        act_import = QAction("JSON in Runden-Datenbank importieren …", self); act_import.triggered.connect(self._import_to_store)
+        act_export = QAction("Als JSON exportieren …", self); act_export.triggered.connect(self._export_json)
         m_file.addAction(act_new)
         m_file.addAction(act_open)
         m_file.addSeparator()
         m_file.addAction(act_save)
         m_file.addAction(act_save_as)
         m_file.addSeparator()
+        m_file.addAction(act_import)
+        m_file.addAction(act_export)
+        m_file.addSeparator()
         m_file.addAction(act_quit)
 
     # ---------- Datei-Operationen ----------
@@ -152,83 +218,321 @@ class BlindPickEditor(QMainWindow):
         )
         return ret == QMessageBox.Yes
 
-    def _new_document(self):
+    def _leave_document(self) -> bool:
+        """Vor Neu/Öffnen/Schließen: bei Änderungen nachfragen, sonst eingereihte Speicherungen abwarten.
+        False, wenn das letzte Speichern der aktuellen Datei gescheitert ist — dann bleibt das Journal stehen
+        (Meldung über _on_save_failed, das Dokument gilt wieder als geändert)."""
         if not self._confirm_discard():
+            return False
+        if self.dirty:
+            return True   # Verwerfen bestätigt
+        self.writer.wait()
+        QCoreApplication.sendPostedEvents(None, QEvent.MetaCall)   # saved/failed jetzt zustellen (Rebase bzw. Meldung)
+        return not (self.current_path and self.writer.error(self.current_path))
+
+    def _new_document(self):
+        if not self._leave_document():
             return
+        self._cancel_loading()
+        self._close_store()
+        self._journal_discard()
         self.current_path = None
         self.rounds = [default_round(1)]
         self.dirty = False
         self._rebuild_list()
-        self.list.setCurrentRow(0)
+        self._select_round(0)
         self.statusBar().showMessage("Neues Dokument", 3000)
 
     def _open_document(self):
         path, _ = QFileDialog.getOpenFileName(
-            self, "Template öffnen", "", "JSON (*.json)"
+            self, "Template öffnen", "", "JSON (*.json);;Runden-Datenbank (*.bpdb *.sqlite *.db)"
         )
         if not path:
             return
+        if not self._leave_document():
+            return
+        self._journal_discard()
+        jpath = journal_path_for(path)
+        if os.path.exists(jpath) and self._offer_recovery(jpath):
+            return
+        if is_store_path(path):
+            self._open_store(path)
+        else:
+            self._start_loading(path)
+
+    # ---------- Runden-Datenbank ----------
+
+    def _is_store(self) -> bool:
+        return isinstance(self.rounds, RoundStore)
+
+    def _close_store(self):
+        if self._is_store():
+            store = self.rounds
+            self.rounds = []
+            self._rebuild_list()  # Modell darf nicht auf die geschlossene Datenbank zeigen
+            if store.dirty:
+                store.rollback()  # nur nach _confirm_discard erreichbar
+            store.close()
+
+    def _open_store(self, path: str):
+        self._cancel_loading()
+        self._close_store()
+        self._journal_discard()
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            store = RoundStore(path, Round)
         except Exception as e:
-            QMessageBox.critical(self, "Fehler", f"Konnte Datei nicht lesen:\n{e}")
+            QMessageBox.critical(self, "Fehler", f"Konnte Datenbank nicht öffnen:\n{e}")
+            self._new_document()
             return
+        self.current_path = path
+        self.rounds = store
+        self.dirty = False
+        if not store:
+            store.append(default_round(1))
+            self.dirty = True
+        self._rebuild_list()
+        self._select_round(0)
+        self.statusBar().showMessage(f"Datenbank: {path} ({len(store)} Runden)", 3000)
+        if self._recovery is not None:
+            self._finish_recovery()
 
-        if data.get("quiz_type") != "blindpick":
-            QMessageBox.warning(self, "Hinweis", "quiz_type ist nicht 'blindpick'. Trotzdem laden?")
-        rounds = data.get("rounds", [])
-        if not isinstance(rounds, list):
-            QMessageBox.critical(self, "Fehler", "Ungültiges Format: 'rounds' fehlt oder ist kein Array.")
+    def _import_to_store(self):
+        if not self._leave_document():
+            return
+        src, _ = QFileDialog.getOpenFileName(self, "Template importieren", "", "JSON (*.json)")
+        if not src:
+            return
+        dst, _ = QFileDialog.getSaveFileName(self, "Runden-Datenbank anlegen", "", "Runden-Datenbank (*.bpdb)")
+        if not dst:
             return
+        if not is_store_path(dst):
+            dst += ".bpdb"
+        self._cancel_loading()
+        self._close_store()
+        try:
+            if os.path.exists(dst):
+                os.remove(dst)
+            store = RoundStore(dst, Round)
+            warnings = store.import_json(src, normalize_round)
+            store.commit()
+            store.close()
+        except Exception as e:
+            QMessageBox.critical(self, "Fehler", f"Import fehlgeschlagen:\n{e}")
+            return
+        self.dirty = False
+        self._open_store(dst)
+        if warnings:
+            QMessageBox.warning(self, "Hinweis", "Beim Import korrigiert:\n" + "\n".join(warnings[:20]))
 
-        self.current_path = path
-        self.rounds = []
-        for i, r in enumerate(rounds, start=1):
-            title = r.get("title") or f"Runde {i}"
-            video = r.get("video") or ""
-            truth = r.get("truth") or ""
-            self.rounds.append(Round(title=title, video=video, truth=truth))
+    def _export_json(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Als JSON exportieren", "", "JSON (*.json)")
+        if not path:
+            return
+        if not self._is_store():
+            rows = self._snapshot_rows()
+            err = self._validate(rows)
+            if err:
+                QMessageBox.information(self, "Validierung", err)
+                return
+            self.writer.submit(path, rows, ("export", None))
+            self.lbl_save.setText("Exportiere …")
+            return
+        err = self._validate()
+        if err:
+            QMessageBox.information(self, "Validierung", err)
+            return
+        try:
+            self.rounds.export_json(path)
+        except Exception as e:
+            QMessageBox.critical(self, "Fehler", f"Konnte nicht exportieren:\n{e}")
+            return
+        self.statusBar().showMessage(f"Exportiert: {path}", 3000)
 
+    # ---------- Gestreamtes Laden ----------
+
+    def _start_loading(self, path: str):
+        self._cancel_loading()
+        self._close_store()
+        self._journal_discard()
+        self.current_path = path
+        self.rounds = LazyRounds(Round)
+        self.current_index = None
         self.dirty = False
         self._rebuild_list()
-        if self.rounds:
-            self.list.setCurrentRow(0)
-        self.statusBar().showMessage(f"Geladen: {path}", 3000)
+        self._load_fields_from_model()
+        self._set_loading(True)
+        self.loader = TemplateLoader(path, normalize_round, self)
+        self.loader.meta.connect(self._on_load_meta)
+        self.loader.batch.connect(self._on_load_batch)
+        self.loader.progress.connect(self._on_load_progress)
+        self.loader.finished_ok.connect(self._on_load_finished)
+        self.loader.failed.connect(self._on_load_failed)
+        self.loader.start()
+        self.statusBar().showMessage(f"Lade: {path} …")
+
+    def _set_loading(self, on: bool):
+        # Während des Ladens nur Feldbearbeitung erlauben (Struktur kommt noch nach)
+        for w in (self.btn_add, self.btn_dup, self.btn_del, self.btn_up, self.btn_down):
+            w.setEnabled(not on)
+        for act in (self.act_save, self.act_save_as):
+            act.setEnabled(not on)
+        self.load_bar.setValue(0)
+        self.load_bar.setVisible(on)
+        self.btn_load_cancel.setVisible(on)
+
+    def _cancel_loading(self):
+        if self.loader is None:
+            return
+        loader, self.loader = self.loader, None
+        loader.cancel()
+        loader.wait()
+        self._set_loading(False)
+        self._recovery = None  # Journal bleibt auf der Platte und wird beim nächsten Öffnen angeboten
+        if self.current_path:
+            # Teilweise geladen: nicht versehentlich über das Original speichern
+            self.current_path = None
+            self.dirty = True
+            self._journal_detach()
+            self.statusBar().showMessage("Laden abgebrochen — Teilstand (bitte unter neuem Namen speichern)", 5000)
+
+    def _on_load_meta(self, key: str, value):
+        if self.sender() is self.loader and key == "quiz_type" and value != "blindpick":
+            QMessageBox.warning(self, "Hinweis", "quiz_type ist nicht 'blindpick'. Wird trotzdem geladen.")
 
-    def _validate(self) -> Optional[str]:
+    def _on_load_batch(self, raw: List[tuple]):
+        if self.sender() is not self.loader:
+            return
+        first = len(self.rounds)
+        self.rounds.extend_raw(raw)
+        self.list_model.rounds_inserted(first, len(raw))
+        if self.search is not None:
+            for r in self.rounds[first:]:
+                self._search_add(r)
+            self._structure_changed()
+        else:
+            self._update_count_label()
+        if first == 0:
+            self._select_round(0)  # erste Runde sofort bearbeitbar
+
+    def _on_load_progress(self, done: int, total: int):
+        if self.sender() is self.loader and total > 0:
+            self.load_bar.setValue(int(done * 1000 / total))
+
+    def _on_load_finished(self, count: int, warnings: List[str]):
+        if self.sender() is not self.loader:
+            return
+        self.loader = None
+        self._set_loading(False)
+        if not self.rounds:
+            self.rounds.append(default_round(1))
+            self._rebuild_list()
+            self._select_round(0)
+        self.statusBar().showMessage(f"Geladen: {self.current_path} ({count} Runden)", 3000)
+        if self._recovery is not None:
+            self._finish_recovery()
+        if warnings:
+            more = f"\n… und {len(warnings) - 20} weitere" if len(warnings) > 20 else ""
+            QMessageBox.warning(self, "Hinweis", "Beim Laden korrigiert:\n" + "\n".join(warnings[:20]) + more)
+
+    def _on_load_failed(self, msg: str):
+        if self.sender() is not self.loader:
+            return
+        self.loader = None
+        self._set_loading(False)
+        self._recovery = None
+        self.current_path = None
+        self.dirty = bool(self.rounds)
+        self._journal_detach()
+        if not self.rounds:
+            self.rounds.append(default_round(1))
+            self._rebuild_list()
+            self._select_round(0)
+        QMessageBox.critical(self, "Fehler", f"Konnte Datei nicht vollständig lesen:\n{msg}")
+
+    def _snapshot_rows(self) -> List[Tuple[str, str, str]]:
+        # Unveränderliche Kopie für den Schreib-Thread; LazyRounds erzeugt dafür keine Objekte
+        if isinstance(self.rounds, LazyRounds):
+            return self.rounds.rows(astuple)
+        return [(r.title, r.video, r.truth) for r in self.rounds]
+
+    def _validate(self, rows: Optional[List[Tuple[str, str, str]]] = None) -> Optional[str]:
         if not self.rounds:
             return "Mindestens eine Runde wird benötigt."
-        for i, r in enumerate(self.rounds, start=1):
-            if not r.video.strip():
+        if self._is_store():
+            bad = self.rounds.first_invalid()
+            if bad:
+                i, fld = bad
+                what = "Video" if fld == "video" else "Richtige Antwort"
+                return f"Runde {i + 1}: {what} darf nicht leer sein."
+            self.rounds.fill_empty_titles()
+            return None
+        if rows is None:
+            rows = self._snapshot_rows()
+        for i, (title, video, truth) in enumerate(rows, start=1):
+            if not video.strip():
                 return f"Runde {i}: Video darf nicht leer sein."
-            if not r.truth.strip():
+            if not truth.strip():
                 return f"Runde {i}: Richtige Antwort darf nicht leer sein."
-            if not r.title.strip():
-                r.title = f"Runde {i}"
+            if not title.strip():
+                rows[i - 1] = (f"Runde {i}", video, truth)
+                self.rounds[i - 1].title = f"Runde {i}"
         return None
 
     def _save_document(self):
         if not self.current_path:
             return self._save_document_as()
-        err = self._validate()
+        if self._is_store():
+            err = self._validate()
+            if err:
+                QMessageBox.information(self, "Validierung", err)
+                return
+            try:
+                self.rounds.commit()  # Datenbank: nur die Transaktion abschließen
+            except Exception as e:
+                QMessageBox.critical(self, "Fehler", f"Konnte nicht speichern:\n{e}")
+                return
+            self.dirty = False
+            self._journal_discard()  # gespeicherter Stand ist die neue Basis
+            self.statusBar().showMessage(f"Gespeichert: {self.current_path}", 3000)
+            return
+        rows = self._snapshot_rows()
+        err = self._validate(rows)
         if err:
             QMessageBox.information(self, "Validierung", err)
             return
-        try:
-            payload = {
-                "quiz_type": "blindpick",
-                "rounds": [asdict(r) for r in self.rounds]
-            }
-            with open(self.current_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            QMessageBox.critical(self, "Fehler", f"Konnte nicht speichern:\n{e}")
-            return
+        # Schreiben im Hintergrund; spätere Änderungen markieren das Dokument wieder als geändert
+        mark = self.journal.mark() if self.journal is not None else None
         self.dirty = False
-        self.statusBar().showMessage(f"Gespeichert: {self.current_path}", 3000)
+        self.writer.submit(self.current_path, rows, ("save", mark))
+        self.lbl_save.setText("Speichere …")
+
+    def _on_saved(self, path: str, latency: float, write_s: float, coalesced: int, tag):
+        kind, mark = tag
+        merged = f", {coalesced + 1} Anforderungen zusammengefasst" if coalesced else ""
+        self.lbl_save.setText(f"Speichern: {latency * 1000:.0f} ms (Schreiben {write_s * 1000:.0f} ms)")
+        if kind == "export":
+            self.statusBar().showMessage(f"Exportiert: {path} ({latency:.2f} s{merged})", 3000)
+            return
+        if path == self.current_path and self.journal is not None:
+            # Datei enthält jetzt den Stand bei `mark`: Journal behält nur spätere Änderungen
+            try:
+                if not self.journal.rebase(path, mark):
+                    self.journal = None
+            except (OSError, ValueError) as e:
+                self.statusBar().showMessage(f"Autosave-Journal nicht schreibbar: {e}", 5000)
+        self.statusBar().showMessage(f"Gespeichert: {path} ({latency:.2f} s{merged})", 3000)
+
+    def _on_save_failed(self, path: str, msg: str, tag):
+        self.lbl_save.setText("")
+        if tag[0] == "save" and path == self.current_path:
+            self.dirty = True  # Journal bleibt unverändert und deckt den Stand weiter ab
+        what = "exportieren" if tag[0] == "export" else "speichern"
+        QMessageBox.critical(self, "Fehler", f"Konnte nicht {what}:\n{path}\n{msg}")
 
     def _save_document_as(self):
+        if self._is_store():
+            # Datenbank bleibt geöffnet; "Speichern unter" schreibt eine JSON-Kopie
+            return self._export_json()
         path, _ = QFileDialog.getSaveFileName(
             self, "Template speichern", "", "JSON (*.json)"
         )
@@ -237,54 +541,212 @@ class BlindPickEditor(QMainWindow):
         self.current_path = path
         self._save_document()
 
+    # ---------- Journal / Wiederherstellung ----------
+
+    def _journal_op(self, op: Dict):
+        # Vor der Strukturänderung aufrufen: ein Basis-Snapshot muss den Stand davor enthalten
+        try:
+            if self.journal is None:
+                # Basis: gespeicherte Datei, sonst Snapshot des aktuellen Stands (neu/Teilstand)
+                rows = None if self.current_path else self._snapshot_rows()
+                self.journal = Journal.start(self.current_path, rows)
+            self.journal.append(op)
+        except OSError as e:
+            self.journal = None
+            self.statusBar().showMessage(f"Autosave-Journal nicht schreibbar: {e}", 5000)
+            return
+        if self.journal.ops >= JOURNAL_COMPACT_OPS:
+            self._journal_compact()
+
+    def _journal_compact(self):
+        # Datenbank: Änderungen liegen in der offenen Transaktion, dort bleibt es beim Journal
+        if self.journal is None or self.journal.ops == 0 or self.loader is not None or self._is_store():
+            return
+        try:
+            self.journal.compact(self._snapshot_rows())
+        except OSError as e:
+            self.statusBar().showMessage(f"Autosave fehlgeschlagen: {e}", 5000)
+
+    def _journal_discard(self):
+        if self.journal is not None:
+            self.journal.discard()
+            self.journal = None
+
+    def _journal_detach(self):
+        # Dokument verliert seine Datei (Teilstand): Journal auf Snapshot-Basis neu beginnen
+        if self.journal is None:
+            return
+        self._journal_discard()
+        try:
+            self.journal = Journal.start(None, self._snapshot_rows())
+        except OSError as e:
+            self.statusBar().showMessage(f"Autosave-Journal nicht schreibbar: {e}", 5000)
+
+    def _check_recovery(self):
+        jpath = session_journal()
+        if jpath and self.journal is None and not self.dirty:
+            self._offer_recovery(jpath)
+
+    def _offer_recovery(self, jpath: str) -> bool:
+        """Fragt nach und stellt ggf. wieder her; False = Journal verworfen, normal weitermachen."""
+        try:
+            header, ops = read_journal(jpath)
+        except (OSError, ValueError):
+            discard_journal(jpath)
+            return False
+        doc = header.get("document") or "neues Dokument"
+        ret = QMessageBox.question(
+            self, "Wiederherstellung",
+            f"Nicht gespeicherte Änderungen gefunden:\n{doc} ({len(ops)} Änderungen seit dem letzten Autosave)\n\n"
+            "Wiederherstellen?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+        )
+        if ret != QMessageBox.Yes:
+            discard_journal(jpath)
+            return False
+        return self._recover(jpath, header, ops)
+
+    def _recover(self, jpath: str, header: Dict, ops: List[Dict]) -> bool:
+        doc = header.get("document")
+        if header.get("base") == "snapshot":
+            try:
+                rows = read_snapshot(snapshot_path_for(jpath, header.get("seq", 0)))
+            except (OSError, ValueError) as e:
+                QMessageBox.critical(self, "Fehler", f"Autosave-Snapshot nicht lesbar:\n{e}")
+                return False
+            self._cancel_loading()
+            self._close_store()
+            self.current_path = doc
+            self.rounds = [Round(*r) for r in rows] or [default_round(1)]
+            self._recovery = (jpath, header, ops)
+            self._finish_recovery()
+            return True
+        # Basis = gespeicherte Datei; JSON nur, wenn sie seitdem unverändert ist
+        if not doc or not os.path.exists(doc) or (not is_store_path(doc) and file_key(doc) != header.get("key")):
+            QMessageBox.warning(
+                self, "Wiederherstellung",
+                f"{doc} fehlt oder wurde seitdem verändert — die Änderungen passen nicht mehr dazu.\n"
+                f"Das Journal bleibt als {jpath}.alt erhalten."
+            )
+            try:
+                os.replace(jpath, jpath + ".alt")
+            except OSError:
+                pass
+            discard_journal(jpath)
+            return False
+        self._recovery = (jpath, header, ops)
+        if is_store_path(doc):
+            self._open_store(doc)
+        else:
+            self._start_loading(doc)  # Journal wird nach dem Laden angewendet
+        return True
+
+    def _finish_recovery(self):
+        jpath, header, ops = self._recovery
+        self._recovery = None
+        applied, err = apply_ops(self.rounds, ops, Round)
+        self._rebuild_list()
+        self._select_round(0)
+        self.dirty = True
+        try:
+            self.journal = Journal(jpath, header, ops[:applied])  # weiter an dasselbe Journal anhängen
+        except OSError as e:
+            self.statusBar().showMessage(f"Autosave-Journal nicht schreibbar: {e}", 5000)
+        if err:
+            QMessageBox.warning(self, "Wiederherstellung", f"Nur teilweise wiederhergestellt:\n{err}")
+        self.statusBar().showMessage(f"Wiederhergestellt: {applied} Änderungen", 5000)
+
     # ---------- Liste / Selektion ----------
 
     def _rebuild_list(self):
         self._selection_changing = True
         try:
-            self.list.clear()
-            for r in self.rounds:
-                item = QListWidgetItem(r.title or "(ohne Titel)")
-                self.list.addItem(item)
+            self.search = None
+            self._search_pos = None
+            self.list_model.set_rounds(self.rounds)
         finally:
             self._selection_changing = False
+        if self.ed_search.text().strip():
+            self._apply_filter()
+        else:
+            self._update_count_label()
+
+    def _select_round(self, index: int):
+        row = self.list_model.row_of(index)
+        if row < 0 and self.list_model.filtered and 0 <= index < len(self.rounds):
+            self.ed_search.clear()  # Ziel ist herausgefiltert -> Filter aufheben
+            row = self.list_model.row_of(index)
+        self._selection_changing = True
+        try:
+            self.list.setCurrentIndex(self.list_model.index(row))
+        finally:
+            self._selection_changing = False
+        if row >= 0:
+            self.list.scrollTo(self.list_model.index(row))
+        # Zeile kann nach Verschieben bereits aktuell sein (kein Signal) -> Formular direkt setzen
+        self.current_index = index if row >= 0 else None
+        self._load_fields_from_model()
 
-    def _on_select_round(self, row: int):
+    def _on_current_row_changed(self, current, _previous):
         if self._selection_changing:
             return
-        self.current_index = None if row < 0 else row
+        row = current.row()
+        self.current_index = None if row < 0 else self.list_model.round_at(row)
         self._load_fields_from_model()
 
-    def _on_rows_moved(self, *args):
-        # Sync interner Daten nach Drag&Drop
+    def _update_count_label(self):
+        n = len(self.rounds)
+        if self.list_model.filtered:
+            self.lbl_rounds.setText(f"Runden ({self.list_model.rowCount()} von {n})")
+        else:
+            self.lbl_rounds.setText(f"Runden ({n})")
+
+    # ---------- Suche ----------
+
+    def _ensure_search(self) -> SearchIndex:
+        if self.search is None:
+            self.search = SearchIndex()
+            for r in self.rounds[:]:  # Datenbank: eine Abfrage, LazyRounds: Objekte einmalig erzeugen
+                self._search_add(r)
+        return self.search
+
+    def _search_add(self, r: Round):
+        # Schlüssel = Objektidentität; update() ersetzt vorhandene Tokens derselben Runde
+        self.search.update(id(r), (r.title, r.truth, r.video))
+
+    def _structure_changed(self):
+        # Einfügen/Löschen/Verschieben: Positionen neu zuordnen, Filter ggf. neu anwenden
+        self._search_pos = None
+        if self.list_model.filtered:
+            self._apply_filter()
+        else:
+            self._update_count_label()
+
+    def _apply_filter(self, *_):
+        query = self.ed_search.text()
+        keys = self._ensure_search().search(query) if query.strip() else None
+        current = self.current_index
+        self._selection_changing = True
         try:
-            start = args[6]
-            end = args[7]
-            dest = args[8]
-        except Exception:
-            order = [self.list.item(i).text() for i in range(self.list.count())]
-            self._reorder_by_titles(order)
-            self.dirty = True
-            return
-
-        if start == end:
-            moved = self.rounds.pop(start)
-            if dest > start:
-                dest_index = dest - 1
+            if keys is None:
+                self.list_model.set_filter(None)
             else:
-                dest_index = dest
-            self.rounds.insert(dest_index, moved)
-            self.dirty = True
-            self.list.setCurrentRow(dest_index)
-
-    def _reorder_by_titles(self, order_titles: List[str]):
-        title_to_round = {r.title: r for r in self.rounds}
-        new_list = []
-        for t in order_titles:
-            if t in title_to_round:
-                new_list.append(title_to_round.pop(t))
-        new_list.extend(title_to_round.values())
-        self.rounds = new_list
+                if self._search_pos is None:
+                    self._search_pos = {id(r): i for i, r in enumerate(self.rounds[:])}
+                pos = self._search_pos
+                self.list_model.set_filter([pos[k] for k in keys if k in pos])
+            # Auswahl erhalten, falls die aktuelle Runde sichtbar bleibt
+            row = self.list_model.row_of(current) if current is not None else -1
+            if row >= 0:
+                self.list.setCurrentIndex(self.list_model.index(row))
+        finally:
+            self._selection_changing = False
+        if row >= 0:
+            self.list.scrollTo(self.list_model.index(row))
+        elif current is not None:
+            self.current_index = None  # herausgefiltert: nicht unsichtbar weiterbearbeiten
+            self._load_fields_from_model()
+        self._update_count_label()
 
     # ---------- Formularbindung ----------
 
@@ -317,12 +779,16 @@ class BlindPickEditor(QMainWindow):
         if self.current_index is None or not (0 <= self.current_index < len(self.rounds)):
             return
         r = self.rounds[self.current_index]
+        before = (r.title, r.video, r.truth)
         r.title = self.ed_title.text().strip() or r.title
         r.video = self.ed_video.text().strip()
         r.truth = self.ed_truth.text().strip()
-        it = self.list.item(self.current_index)
-        if it:
-            it.setText(r.title or "(ohne Titel)")
+        if (r.title, r.video, r.truth) != before:
+            self._journal_op({"op": "set", "i": self.current_index, "r": [r.title, r.video, r.truth]})
+        self.rounds[self.current_index] = r  # Datenbank: Änderung zurückschreiben (Liste: no-op)
+        self.list_model.round_changed(self.current_index)
+        if self.search is not None:
+            self._search_add(r)  # ersetzt die alten Tokens dieser Runde
         self.dirty = True
 
     def _mark_dirty_typing(self, *_):
@@ -334,9 +800,10 @@ class BlindPickEditor(QMainWindow):
     def _add_round(self):
         n = len(self.rounds) + 1
         r = default_round(n)
+        self._journal_op({"op": "ins", "i": len(self.rounds), "r": [r.title, r.video, r.truth]})
         self.rounds.append(r)
-        self.list.addItem(QListWidgetItem(r.title))
-        self.list.setCurrentRow(self.list.count() - 1)
+        self._round_inserted(len(self.rounds) - 1, r)
+        self._select_round(len(self.rounds) - 1)
         self.dirty = True
 
     def _duplicate_round(self):
@@ -346,11 +813,18 @@ class BlindPickEditor(QMainWindow):
         r = self.rounds[idx]
         nr = copy.deepcopy(r)
         nr.title = self._unique_copy_title(nr.title)
+        self._journal_op({"op": "ins", "i": idx + 1, "r": [nr.title, nr.video, nr.truth]})
         self.rounds.insert(idx + 1, nr)
-        self.list.insertItem(idx + 1, QListWidgetItem(nr.title))
-        self.list.setCurrentRow(idx + 1)
+        self._round_inserted(idx + 1, nr)
+        self._select_round(idx + 1)
         self.dirty = True
 
+    def _round_inserted(self, idx: int, r: Round):
+        self.list_model.rounds_inserted(idx, 1)
+        if self.search is not None:
+            self._search_add(r)
+        self._structure_changed()
+
     def _unique_copy_title(self, title: str) -> str:
         base = f"{title} (Kopie)"
         candidate = base
@@ -368,32 +842,41 @@ class BlindPickEditor(QMainWindow):
         if len(self.rounds) == 1:
             QMessageBox.information(self, "Hinweis", "Mindestens eine Runde wird benötigt.")
             return
-        self.rounds.pop(idx)
-        self.list.takeItem(idx)
+        self._journal_op({"op": "del", "i": idx})
+        r = self.rounds.pop(idx)
+        self.list_model.round_removed(idx)
+        if self.search is not None:
+            self.search.remove(id(r))
+        self._structure_changed()
         self.current_index = min(idx, len(self.rounds) - 1)
-        self.list.setCurrentRow(self.current_index)
+        self._select_round(self.current_index)
         self.dirty = True
 
     def _move_up(self):
         idx = self.current_index
         if idx is None or idx <= 0:
             return
-        self.rounds[idx - 1], self.rounds[idx] = self.rounds[idx], self.rounds[idx - 1]
-        it = self.list.takeItem(idx)
-        self.list.insertItem(idx - 1, it)
-        self.list.setCurrentRow(idx - 1)
+        self._move_round(idx, idx - 1)
+        self._select_round(idx - 1)
         self.dirty = True
 
     def _move_down(self):
         idx = self.current_index
         if idx is None or idx >= len(self.rounds) - 1:
             return
-        self.rounds[idx + 1], self.rounds[idx] = self.rounds[idx], self.rounds[idx + 1]
-        it = self.list.takeItem(idx)
-        self.list.insertItem(idx + 1, it)
-        self.list.setCurrentRow(idx + 1)
+        self._move_round(idx, idx + 1)
+        self._select_round(idx + 1)
         self.dirty = True
 
+    def _move_round(self, src: int, dst: int):
+        self._journal_op({"op": "mov", "s": src, "d": dst})
+        if self._is_store():
+            self.rounds.move(src, dst)  # nur die Position einer Zeile ändert sich
+        else:
+            self.rounds[src], self.rounds[dst] = self.rounds[dst], self.rounds[src]
+        self.list_model.round_moved(src, dst)
+        self._structure_changed()
+
     def _choose_video(self):
         path, _ = QFileDialog.getOpenFileName(
             self, "Video auswählen",
@@ -407,10 +890,16 @@ class BlindPickEditor(QMainWindow):
     # ---------- Schließen ----------
 
     def closeEvent(self, event: QCloseEvent):
-        # Speichern abfragen, dann schließen
-        if not self._confirm_discard():
+        # Speichern abfragen, dann schließen (Journal nur verwerfen, wenn die Datei wirklich geschrieben wurde)
+        if not self._leave_document():
             event.ignore()
             return
+        if self.loader is not None:
+            self.loader.cancel()
+            self.loader.wait()
+        self.writer.wait()  # eingereihte Speicherungen noch abschließen
+        self._close_store()
+        self._journal_discard()
         if self.on_close:
             self.on_close()
         super().closeEvent(event)
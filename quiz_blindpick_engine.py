@@ -0,0 +1,234 @@
+# quiz_blindpick_engine.py
+# Spiellogik von Blind Pick ohne Qt (headless, für Moderatorfenster, Tests und Simulationen)
+# - BlindPickEngine: Spieler, Runden, Punkte, Mischen, Auswahl, Aufdecken + Punktevergabe
+# - Zustand kompakt in __slots__-Klassen; Punkte/Auswahl als Listen je Spielerindex (-1 = keine Auswahl)
+# - Beobachter: subscribe(fn) -> fn(event, *args) bei "setup", "round", "shuffle", "select", "votes", "reveal"
+# - Stimmen-Index: je Zeile die Menge der Spieler, die sie gewählt haben (bei jeder Auswahl nachgeführt)
+#   -> Aufdecken kostet O(Wähler dieser Zeile), Stimmenzahlen je Zeile ohne Durchlauf über alle Spieler
+# - state()/restore(): kompletter Spielstand als dict (Sitzungsprotokoll, siehe quiz_blindpick_session.py)
+
+from __future__ import annotations
+
+import random
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+TRUTH_AUTHOR = "Richtige Antwort"   # Autor der Template-Antwort in den Zeilen
+NO_SELECTION = -1
+
+
+class RoundRuntime:
+    """Laufzeit einer Runde. Zeilen sind in Anzeige-Reihenfolge; shuffled_order[row] = Slot-Index
+    (0..n-1 = Spieler, n = richtige Antwort). voters[row] = Spielerindizes mit Auswahl row (aus selections abgeleitet)."""
+
+    __slots__ = ("players_answers", "shuffled_order", "revealed", "selections", "voters")
+
+    def __init__(self, players_answers: Optional[List[str]] = None, shuffled_order: Optional[List[int]] = None,
+                 revealed: Optional[List[bool]] = None, selections: Optional[List[int]] = None):
+        self.players_answers: List[str] = players_answers if players_answers is not None else []
+        self.shuffled_order: List[int] = shuffled_order if shuffled_order is not None else []
+        self.revealed: List[bool] = revealed if revealed is not None else []
+        self.selections: List[int] = selections if selections is not None else []   # je Spielerindex
+        self.voters: List[Set[int]] = [set() for _ in self.shuffled_order]
+        for pi, sel in enumerate(self.selections):
+            if 0 <= sel < len(self.voters):
+                self.voters[sel].add(pi)
+
+    def move_vote(self, pi: int, row: int) -> int:
+        """Auswahl von Spieler pi auf row setzen und den Index nachführen; liefert die vorige Zeile (oder NO_SELECTION)."""
+        prev = self.selections[pi]
+        if prev != NO_SELECTION:
+            self.voters[prev].discard(pi)
+        self.voters[row].add(pi)
+        self.selections[pi] = row
+        return prev
+
+    def votes(self, row: int) -> int:
+        return len(self.voters[row]) if 0 <= row < len(self.voters) else 0
+
+    @property
+    def shuffled(self) -> bool:
+        return bool(self.shuffled_order)
+
+
+class BlindPickEngine:
+    __slots__ = ("players", "templates", "round_index", "scores", "runtime", "_pidx", "_rng", "_listeners", "_planned")
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.players: List[str] = []
+        self.templates: Sequence = []          # RoundTemplate-ähnlich: .title, .video, .truth
+        self.round_index: int = 0
+        self.scores: List[int] = []            # je Spielerindex
+        self.runtime = RoundRuntime()
+        self._pidx: Dict[str, int] = {}
+        self._rng = rng or random.Random()
+        self._listeners: List[Callable] = []
+        self._planned: Optional[List[int]] = None   # vorab gezogene Mischung (plan_shuffle)
+
+    # ----- Beobachter -----
+
+    def subscribe(self, fn: Callable):
+        self._listeners.append(fn)
+
+    def unsubscribe(self, fn: Callable):
+        if fn in self._listeners:
+            self._listeners.remove(fn)
+
+    def _emit(self, event: str, *args):
+        for fn in list(self._listeners):
+            fn(event, *args)
+
+    # ----- Setup / Navigation -----
+
+    def setup(self, players: Sequence[str], templates: Sequence):
+        self.players = list(players)
+        self._pidx = {p: i for i, p in enumerate(self.players)}
+        self.templates = templates   # kann (LazyRounds) noch wachsen
+        self.scores = [0] * len(self.players)
+        self.round_index = 0
+        self._reset_runtime()
+        self._emit("setup")
+        self._emit("round", self.round_index)
+
+    @property
+    def template(self):
+        if 0 <= self.round_index < len(self.templates):
+            return self.templates[self.round_index]
+        return None
+
+    def _reset_runtime(self):
+        n = len(self.players)
+        self.runtime = RoundRuntime([""] * n, [], [], [NO_SELECTION] * n)
+
+    def goto_round(self, index: int) -> bool:
+        if not (0 <= index < len(self.templates)):
+            return False
+        self.round_index = index
+        self._reset_runtime()
+        self._emit("round", index)
+        return True
+
+    def next_round(self) -> bool:
+        return self.goto_round(self.round_index + 1)
+
+    def prev_round(self) -> bool:
+        return self.goto_round(self.round_index - 1)
+
+    def rotated_players(self, round_index: Optional[int] = None) -> List[str]:
+        """Spaltenreihenfolge der Auswahl: pro Runde um eins weiter rotiert (Standard: aktuelle Runde)."""
+        n = len(self.players)
+        if not n:
+            return []
+        k = (self.round_index if round_index is None else round_index) % n
+        return self.players[n - k:] + self.players[:n - k]
+
+    # ----- Runde -----
+
+    def plan_shuffle(self):
+        """Nächste Mischung schon jetzt aus dem Zufallsgenerator ziehen (Leerlauf); shuffle() verbraucht sie."""
+        n = len(self.players)
+        if self._planned is None or len(self._planned) != n + 1:
+            self._planned = list(range(n + 1))
+            self._rng.shuffle(self._planned)
+
+    def shuffle(self, answers: Sequence[str]) -> List[int]:
+        """Setzt die Spielerantworten, mischt alle Zeilen (inkl. richtiger Antwort) und leert die Auswahl."""
+        n = len(self.players)
+        self.plan_shuffle()
+        order, self._planned = self._planned, None
+        self.runtime = RoundRuntime(list(answers[:n]) + [""] * (n - len(answers)), order,
+                                    [False] * (n + 1), [NO_SELECTION] * n)
+        self._emit("shuffle", order)
+        return order
+
+    def slot(self, row: int) -> Tuple[str, str]:
+        """(Autor, Text) der Zeile `row` in Anzeige-Reihenfolge."""
+        abs_idx = self.runtime.shuffled_order[row]
+        if abs_idx < len(self.players):
+            return self.players[abs_idx], self.runtime.players_answers[abs_idx]
+        templ = self.template
+        return TRUTH_AUTHOR, templ.truth if templ is not None else ""
+
+    def view_slots(self) -> List[Dict[str, str]]:
+        return [dict(zip(("author", "text"), self.slot(r))) for r in range(len(self.runtime.shuffled_order))]
+
+    def select(self, player: str, row: int) -> bool:
+        """Auswahl eines Spielers setzen (exklusiv je Spieler). False, wenn ungültig oder unverändert."""
+        pi = self._pidx.get(player)
+        rt = self.runtime
+        if pi is None or not (0 <= row < len(rt.shuffled_order)) or rt.selections[pi] == row:
+            return False
+        prev = rt.move_vote(pi, row)
+        self._emit("select", player, row)
+        changed = {row: rt.votes(row)}
+        if prev != NO_SELECTION:
+            changed[prev] = rt.votes(prev)
+        self._emit("votes", changed)
+        return True
+
+    def selection(self, player: str) -> Optional[int]:
+        pi = self._pidx.get(player)
+        if pi is None:
+            return None
+        sel = self.runtime.selections[pi]
+        return None if sel == NO_SELECTION else sel
+
+    def reveal(self, row: int) -> Optional[Dict[str, int]]:
+        """Deckt eine Zeile auf und vergibt Punkte; liefert {Spieler: Punkte} oder None (ungültig/schon offen).
+        Richtige Antwort: +1 für jeden, der sie gewählt hat. Spielerantwort: +1 für den Autor je fremder Wahl."""
+        rt = self.runtime
+        if not (0 <= row < len(rt.revealed)) or rt.revealed[row]:
+            return None
+        author, _ = self.slot(row)
+        gained: Dict[str, int] = {}
+        ai = self._pidx.get(author) if author != TRUTH_AUTHOR else None
+        for pi in sorted(rt.voters[row]):   # sortiert: gleiche Reihenfolge in gained wie früher (Protokoll/Replay)
+            if author == TRUTH_AUTHOR:
+                self.scores[pi] += 1
+                gained[self.players[pi]] = gained.get(self.players[pi], 0) + 1
+            elif pi != ai and ai is not None:
+                self.scores[ai] += 1
+                gained[author] = gained.get(author, 0) + 1
+        rt.revealed[row] = True
+        self._emit("reveal", row, author, gained)
+        return gained
+
+    # ----- Spielstand sichern / wiederherstellen -----
+
+    def state(self) -> Dict:
+        """Kopie des veränderlichen Zustands (JSON-tauglich)."""
+        rt = self.runtime
+        return {"round": self.round_index, "scores": list(self.scores), "answers": list(rt.players_answers),
+                "order": list(rt.shuffled_order), "revealed": list(rt.revealed), "sel": list(rt.selections)}
+
+    def restore(self, players: Sequence[str], templates: Sequence, state: Dict):
+        """Setup + gespeicherten Zustand in einem Schritt; meldet "setup", "round" und (falls gemischt) "shuffle"."""
+        self.players = list(players)
+        self._pidx = {p: i for i, p in enumerate(self.players)}
+        self.templates = templates
+        n = len(self.players)
+        self.scores = list(state["scores"])
+        self.round_index = state["round"]
+        self.runtime = RoundRuntime(list(state["answers"]), list(state["order"]),
+                                    [bool(x) for x in state["revealed"]], list(state["sel"]))
+        if len(self.scores) != n or len(self.runtime.selections) != n:
+            raise ValueError("Spielstand passt nicht zur Spielerzahl")
+        self._emit("setup")
+        self._emit("round", self.round_index)
+        if self.runtime.shuffled:
+            self._emit("shuffle", self.runtime.shuffled_order)
+
+    # ----- Ansichten für die GUI -----
+
+    def scores_dict(self) -> Dict[str, int]:
+        return dict(zip(self.players, self.scores))
+
+    def tallies(self) -> List[int]:
+        """Stimmen je Zeile (Anzeige-Reihenfolge)."""
+        return [len(v) for v in self.runtime.voters]
+
+    def voters(self, row: int) -> List[str]:
+        rt = self.runtime
+        return [self.players[pi] for pi in sorted(rt.voters[row])] if 0 <= row < len(rt.voters) else []
+
+    def selections_dict(self) -> Dict[str, Optional[int]]:
+        return {p: (None if s == NO_SELECTION else s) for p, s in zip(self.players, self.runtime.selections)}
@@ -0,0 +1,323 @@
+# quiz_blindpick_feeds.py
+# Live-Bilder für die Kamera-Slots im Zuschauerfenster
+# - Quellen liefern Einzelbilder, die einmal je Quellbild quadratisch zugeschnitten und auf die Slot-Größe (SQUARE_MAX) verkleinert werden:
+#   SyntheticSource (Testbild), ImageSource (Standbild, per QImageReader gleich verkleinert dekodiert),
+#   VideoFileSource (QMediaPlayer + QVideoSink, Endlosschleife, stumm), CameraSource (QCamera im kleinsten passenden Format)
+# - FeedHub: ein Takt (Bildwiederholrate, siehe quiz_blindpick_frames.py) verteilt neue Bilder an die Slots
+#   - je Quelle höchstens FEED_FPS Bilder/s; was dazwischen vom Dekoder kommt, wird verworfen, ohne es umzuwandeln
+#   - Umwandeln/Verkleinern je Takt höchstens FEED_BUDGET_MS, Quellen reihum — der Rest wartet auf den nächsten Takt,
+#     damit das Hauptvideo flüssig bleibt
+#   - ein Bild geht als dasselbe QImage (implizit geteilt, keine Kopie) an alle Slots derselben Quelle
+# - make_sources(spec, players): "test" | "camera" | Ordner mit <Spielername>.<png|jpg|mp4|…> (fehlt die Datei: _default.*);
+#   gleiche Datei für mehrere Spieler = eine Quelle
+# - Mit Anzeige-Prozessen (AUDIENCE_PROCESSES) öffnet jede Anzeige ihre Quellen selbst; eine Kamera meist nur einmal
+
+from __future__ import annotations
+
+import math
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, QPointF, QRectF, Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QImage, QImageReader, QPainter
+
+from quiz_blindpick_frames import frame_interval_ms
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+FEED_FPS = 15            # Bilder pro Sekunde je Quelle (Obergrenze) — hier anpassen
+FEED_BUDGET_MS = 4.0     # Zeit für Umwandeln/Verkleinern je Takt über alle Quellen (ms) — hier anpassen
+FEED_SMOOTH = True       # weich verkleinern (sonst schneller, aber pixelig) — hier anpassen
+FEED_IMAGE_EXT = (".png", ".jpg", ".jpeg", ".bmp", ".webp")   # Standbilder — hier anpassen
+FEED_VIDEO_EXT = (".mp4", ".mov", ".mkv", ".webm", ".avi")    # Videodateien (Endlosschleife) — hier anpassen
+# =========================
+
+
+def fit_square(img: QImage, side: int) -> QImage:
+    """Auf side×side bringen: erst verkleinern (kurze Kante = side), dann mittig zuschneiden — nur das kleine Bild wird kopiert."""
+    if img.isNull():
+        return img
+    if img.width() != side or img.height() != side:
+        mode = Qt.SmoothTransformation if FEED_SMOOTH else Qt.FastTransformation
+        img = img.scaled(side, side, Qt.KeepAspectRatioByExpanding, mode)
+    if img.width() != img.height():
+        img = img.copy((img.width() - side) // 2, (img.height() - side) // 2, side, side)
+    return img
+
+
+class FrameSource(QObject):
+    """Basis: pending() = neues Quellbild liegt vor, take(side) = umwandeln + verkleinern (zählt zum Budget)."""
+
+    def __init__(self, label: str, parent=None):
+        super().__init__(parent)
+        self.label = label
+        self.received = 0   # Bilder vom Dekoder/Generator
+        self.taken = 0      # davon umgewandelt und verteilt
+
+    def start(self): pass
+    def stop(self): pass
+
+    def pending(self) -> bool:
+        return False
+
+    def take(self, side: int) -> Optional[QImage]:
+        return None
+
+
+class SyntheticSource(FrameSource):
+    """Testbild: bewegter Balken, Name und Uhrzeit; zeichnet abwechselnd in zwei feste Puffer (kein Anlegen je Bild)."""
+
+    def __init__(self, label: str, hue: int = 0, parent=None):
+        super().__init__(label, parent)
+        self.hue = hue
+        self._buffers: List[QImage] = []
+        self._next = 0
+        self._t0 = time.perf_counter()
+
+    def pending(self) -> bool:
+        return True
+
+    def take(self, side: int) -> Optional[QImage]:
+        if not self._buffers or self._buffers[0].width() != side:
+            self._buffers = [QImage(side, side, QImage.Format_RGB32) for _ in range(2)]
+        img = self._buffers[self._next]   # der andere Puffer hängt evtl. noch an einem Slot (sonst Kopie beim Bemalen)
+        self._next ^= 1
+        t = time.perf_counter() - self._t0
+        img.fill(QColor.fromHsv(self.hue % 360, 90, 70))
+        p = QPainter(img)
+        p.setRenderHint(QPainter.Antialiasing)
+        x = (0.5 + 0.5 * math.sin(t * 2.0)) * (side - side / 6)
+        p.fillRect(QRectF(x, 0, side / 6, side), QColor(255, 255, 255, 60))
+        p.setPen(Qt.white)
+        f = QFont(); f.setPixelSize(max(10, side // 10)); f.setBold(True)
+        p.setFont(f)
+        p.drawText(QRectF(0, 0, side, side), Qt.AlignCenter, self.label)
+        f.setPixelSize(max(8, side // 16)); f.setBold(False)
+        p.setFont(f)
+        p.drawText(QPointF(6, side - 6), f"{t:7.2f}")
+        p.end()
+        self.received += 1
+        self.taken += 1
+        return img
+
+
+class ImageSource(FrameSource):
+    """Standbild: einmal direkt in Zielgröße dekodiert (JPEG skaliert schon beim Dekodieren)."""
+
+    def __init__(self, path: str, parent=None):
+        super().__init__(Path(path).stem, parent)
+        self.path = path
+        self._done = False
+
+    def pending(self) -> bool:
+        return not self._done
+
+    def take(self, side: int) -> Optional[QImage]:
+        self._done = True
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid() and min(size.width(), size.height()) > side:
+            f = side / min(size.width(), size.height())
+            reader.setScaledSize(size * f)
+        img = reader.read()
+        if img.isNull():
+            return None
+        self.received += 1
+        self.taken += 1
+        return fit_square(img, side)
+
+
+class _SinkSource(FrameSource):
+    """Gemeinsam für Video und Kamera: der Dekoder schreibt in einen QVideoSink, gemerkt wird nur das letzte Bild
+    (als QVideoFrame, noch nicht umgewandelt); umgewandelt wird erst in take()."""
+
+    def __init__(self, label: str, parent=None):
+        super().__init__(label, parent)
+        from PySide6.QtMultimedia import QVideoSink
+        self.sink = QVideoSink(self)
+        self.sink.videoFrameChanged.connect(self._on_frame)
+        self._frame = None
+
+    def _on_frame(self, frame):
+        self._frame = frame
+        self.received += 1
+
+    def pending(self) -> bool:
+        return self._frame is not None
+
+    def take(self, side: int) -> Optional[QImage]:
+        frame, self._frame = self._frame, None
+        if frame is None or not frame.isValid():
+            return None
+        img = frame.toImage()
+        if img.isNull():
+            return None
+        self.taken += 1
+        return fit_square(img, side)
+
+
+class VideoFileSource(_SinkSource):
+    def __init__(self, path: str, parent=None):
+        super().__init__(Path(path).stem, parent)
+        from PySide6.QtMultimedia import QMediaPlayer
+        from quiz_blindpick_media import media_url
+        self.player = QMediaPlayer(self)   # ohne QAudioOutput: stumm
+        self.player.setVideoSink(self.sink)
+        self.player.setLoops(QMediaPlayer.Infinite)
+        self.player.setSource(media_url(path))
+
+    def start(self): self.player.play()
+    def stop(self): self.player.stop()
+
+
+class CameraSource(_SinkSource):
+    """QCamera im kleinsten Format, das den Slot noch füllt (verkleinert schon in der Kamera/im Treiber)."""
+
+    def __init__(self, device, side: int, parent=None):
+        super().__init__(device.description(), parent)
+        from PySide6.QtMultimedia import QCamera, QMediaCaptureSession
+        self.camera = QCamera(device, self)
+        fmt = _smallest_format(device, side)
+        if fmt is not None:
+            self.camera.setCameraFormat(fmt)
+        self.session = QMediaCaptureSession(self)
+        self.session.setCamera(self.camera)
+        self.session.setVideoSink(self.sink)
+
+    def start(self): self.camera.start()
+    def stop(self): self.camera.stop()
+
+
+def _smallest_format(device, side: int):
+    best = None
+    for fmt in device.videoFormats():
+        res = fmt.resolution()
+        if min(res.width(), res.height()) < side or fmt.maxFrameRate() < min(FEED_FPS, 10):
+            continue
+        if best is None or res.width() * res.height() < best.resolution().width() * best.resolution().height():
+            best = fmt
+    return best
+
+
+def make_sources(spec: str, players: List[str], side: int, parent=None) -> List[Optional[FrameSource]]:
+    """Quelle je Spieler (None = Slot bleibt leer). spec: "test", "camera" oder ein Ordner."""
+    if spec == "test":
+        return [SyntheticSource(p, hue=i * 47, parent=parent) for i, p in enumerate(players)]
+    if spec == "camera":
+        from PySide6.QtMultimedia import QMediaDevices
+        devices = list(QMediaDevices.videoInputs())
+        return [CameraSource(devices[i], side, parent) if i < len(devices) else None for i in range(len(players))]
+    folder = Path(spec)
+    if not folder.is_dir():
+        return [None] * len(players)
+    shared: Dict[Path, FrameSource] = {}
+    out: List[Optional[FrameSource]] = []
+    for p in players:
+        path = _find_file(folder, p) or _find_file(folder, "_default")
+        if path is None:
+            out.append(None)
+            continue
+        if path not in shared:
+            if path.suffix.lower() in FEED_IMAGE_EXT:
+                shared[path] = ImageSource(str(path), parent)
+            else:
+                shared[path] = VideoFileSource(str(path), parent)
+        out.append(shared[path])
+    return out
+
+
+def _find_file(folder: Path, stem: str) -> Optional[Path]:
+    for ext in FEED_IMAGE_EXT + FEED_VIDEO_EXT:
+        p = folder / f"{stem}{ext}"
+        if p.is_file():
+            return p
+    return None
+
+# ------------------------
+# Verteilung an die Slots
+# ------------------------
+
+class _Feed:
+    __slots__ = ("source", "targets", "next_due")
+
+    def __init__(self, source: FrameSource):
+        self.source = source
+        self.targets: List = []   # Widgets mit set_frame(QImage)
+        self.next_due = 0.0
+
+
+class FeedHub(QObject):
+    def __init__(self, side: int, parent=None):
+        super().__init__(parent)
+        self.side = side
+        self._feeds: List[_Feed] = []
+        self._rr = 0   # nächste Quelle (reihum, damit bei knappem Budget keine verhungert)
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(frame_interval_ms())
+        self._timer.timeout.connect(self._tick)
+        self.frames = 0      # verteilte Bilder
+        self.deferred = 0    # fällige Quellen, die wegen des Budgets auf den nächsten Takt warten mussten
+        self.busy_s = 0.0    # Summe Umwandeln/Verkleinern
+
+    def attach(self, source: Optional[FrameSource], widget):
+        if source is None:
+            return
+        for feed in self._feeds:
+            if feed.source is source:
+                break
+        else:
+            feed = _Feed(source)
+            self._feeds.append(feed)
+            source.start()
+        feed.targets.append(widget)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def clear(self):
+        """Alle Quellen anhalten und freigeben, Slots leeren."""
+        self._timer.stop()
+        for feed in self._feeds:
+            feed.source.stop()
+            feed.source.deleteLater()
+            for w in feed.targets:
+                w.set_frame(None)
+        self._feeds = []
+        self._rr = 0
+
+    def _tick(self):
+        n = len(self._feeds)
+        if not n:
+            return
+        now = time.perf_counter()
+        deadline = now + FEED_BUDGET_MS / 1000.0
+        period = 1.0 / FEED_FPS
+        for k in range(n):
+            i = (self._rr + k) % n
+            feed = self._feeds[i]
+            if now < feed.next_due or not feed.source.pending():
+                continue
+            if time.perf_counter() >= deadline:
+                self.deferred += 1
+                self._rr = i   # hier geht es im nächsten Takt weiter
+                break
+            t0 = time.perf_counter()
+            img = feed.source.take(self.side)
+            self.busy_s += time.perf_counter() - t0
+            feed.next_due = max(feed.next_due + period, now)   # Takt halten, nach Pausen nicht nachholen
+            if img is None:
+                continue
+            for w in feed.targets:
+                w.set_frame(img)   # dasselbe QImage für alle (implizit geteilt)
+            self.frames += 1
+        else:
+            self._rr = (self._rr + 1) % n
+
+    def stats(self) -> Dict[str, float]:
+        received = sum(f.source.received for f in self._feeds)
+        taken = sum(f.source.taken for f in self._feeds)
+        return {"sources": len(self._feeds), "slots": sum(len(f.targets) for f in self._feeds), "frames": self.frames,
+                "dropped": received - taken, "deferred": self.deferred, "busy_ms": round(self.busy_s * 1000.0, 3)}
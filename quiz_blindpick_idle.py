@@ -0,0 +1,59 @@
+# quiz_blindpick_idle.py
+# Arbeit in Leerlauf-Häppchen für die GUI
+# - IdleQueue: führt Generator-Jobs schrittweise über einen 0-ms-QTimer aus (je Takt höchstens IDLE_SLICE_MS),
+#   Eingaben und Repaints kommen zwischen den Häppchen dran
+# - Jobs haben einen Schlüssel: neuer Job ersetzt den alten, finish() erledigt den Rest sofort (wenn das Ergebnis gebraucht wird)
+# - Verwendet für das Vorbereiten der nächsten Runde (Raster im Moderator- und Zuschauerfenster)
+
+from __future__ import annotations
+
+import time
+from typing import Dict, Generator, Hashable
+
+from PySide6.QtCore import QObject, QTimer
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+IDLE_SLICE_MS = 4     # Rechenzeit je Timer-Takt (ms), danach kommt die Event-Loop wieder dran — hier anpassen
+# =========================
+
+
+class IdleQueue(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs: Dict[Hashable, Generator] = {}
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._step)
+
+    def submit(self, key: Hashable, job: Generator):
+        self._jobs.pop(key, None)
+        self._jobs[key] = job
+        self._timer.start()
+
+    def cancel(self, key: Hashable):
+        job = self._jobs.pop(key, None)
+        if job is not None:
+            job.close()
+
+    def pending(self, key: Hashable) -> bool:
+        return key in self._jobs
+
+    def finish(self, key: Hashable):
+        """Rest des Jobs sofort ausführen (z.B. Klick kommt vor dem Leerlauf)."""
+        job = self._jobs.pop(key, None)
+        if job is not None:
+            for _ in job:
+                pass
+
+    def _step(self):
+        deadline = time.perf_counter() + IDLE_SLICE_MS / 1000.0
+        while self._jobs and time.perf_counter() < deadline:
+            key = next(iter(self._jobs))
+            try:
+                next(self._jobs[key])
+            except StopIteration:
+                del self._jobs[key]
+        if not self._jobs:
+            self._timer.stop()
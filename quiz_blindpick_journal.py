@@ -0,0 +1,265 @@
+# quiz_blindpick_journal.py
+# Autosave-Journal für den Runden-Editor
+# - Jede Änderung (Felder, Einfügen, Löschen, Verschieben) wird als eine JSON-Zeile angehängt (append-only)
+# - Kopfzeile beschreibt die Basis: gespeicherte Datei ("file") oder Autosave-Snapshot ("snapshot", z.B. ungespeichertes Dokument)
+# - Kompaktierung: aktueller Stand als neuer Snapshot (Template-Format), danach wird das Journal atomar ersetzt
+# - Wiederherstellung: Basis laden, nur die Operationen seit der letzten Kompaktierung erneut anwenden
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Callable, Dict, List, MutableSequence, Optional, Sequence, Tuple
+
+from quiz_blindpick_save import atomic_write_json, template_payload
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+JOURNAL_SUFFIX = ".journal"              # Journal neben dem Template (<template>.journal) — hier anpassen
+SNAPSHOT_SUFFIX = ".snapshot.json"       # Autosave-Snapshot neben dem Journal — hier anpassen
+JOURNAL_COMPACT_OPS = 500                # nach so vielen Operationen kompaktieren — hier anpassen
+JOURNAL_COMPACT_INTERVAL_S = 120         # spätestens nach dieser Zeit kompaktieren (falls Änderungen) — hier anpassen
+JOURNAL_FSYNC = True                     # jede Operation sofort auf die Platte bringen — hier anpassen
+UNTITLED_JOURNAL = os.path.join(os.path.expanduser("~"), ".blindpick-editor-unsaved.journal")
+SESSION_FILE = os.path.join(os.path.expanduser("~"), ".blindpick-editor-session")  # Zeiger auf das offene Journal
+# =========================
+
+JOURNAL_VERSION = 1
+
+
+def journal_path_for(document: Optional[str]) -> str:
+    return document + JOURNAL_SUFFIX if document else UNTITLED_JOURNAL
+
+
+def snapshot_path_for(journal: str, seq: int) -> str:
+    # fortlaufende Nummer: der alte Snapshot bleibt gültig, bis das neue Journal ihn ablöst
+    return f"{journal}.{seq}{SNAPSHOT_SUFFIX}"
+
+
+def file_key(path: str) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+# ------------------------
+# Sitzungszeiger (welches Journal war beim Absturz offen?)
+# ------------------------
+
+def session_journal() -> Optional[str]:
+    try:
+        with open(SESSION_FILE, "r", encoding="utf-8") as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    return path if path and os.path.exists(path) else None
+
+
+def _set_session(journal: str):
+    try:
+        with open(SESSION_FILE, "w", encoding="utf-8") as f:
+            f.write(journal)
+    except OSError:
+        pass  # ohne Zeiger bleibt die Wiederherstellung beim Öffnen der Datei möglich
+
+
+def _clear_session(journal: str):
+    try:
+        with open(SESSION_FILE, "r", encoding="utf-8") as f:
+            current = f.read().strip()
+        if current == journal:
+            os.remove(SESSION_FILE)
+    except OSError:
+        pass
+
+# ------------------------
+# Lesen / Anwenden
+# ------------------------
+
+def read_journal(path: str) -> Tuple[Dict, List[Dict]]:
+    """Liefert Kopfzeile und Operationen; eine beim Absturz abgeschnittene letzte Zeile wird ignoriert."""
+    ops: List[Dict] = []
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            header = json.loads(f.readline())
+        except ValueError:
+            raise ValueError("Journal ohne gültige Kopfzeile") from None
+        if not isinstance(header, dict) or header.get("journal") != JOURNAL_VERSION:
+            raise ValueError("Unbekanntes Journal-Format")
+        for line in f:
+            try:
+                op = json.loads(line)
+            except ValueError:
+                break
+            if isinstance(op, dict):
+                ops.append(op)
+    return header, ops
+
+
+def apply_ops(rounds: MutableSequence, ops: Sequence[Dict], factory: Callable) -> Tuple[int, Optional[str]]:
+    """Wendet Operationen der Reihe nach an; liefert (Anzahl angewendet, Fehlermeldung oder None)."""
+    for n, op in enumerate(ops):
+        kind = op.get("op")
+        try:
+            if kind == "set":
+                rounds[op["i"]] = factory(*op["r"])
+            elif kind == "ins":
+                rounds.insert(op["i"], factory(*op["r"]))
+            elif kind == "del":
+                del rounds[op["i"]]
+            elif kind == "mov":
+                s, d = op["s"], op["d"]
+                if hasattr(rounds, "move"):
+                    rounds.move(s, d)  # RoundStore: nur Position ändern
+                else:
+                    rounds.insert(d, rounds.pop(s))
+            else:
+                raise ValueError(f"unbekannte Operation {kind!r}")
+        except (IndexError, KeyError, TypeError, ValueError) as e:
+            return n, f"Änderung {n + 1} von {len(ops)} nicht anwendbar: {e}"
+    return len(ops), None
+
+
+def read_snapshot(path: str) -> List[Tuple[str, str, str]]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [(r.get("title") or "", r.get("video") or "", r.get("truth") or "") for r in data.get("rounds", [])]
+
+
+def write_snapshot(path: str, rows: Sequence[Tuple[str, str, str]]):
+    """Schreibt den Snapshot im Template-Format (kompakt, atomar)."""
+    atomic_write_json(path, template_payload(rows), separators=(",", ":"))
+
+
+def discard_journal(journal: str):
+    paths = [journal]
+    try:
+        header, _ = read_journal(journal)
+        if header.get("base") == "snapshot":
+            paths.append(snapshot_path_for(journal, header.get("seq", 0)))
+    except (OSError, ValueError):
+        pass
+    for p in paths:
+        try:
+            os.remove(p)
+        except OSError:
+            pass
+    _clear_session(journal)
+
+# ------------------------
+# Schreiben
+# ------------------------
+
+class Journal:
+    """Offenes Journal eines Dokuments. `ops` zählt die Operationen seit der Basis,
+    `dropped` die per rebase() entfernten; `epoch` ändert sich bei jeder Kompaktierung."""
+
+    def __init__(self, path: str, header: Dict, ops: Sequence[Dict] = ()):
+        self.path = path
+        self.header = dict(header, journal=JOURNAL_VERSION)
+        self.ops = len(ops)
+        self.dropped = 0
+        self.epoch = 0
+        self._f = None
+        self._rewrite(self.header, ops)
+        _set_session(path)
+
+    @classmethod
+    def start(cls, document: Optional[str], rows: Optional[Sequence] = None) -> "Journal":
+        """Neues Journal. Basis ist die gespeicherte Datei; mit `rows` (Dokument ohne gespeicherten Stand)
+        wird zuerst ein Snapshot geschrieben."""
+        path = journal_path_for(document)
+        discard_journal(path)  # Reste eines verworfenen Journals (inkl. Snapshot) entfernen
+        if rows is None:
+            return cls(path, {"document": document, "base": "file", "key": file_key(document)})
+        write_snapshot(snapshot_path_for(path, 1), rows)
+        return cls(path, {"document": document, "base": "snapshot", "key": None, "seq": 1})
+
+    @staticmethod
+    def _line(rec: Dict) -> str:
+        return json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    def _rewrite(self, header: Dict, ops: Sequence[Dict]):
+        # Kopf + Operationen in eine temporäre Datei, dann rename: nie ein halbes Journal auf der Platte
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self._line(header))
+            f.writelines(self._line(op) for op in ops)
+            f.flush()
+            os.fsync(f.fileno())
+        if self._f is not None:
+            self._f.close()
+        os.replace(tmp, self.path)
+        self._f = open(self.path, "a", encoding="utf-8")
+
+    def _write(self, rec: Dict):
+        self._f.write(self._line(rec))
+        self._f.flush()
+        if JOURNAL_FSYNC:
+            os.fsync(self._f.fileno())
+
+    def append(self, op: Dict):
+        self._write(op)
+        self.ops += 1
+
+    def compact(self, rows: Sequence):
+        """Aktuellen Stand als Snapshot sichern und das Journal leeren.
+        Reihenfolge: neuer Snapshot, dann neues Journal per rename; ein Absturz dazwischen lässt
+        altes Journal + alten Snapshot zusammenpassend zurück."""
+        old = self.header
+        seq = old.get("seq", 0) + 1
+        write_snapshot(snapshot_path_for(self.path, seq), rows)
+        header = dict(old, base="snapshot", key=None, seq=seq)
+        self._rewrite(header, ())
+        self.header = header
+        self.ops = 0
+        self.epoch += 1
+        if old.get("base") == "snapshot":
+            try:
+                os.remove(snapshot_path_for(self.path, old.get("seq", 0)))
+            except OSError:
+                pass
+
+    def mark(self) -> Tuple[int, int]:
+        """Stand für ein späteres rebase() (z.B. beim Abschicken eines Speichervorgangs)."""
+        return self.epoch, self.dropped + self.ops
+
+    def rebase(self, document: str, mark: Optional[Tuple[int, int]]) -> bool:
+        """`document` enthält jetzt den Stand bei `mark` (None = Journalbeginn): Basis auf die Datei umstellen
+        und nur spätere Operationen behalten. Liefert False, wenn nichts übrig bleibt (Journal verworfen)."""
+        if mark is not None and mark[0] != self.epoch:
+            return True  # inzwischen kompaktiert: der neuere Snapshot ist bereits eine gültige Basis
+        skip = 0 if mark is None else mark[1] - self.dropped
+        _, ops = read_journal(self.path)
+        rest = ops[skip:]
+        if not rest:
+            self.discard()
+            return False
+        old_path, old_header = self.path, self.header
+        self.path = journal_path_for(document)
+        self.header = {"document": document, "base": "file", "key": file_key(document), "journal": JOURNAL_VERSION}
+        if self.path != old_path:
+            self._f.close()
+            self._f = None
+        self._rewrite(self.header, rest)
+        self.dropped += skip
+        self.ops = len(rest)
+        if self.path != old_path:
+            discard_journal(old_path)
+            _set_session(self.path)
+        elif old_header.get("base") == "snapshot":
+            try:
+                os.remove(snapshot_path_for(self.path, old_header.get("seq", 0)))
+            except OSError:
+                pass
+        return True
+
+    def close(self):
+        if not self._f.closed:
+            self._f.close()
+
+    def discard(self):
+        self.close()
+        discard_journal(self.path)
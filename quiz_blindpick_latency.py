@@ -0,0 +1,211 @@
+# quiz_blindpick_latency.py
+# Latenz-Messung für das Moderatorfenster (opt-in, siehe LATENCY_OVERLAY in quiz_blindpick.py bzw. QUIZ_LATENCY=1)
+# - LatencyMonitor.wrap(name, fn): misst die Dauer eines Slots und die Zeit bis die Event-Loop wieder frei ist
+# - Heartbeat-Timer: jede Verspätung > STALL_THRESHOLD_MS gilt als Hänger der GUI-Event-Loop
+# - LatencyPanel: kleine Live-Anzeige (p50/p95/max je Slot + Histogramm), aktualisiert im festen Takt
+# - Trace je Sitzung im Chrome-Trace-Format (chrome://tracing, ui.perfetto.dev)
+
+from __future__ import annotations
+
+import bisect
+import functools
+import os
+import statistics
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Qt, QRectF
+from PySide6.QtGui import QColor, QPainter
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSizePolicy
+
+from quiz_blindpick_save import atomic_write_json
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+HEARTBEAT_MS = 16                  # Takt des Heartbeat-Timers (ms, ~1 Frame) — hier anpassen
+STALL_THRESHOLD_MS = 50            # Verspätung ab der ein Hänger gezählt wird (ms) — hier anpassen
+LATENCY_WINDOW = 500               # letzte Messwerte je Slot für p50/p95 — hier anpassen
+PANEL_REFRESH_MS = 500             # Aktualisierung der Anzeige (ms) — hier anpassen
+BUCKETS_MS = (1, 2, 4, 8, 16, 33, 66, 133, 266, 533, 1000)  # Histogramm-Grenzen (ms) — hier anpassen
+TRACE_DIR = os.path.join(os.path.expanduser("~"), ".blindpick-traces")  # Ablage der Trace-Dateien — hier anpassen
+TRACE_MAX_EVENTS = 200_000         # ältere Trace-Einträge werden verworfen — hier anpassen
+# =========================
+
+STALL = "Event-Loop-Hänger"
+IDLE_SUFFIX = " bis Leerlauf"
+
+
+class _Series:
+    __slots__ = ("recent", "buckets", "count", "max")
+
+    def __init__(self):
+        self.recent: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.buckets: List[int] = [0] * (len(BUCKETS_MS) + 1)  # letzter Eimer: > BUCKETS_MS[-1]
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, ms: float):
+        self.recent.append(ms)
+        self.buckets[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        if ms > self.max:
+            self.max = ms
+
+    def quantiles(self):
+        if len(self.recent) < 2:
+            v = self.recent[0] if self.recent else 0.0
+            return v, v
+        q = statistics.quantiles(self.recent, n=20, method="inclusive")
+        return q[9], q[18]   # p50, p95
+
+
+class LatencyMonitor(QObject):
+    """Sammelt Slot-Dauern und Event-Loop-Hänger; alle Zeiten in ms relativ zum Start."""
+
+    def __init__(self, parent=None, session: str = "blindpick"):
+        super().__init__(parent)
+        self.session = session
+        self.t0 = time.perf_counter()
+        self.series: Dict[str, _Series] = {}
+        self.trace: Deque[Dict] = deque(maxlen=TRACE_MAX_EVENTS)
+        self._depth = 0
+        self._last_beat = time.perf_counter()
+        self.heartbeat = QTimer(self)
+        self.heartbeat.setTimerType(Qt.PreciseTimer)
+        self.heartbeat.setInterval(HEARTBEAT_MS)
+        self.heartbeat.timeout.connect(self._beat)
+        self.heartbeat.start()
+
+    def _record(self, name: str, cat: str, start: float, end: float):
+        ms = (end - start) * 1000.0
+        self.series.setdefault(name, _Series()).add(ms)
+        self.trace.append({"name": name, "cat": cat, "ph": "X", "pid": 1, "tid": 1,
+                           "ts": round((start - self.t0) * 1e6), "dur": round(ms * 1000)})
+
+    def _beat(self):
+        now = time.perf_counter()
+        late = (now - self._last_beat) * 1000.0 - HEARTBEAT_MS
+        if late > STALL_THRESHOLD_MS:
+            self._record(STALL, "stall", self._last_beat + HEARTBEAT_MS / 1000.0, now)
+        self._last_beat = now
+
+    def wrap(self, name: str, fn: Callable) -> Callable:
+        """Slot-Wrapper: misst den Aufruf selbst und (nur äußerster Aufruf) die Zeit bis zum nächsten Leerlauf."""
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            self._depth += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._depth -= 1
+                self._record(name, "slot", start, time.perf_counter())
+                if self._depth == 0:
+                    QTimer.singleShot(0, lambda: self._record(name + IDLE_SUFFIX, "idle", start, time.perf_counter()))
+        return timed
+
+    def summary(self) -> Dict[str, Dict]:
+        out = {}
+        for name, s in self.series.items():
+            p50, p95 = s.quantiles()
+            out[name] = {"count": s.count, "p50_ms": round(p50, 3), "p95_ms": round(p95, 3),
+                         "max_ms": round(s.max, 3), "buckets": list(s.buckets)}
+        return out
+
+    def export(self, path: Optional[str] = None) -> str:
+        """Schreibt den Trace (Chrome-Trace-Format + Zusammenfassung) und liefert den Pfad."""
+        if path is None:
+            os.makedirs(TRACE_DIR, exist_ok=True)
+            path = os.path.join(TRACE_DIR, f"{self.session}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        atomic_write_json(path, {
+            "traceEvents": list(self.trace),
+            "displayTimeUnit": "ms",
+            "metadata": {"session": self.session, "heartbeat_ms": HEARTBEAT_MS,
+                         "stall_threshold_ms": STALL_THRESHOLD_MS, "buckets_ms": list(BUCKETS_MS),
+                         "summary": self.summary()},
+        }, separators=(",", ":"))
+        return path
+
+    def stop(self):
+        self.heartbeat.stop()
+
+
+class _Histogram(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buckets: List[int] = []
+        self.setMinimumHeight(48)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+    def set_buckets(self, buckets: List[int]):
+        if buckets != self.buckets:
+            self.buckets = list(buckets)
+            self.update()
+
+    def paintEvent(self, _e):
+        if not self.buckets:
+            return
+        p = QPainter(self)
+        peak = max(self.buckets) or 1
+        w = self.width() / len(self.buckets)
+        h = self.height() - 2
+        for i, n in enumerate(self.buckets):
+            bh = h * n / peak
+            # grün bis 1 Frame, gelb bis Hänger-Schwelle, sonst rot
+            edge = BUCKETS_MS[i] if i < len(BUCKETS_MS) else float("inf")
+            color = "#2e7d32" if edge <= 16 else ("#f9a825" if edge <= STALL_THRESHOLD_MS else "#c62828")
+            p.fillRect(QRectF(i * w + 1, h - bh + 1, w - 2, bh), QColor(color))
+        p.end()
+
+
+class LatencyPanel(QWidget):
+    """Live-Anzeige für einen LatencyMonitor (Tabelle als Text + Histogramm aller Slots)."""
+
+    def __init__(self, monitor: LatencyMonitor, parent=None):
+        super().__init__(parent)
+        self.monitor = monitor
+        v = QVBoxLayout(self)
+        v.setContentsMargins(4, 4, 4, 4)
+        self.lbl = QLabel("Noch keine Messwerte")
+        self.lbl.setTextFormat(Qt.PlainText)
+        self.lbl.setObjectName("latencyTable")  # Schrift aus dem App-Theme (quiz_blindpick_theme.py)
+        v.addWidget(self.lbl)
+        self.hist = _Histogram()
+        v.addWidget(self.hist)
+        row = QHBoxLayout()
+        self.lbl_trace = QLabel("")
+        self.btn_export = QPushButton("Trace exportieren")
+        self.btn_export.clicked.connect(self._export)
+        row.addWidget(self.lbl_trace, 1)
+        row.addWidget(self.btn_export)
+        v.addLayout(row)
+        self.timer = QTimer(self)
+        self.timer.setInterval(PANEL_REFRESH_MS)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start()
+
+    def refresh(self):
+        summary = self.monitor.summary()
+        if not summary:
+            return
+        lines = [f"{'Slot':28} {'n':>5} {'p50':>7} {'p95':>7} {'max':>7}"]
+        total = [0] * (len(BUCKETS_MS) + 1)
+        for name in sorted(summary):
+            s = summary[name]
+            lines.append(f"{name[:28]:28} {s['count']:>5} {s['p50_ms']:>7.1f} {s['p95_ms']:>7.1f} {s['max_ms']:>7.1f}")
+            if name != STALL and not name.endswith(IDLE_SUFFIX):
+                total = [a + b for a, b in zip(total, s["buckets"])]
+        self.lbl.setText("\n".join(lines))
+        self.hist.set_buckets(total)
+        self.hist.setToolTip("Slot-Dauern (ms): " + " | ".join(
+            f"≤{b}: {n}" for b, n in zip(BUCKETS_MS, total)) + f" | >{BUCKETS_MS[-1]}: {total[-1]}")
+
+    def _export(self):
+        try:
+            path = self.monitor.export()
+        except OSError as e:
+            self.lbl_trace.setText(f"Export fehlgeschlagen: {e}")
+            return
+        self.lbl_trace.setText(f"Trace: {path}")
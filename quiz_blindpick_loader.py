@@ -0,0 +1,253 @@
+# quiz_blindpick_loader.py
+# Streamender Template-Loader für sehr große Rundendateien
+# - iter_template: liest {"quiz_type": ..., "rounds": [...]} blockweise und liefert Runde für Runde
+# - TemplateLoader: QThread mit Fortschritt, Abbrechen und Validierung pro Runde (GUI bleibt bedienbar)
+# - LazyRounds: Sequenz aus kompakten Tupeln, Objekte (RoundTemplate/Round) entstehen erst beim Zugriff
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import MutableSequence
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from PySide6.QtCore import QThread, Signal
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+CHUNK_SIZE = 1 << 16        # Lesegröße pro Block (Bytes) — hier anpassen
+BATCH_SIZE = 500            # Runden pro Batch-Signal — hier anpassen
+BATCH_INTERVAL_S = 0.05     # spätestens nach dieser Zeit wird ein Batch gesendet — hier anpassen
+# =========================
+
+_WS = " \t\r\n"
+
+
+class TemplateFormatError(ValueError):
+    pass
+
+
+def iter_template(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[str, object, object]]:
+    """Liefert ("meta", key, value) für Top-Level-Felder, ("round", index, obj) je Runde
+    und ("progress", gelesene_bytes, gesamt_bytes) nach jedem gelesenen Block."""
+    total = os.path.getsize(path)
+    dec = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        base = 0          # absoluter Zeichen-Offset von buf[0] (für Fehlermeldungen)
+        read = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buf, pos, base, read, eof
+            if eof:
+                return False
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            if pos > len(buf) // 2:
+                base += pos
+                buf = buf[pos:]
+                pos = 0
+            buf += chunk
+            read = f.buffer.tell()
+            return True
+
+        def peek() -> str:
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in _WS:
+                    pos += 1
+                if pos < len(buf):
+                    return buf[pos]
+                if not fill():
+                    return ""
+
+        def expect(ch: str):
+            nonlocal pos
+            c = peek()
+            if c != ch:
+                raise TemplateFormatError(f"Erwartet '{ch}' bei Zeichen {base + pos}, gefunden {c or 'Dateiende'!r}")
+            pos += 1
+
+        def value():
+            nonlocal pos
+            peek()
+            while True:
+                try:
+                    obj, end = dec.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if fill():
+                        continue
+                    raise TemplateFormatError(f"Ungültiges JSON bei Zeichen {base + e.pos}: {e.msg}") from None
+                # Zahl/Literal am Pufferende könnte abgeschnitten sein -> erst nachladen
+                if end == len(buf) and not eof and fill():
+                    continue
+                pos = end
+                return obj
+
+        expect("{")
+        index = 0
+        if peek() == "}":
+            return
+        while True:
+            key = value()
+            if not isinstance(key, str):
+                raise TemplateFormatError(f"Ungültiger Schlüssel bei Zeichen {base + pos}")
+            expect(":")
+            if key == "rounds" and peek() == "[":
+                pos += 1
+                if peek() == "]":
+                    pos += 1
+                else:
+                    last = -1
+                    while True:
+                        yield ("round", index, value())
+                        index += 1
+                        if read != last:
+                            last = read
+                            yield ("progress", read, total)
+                        c = peek()
+                        pos += 1
+                        if c == "]":
+                            break
+                        if c != ",":
+                            raise TemplateFormatError(f"Erwartet ',' oder ']' in 'rounds' bei Zeichen {base + pos - 1}")
+            else:
+                yield ("meta", key, value())
+            c = peek()
+            pos += 1
+            if c == "}":
+                break
+            if c != ",":
+                raise TemplateFormatError(f"Erwartet ',' oder '}}' bei Zeichen {base + pos - 1}")
+        yield ("progress", total, total)
+
+
+def check_round_fields(index: int, raw) -> Tuple[Optional[Dict[str, str]], List[str]]:
+    """Prüft eine Runde; liefert die Textfelder (fehlende leer) und Warnungen."""
+    n = index + 1
+    if not isinstance(raw, dict):
+        return None, [f"Runde {n}: kein Objekt — übersprungen"]
+    warnings = []
+    out: Dict[str, str] = {}
+    for key, val in raw.items():
+        if val is None or isinstance(val, str):
+            out[key] = val or ""
+        elif isinstance(val, (int, float, bool)):
+            out[key] = str(val)
+            warnings.append(f"Runde {n}: '{key}' ist kein Text — umgewandelt")
+        else:
+            warnings.append(f"Runde {n}: '{key}' hat ungültigen Typ — ignoriert")
+    return out, warnings
+
+# ------------------------
+# Lazy-Sequenz
+# ------------------------
+
+class LazyRounds(MutableSequence):
+    """Hält Runden als Tupel; beim ersten Zugriff wird factory(*tupel) erzeugt und gemerkt."""
+
+    def __init__(self, factory: Callable, raw: Optional[List[tuple]] = None):
+        self._factory = factory
+        self._items: List[object] = list(raw or [])
+
+    def extend_raw(self, raw: List[tuple]):
+        self._items.extend(raw)
+
+    def rows(self, to_tuple: Callable[[object], tuple]) -> List[tuple]:
+        """Alle Einträge als Tupel (Snapshot), ohne noch nicht benutzte Objekte zu erzeugen."""
+        return [it if type(it) is tuple else to_tuple(it) for it in self._items]
+
+    def raw_at(self, i: int):
+        """Eintrag ohne ihn zu erzeugen: Tupel oder (falls schon benutzt) das Objekt."""
+        return self._items[i]
+
+    def _materialize(self, i: int):
+        it = self._items[i]
+        if type(it) is tuple:
+            it = self._factory(*it)
+            self._items[i] = it
+        return it
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._materialize(k) for k in range(*i.indices(len(self._items)))]
+        if i < 0:
+            i += len(self._items)
+        return self._materialize(i)
+
+    def __setitem__(self, i, value):
+        self._items[i] = value
+
+    def __delitem__(self, i):
+        del self._items[i]
+
+    def insert(self, i: int, value):
+        self._items.insert(i, value)
+
+# ------------------------
+# Loader-Thread
+# ------------------------
+
+class TemplateLoader(QThread):
+    meta = Signal(str, object)          # Top-Level-Feld (z.B. quiz_type)
+    batch = Signal(list)                # Liste normalisierter Tupel
+    progress = Signal(int, int)         # gelesene Bytes, Gesamtbytes
+    finished_ok = Signal(int, list)     # Anzahl Runden, Warnungen
+    failed = Signal(str)
+
+    def __init__(self, path: str, normalize: Callable[[int, Dict[str, str]], tuple], parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.normalize = normalize
+        self._cancel = False
+
+    def cancel(self):
+        self._cancel = True
+
+    def run(self):
+        warnings: List[str] = []
+        pending: List[tuple] = []
+        count = 0
+        last_emit = time.monotonic()
+        first = True
+        try:
+            for kind, a, b in iter_template(self.path):
+                if self._cancel:
+                    return
+                if kind == "round":
+                    fields, w = check_round_fields(a, b)
+                    warnings.extend(w)
+                    if fields is None:
+                        continue
+                    pending.append(self.normalize(a, fields))
+                    count += 1
+                    now = time.monotonic()
+                    # erste Runde sofort, danach gebündelt
+                    if first or len(pending) >= BATCH_SIZE or now - last_emit >= BATCH_INTERVAL_S:
+                        self.batch.emit(pending)
+                        pending = []
+                        last_emit = now
+                        first = False
+                elif kind == "meta":
+                    self.meta.emit(a, b)
+                else:
+                    self.progress.emit(a, b)
+        except (OSError, UnicodeDecodeError, TemplateFormatError) as e:
+            if pending:
+                self.batch.emit(pending)
+            self.failed.emit(str(e))
+            return
+        if self._cancel:
+            return
+        if pending:
+            self.batch.emit(pending)
+        self.finished_ok.emit(count, warnings)
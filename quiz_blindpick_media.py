@@ -0,0 +1,131 @@
+# quiz_blindpick_media.py
+# Doppelt gepufferte Medienwiedergabe für das Zuschauerfenster
+# - MediaDeck: mehrere QMediaPlayer (+ QAudioOutput + QVideoWidget) in einem QStackedWidget
+# - Ein Deck ist aktiv (sichtbar/hörbar), die übrigen laden im Hintergrund das nächste/vorige Video vor
+# - Rundenwechsel tauscht nur das sichtbare Deck, statt live Öffnen/Demuxen/ersten Frame abzuwarten
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional
+
+from PySide6.QtCore import QUrl
+from PySide6.QtWidgets import QStackedWidget
+from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+from PySide6.QtMultimediaWidgets import QVideoWidget
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+MEDIA_DECKS = 3   # aktives Deck + Standby für nächste und vorige Runde — hier anpassen
+# =========================
+
+def media_url(path: str) -> QUrl:
+    if not path:
+        return QUrl()
+    return QUrl.fromLocalFile(str(Path(path).absolute()))
+
+
+class _Deck:
+    """Ein Player samt Ausgabe; `path` merkt sich, was geladen ist."""
+
+    def __init__(self, parent: QStackedWidget):
+        self.widget = QVideoWidget()
+        self.player = QMediaPlayer(parent)
+        self.audio = QAudioOutput(parent)
+        self.player.setAudioOutput(self.audio)
+        self.player.setVideoOutput(self.widget)
+        self.path: Optional[str] = None
+        self.prime_pending = False
+        self.player.mediaStatusChanged.connect(self._on_status)
+
+    def load(self, path: str, standby: bool):
+        self.path = path
+        self.audio.setMuted(standby)
+        self.prime_pending = standby
+        self.player.setSource(media_url(path))
+
+    def _on_status(self, status):
+        # Standby: nach dem Laden pausieren, damit der erste Frame bereits dekodiert ist
+        if self.prime_pending and status == QMediaPlayer.MediaStatus.LoadedMedia:
+            self.prime_pending = False
+            self.player.pause()
+
+
+class MediaDeck(QStackedWidget):
+    def __init__(self, parent=None, decks: int = MEDIA_DECKS):
+        super().__init__(parent)
+        self._decks: List[_Deck] = []
+        for _ in range(max(1, decks)):
+            d = _Deck(self)
+            self._decks.append(d)
+            self.addWidget(d.widget)
+        self._active = self._decks[0]
+        self._volume = 1.0
+        self._lru: List[_Deck] = list(self._decks)  # vorne = am längsten ungenutzt
+
+    # Zugriff auf das aktive Deck (für Kompatibilität mit bestehendem Code)
+    @property
+    def player(self) -> QMediaPlayer:
+        return self._active.player
+
+    @property
+    def audio(self) -> QAudioOutput:
+        return self._active.audio
+
+    def _touch(self, deck: _Deck):
+        self._lru.remove(deck)
+        self._lru.append(deck)
+
+    def _find(self, path: str) -> Optional[_Deck]:
+        for d in self._decks:
+            if d.path == path:
+                return d
+        return None
+
+    def _free_deck(self, keep: List[str]) -> Optional[_Deck]:
+        for d in self._lru:
+            if d is not self._active and d.path not in keep:
+                return d
+        return None
+
+    def show_video(self, path: str):
+        """Macht `path` zum aktiven Video; vorgeladene Decks werden nur umgeschaltet."""
+        deck = self._find(path)
+        if deck is self._active:
+            return
+        if deck is None:
+            deck = self._free_deck(keep=[]) or self._active
+            deck.load(path, standby=False)
+        if deck is not self._active:
+            # altes Deck bleibt auf dem ersten Frame stehen (schneller Rücksprung "← Runde")
+            self._active.audio.setMuted(True)
+            self._active.player.pause()
+            self._active.player.setPosition(0)
+        deck.prime_pending = False
+        deck.audio.setMuted(False)
+        deck.audio.setVolume(self._volume)
+        self._active = deck
+        self._touch(deck)
+        self.setCurrentWidget(deck.widget)
+
+    def preload(self, paths: List[str]):
+        """Lädt die angegebenen Videos in freie Standby-Decks (nicht sichtbar, stumm)."""
+        wanted = [p for p in dict.fromkeys(paths) if p]
+        for path in wanted:
+            if self._find(path) is not None:
+                continue
+            deck = self._free_deck(keep=wanted)
+            if deck is None:
+                return
+            deck.load(path, standby=True)
+            self._touch(deck)
+
+    def set_volume(self, vol: float):
+        self._volume = vol
+        for d in self._decks:
+            d.audio.setVolume(vol)
+
+    def play(self): self._active.player.play()
+    def pause(self): self._active.player.pause()
+    def stop(self): self._active.player.stop()
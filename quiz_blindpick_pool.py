@@ -0,0 +1,74 @@
+# quiz_blindpick_pool.py
+# Wiederverwendbare Widgets statt deleteLater + Neubau in jeder Runde
+# - WidgetPool: Freiliste je Art ("answerRow", "pickBox", …); acquire() nimmt ein geparktes Objekt oder baut eins über die Factory,
+#   release() setzt es zurück (reset) und hängt es an ein unsichtbares Parkplatz-Widget des Besitzers
+# - park=False (ganze Raster-Seiten): nur verstecken, das Widget bleibt an seinem Container — Umhängen eines Teilbaums
+#   kostet bei aktivem App-Stylesheet mehrere ms (alle Kinder werden neu poliert)
+# - Objekte sind QWidgets/QObjects oder kleine Halter mit Attribut "widget" (z.B. Zeilenrahmen samt Labels)
+# - Nach der ersten Runde (aktuelles + vorbereitetes Raster) entstehen keine neuen Widgets mehr; stats() zeigt das
+# - Pool gehört einem Fenster und stirbt mit ihm (geparkte Widgets sind Kinder des Parkplatzes)
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional
+
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QWidget
+
+
+class _Kind:
+    __slots__ = ("factory", "reset", "park", "free", "created", "reused")
+
+    def __init__(self, factory: Callable[[], Any], reset: Optional[Callable[[Any], None]], park: bool):
+        self.factory = factory
+        self.reset = reset
+        self.park = park
+        self.free: List[Any] = []
+        self.created = 0
+        self.reused = 0
+
+
+class WidgetPool:
+    def __init__(self, owner: QWidget):
+        self._stash = QWidget(owner)   # Parkplatz: nie sichtbar, hält geparkte Widgets am Leben
+        self._stash.hide()
+        self._kinds: Dict[str, _Kind] = {}
+
+    def register(self, kind: str, factory: Callable[[], Any], reset: Optional[Callable[[Any], None]] = None,
+                 park: bool = True):
+        self._kinds[kind] = _Kind(factory, reset, park)
+
+    def acquire(self, kind: str) -> Any:
+        k = self._kinds[kind]
+        if k.free:
+            k.reused += 1
+            return k.free.pop()
+        k.created += 1
+        return k.factory()
+
+    def release(self, kind: str, obj: Any):
+        k = self._kinds[kind]
+        if k.reset is not None:
+            k.reset(obj)
+        w = obj if isinstance(obj, QObject) else obj.widget
+        if not k.park:
+            w.hide()
+        else:
+            # Umhängen nimmt das Widget auch aus seinem Layout; nicht explizit verstecken, sonst bliebe es nach dem
+            # nächsten addWidget unsichtbar
+            w.setParent(self._stash)
+        k.free.append(obj)
+
+    def release_all(self, kind: str, objs):
+        for obj in objs:
+            self.release(kind, obj)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Je Art: erzeugt, wiederverwendet, gerade frei, gerade in Benutzung."""
+        return {
+            kind: {"created": k.created, "reused": k.reused, "free": len(k.free), "in_use": k.created - len(k.free)}
+            for kind, k in self._kinds.items()
+        }
+
+    def summary(self) -> str:
+        return ", ".join(f"{kind} {s['created']} ({s['free']} frei)" for kind, s in self.stats().items() if s["created"])
@@ -0,0 +1,237 @@
+# quiz_blindpick_probe.py
+# Hintergrund-Prüfung der Rundenvideos beim Setup
+# - probe_file: Existenz/Lesbarkeit + (falls ffprobe vorhanden) Dauer, Auflösung, Codec
+# - MediaCache: Sidecar-Datei neben dem Template, Schlüssel = Pfad + mtime + Größe
+# - MediaProber: Thread-Pool, meldet Ergebnisse gebündelt per Qt-Signal an den GUI-Thread
+#   (Cache-Abfragen inkl. stat laufen ebenfalls im Pool: ein Signal je nachgereichtem Block bzw. je geprüfter Datei)
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, Signal
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+PROBE_WORKERS = 4              # parallele Prüfungen — hier anpassen
+PROBE_TIMEOUT_S = 15           # Zeitlimit pro ffprobe-Aufruf (s) — hier anpassen
+CACHE_SUFFIX = ".media-cache.json"  # Sidecar-Datei neben dem Template — hier anpassen
+# =========================
+
+@dataclass
+class MediaInfo:
+    path: str
+    ok: bool
+    error: str = ""
+    duration: Optional[float] = None   # Sekunden
+    width: Optional[int] = None
+    height: Optional[int] = None
+    codec: str = ""
+
+    def summary(self) -> str:
+        if not self.ok:
+            return self.error
+        parts = []
+        if self.duration is not None:
+            m, s = divmod(int(round(self.duration)), 60)
+            parts.append(f"{m}:{s:02d}")
+        if self.width and self.height:
+            parts.append(f"{self.width}×{self.height}")
+        if self.codec:
+            parts.append(self.codec)
+        return ", ".join(parts) or "OK"
+
+def _file_key(path: str) -> Optional[List]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+def probe_file(path: str) -> MediaInfo:
+    if not path:
+        return MediaInfo(path=path, ok=False, error="Kein Video angegeben")
+    p = Path(path).absolute()
+    if not p.is_file():
+        return MediaInfo(path=path, ok=False, error="Datei fehlt")
+    try:
+        with open(p, "rb") as f:
+            if not f.read(1):
+                return MediaInfo(path=path, ok=False, error="Datei ist leer")
+    except OSError as e:
+        return MediaInfo(path=path, ok=False, error=f"Nicht lesbar: {e.strerror or e}")
+
+    ffprobe = shutil.which("ffprobe")
+    if not ffprobe:
+        return MediaInfo(path=path, ok=True)  # ohne ffprobe nur Existenz/Lesbarkeit
+    try:
+        out = subprocess.run(
+            [ffprobe, "-v", "error", "-select_streams", "v:0",
+             "-show_entries", "stream=codec_name,width,height:format=duration",
+             "-of", "json", str(p)],
+            capture_output=True, text=True, timeout=PROBE_TIMEOUT_S,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return MediaInfo(path=path, ok=False, error=f"ffprobe fehlgeschlagen: {e}")
+    if out.returncode != 0:
+        return MediaInfo(path=path, ok=False, error=(out.stderr.strip().splitlines() or ["Unbekanntes Format"])[-1])
+    try:
+        data = json.loads(out.stdout or "{}")
+    except ValueError:
+        data = {}
+    streams = data.get("streams") or []
+    if not streams:
+        return MediaInfo(path=path, ok=False, error="Keine Videospur gefunden")
+    s = streams[0]
+    try:
+        duration = float(data.get("format", {}).get("duration"))
+    except (TypeError, ValueError):
+        duration = None
+    return MediaInfo(path=path, ok=True, duration=duration,
+                     width=s.get("width"), height=s.get("height"), codec=s.get("codec_name") or "")
+
+# ------------------------
+# Sidecar-Cache
+# ------------------------
+
+class MediaCache:
+    def __init__(self, template_path: str):
+        self.file = Path(template_path + CACHE_SUFFIX)
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        try:
+            with open(self.file, "r", encoding="utf-8") as f:
+                self._entries = json.load(f).get("entries", {})
+        except (OSError, ValueError, AttributeError):
+            self._entries = {}
+
+    def get(self, path: str) -> Optional[MediaInfo]:
+        key = _file_key(str(Path(path).absolute())) if path else None
+        with self._lock:
+            e = self._entries.get(path)
+        if not e or key is None or e.get("key") != key:
+            return None
+        try:
+            return MediaInfo(**e["info"])
+        except (TypeError, KeyError):
+            return None
+
+    def put(self, info: MediaInfo):
+        key = _file_key(str(Path(info.path).absolute())) if info.path else None
+        if key is None:
+            return  # fehlende Dateien nicht cachen (können später auftauchen)
+        with self._lock:
+            self._entries[info.path] = {"key": key, "info": asdict(info)}
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"version": 1, "entries": dict(self._entries)}
+            self._dirty = False
+        try:
+            tmp = self.file.with_name(self.file.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp, self.file)
+        except OSError:
+            pass  # Cache ist optional (z.B. schreibgeschütztes Verzeichnis)
+
+# ------------------------
+# Prober (Qt-Anbindung)
+# ------------------------
+
+class MediaProber(QObject):
+    probed = Signal(list)          # [(Rundenindex, MediaInfo), …]
+    finished = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._cache: Optional[MediaCache] = None
+        self._pending = 0
+        self._input_open = False
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def start(self, template_path: str, videos: Optional[List[str]] = None):
+        """Beginnt eine neue Prüfung; weitere Runden können mit add() nachgereicht werden.
+        Ohne `videos` bleibt die Eingabe offen, bis close_input() aufgerufen wird."""
+        self.cancel()
+        self._generation += 1
+        self._cache = MediaCache(template_path)
+        self._pool = ThreadPoolExecutor(max_workers=PROBE_WORKERS, thread_name_prefix="media-probe")
+        with self._lock:
+            self._pending = 0
+            self._input_open = True
+        if videos is not None:
+            self.add(0, videos)
+            self.close_input()
+
+    def add(self, first_index: int, videos: List[str]):
+        if self._pool is None:
+            return
+        with self._lock:
+            self._pending += len(videos)
+        self._pool.submit(self._resolve, self._generation, self._cache, self._pool, first_index, list(videos))
+
+    def close_input(self):
+        with self._lock:
+            self._input_open = False
+            done = self._pending == 0
+        if done and self._cache is not None:
+            self._cache.save()
+            self.finished.emit()
+
+    def _resolve(self, gen: int, cache: MediaCache, pool: ThreadPoolExecutor, first_index: int, videos: List[str]):
+        # Im Pool: Cache-Treffer (stat je Datei) gesammelt melden, den Rest einzeln prüfen
+        hits = []
+        by_path: Dict[str, List[int]] = {}   # gleiche Datei nur einmal prüfen
+        for i, path in enumerate(videos, start=first_index):
+            if gen != self._generation:
+                return
+            info = cache.get(path)
+            if info is not None:
+                hits.append((i, info))
+            else:
+                by_path.setdefault(path, []).append(i)
+        for path, indices in by_path.items():
+            try:
+                pool.submit(self._run, gen, cache, path, indices)
+            except RuntimeError:
+                return  # Pool schon beendet (cancel)
+        self._report(gen, cache, hits)
+
+    def _run(self, gen: int, cache: MediaCache, path: str, indices: List[int]):
+        info = probe_file(path)
+        cache.put(info)
+        self._report(gen, cache, [(i, info) for i in indices])
+
+    def _report(self, gen: int, cache: MediaCache, results: List):
+        if gen != self._generation:
+            return
+        if results:
+            self.probed.emit(results)  # Signal wird in den GUI-Thread gequeued
+        with self._lock:
+            self._pending -= len(results)
+            done = self._pending == 0 and not self._input_open
+        if done:
+            cache.save()
+            self.finished.emit()
+
+    def cancel(self):
+        self._generation += 1
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
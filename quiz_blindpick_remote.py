@@ -0,0 +1,286 @@
+# quiz_blindpick_remote.py
+# Zuschauerfenster in eigenen Prozessen (z.B. ein Prozess je Beamer-Ausgang)
+# - RemoteAudience: gleiche Methoden wie AudienceWindow; schickt kompakte Änderungen als JSON-Zeilen über einen lokalen Socket
+#   (Aufdecken, Auswahl, Stimmenzahl je Zeile, nur geänderte Punkte, Video-Cues) — Videodekodierung/Relayout blockieren die Moderation nicht mehr
+# - Neu verbundene oder neu gestartete Anzeigen bekommen zuerst den aktuellen Stand (Spieler, Video, Raster + Änderungen, Punkte)
+# - Hinkt eine Anzeige hinterher (Sendepuffer voll), werden Änderungen ausgelassen und danach der Stand neu geschickt
+# Start einer Anzeige (macht RemoteAudience automatisch): python quiz_blindpick_remote.py --server <name> [--screen 1]
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QObject, QProcess, QTimer
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+REMOTE_MAX_BACKLOG = 4 * 1024 * 1024   # ungesendete Bytes je Anzeige, ab denen neu synchronisiert wird — hier anpassen
+REMOTE_RESTART = True                  # abgestürzte Anzeige-Prozesse neu starten — hier anpassen
+REMOTE_RESTART_DELAY_MS = 1000         # Wartezeit vor dem Neustart (ms) — hier anpassen
+REMOTE_FULLSCREEN = False              # Anzeigen im Vollbild auf ihrem Bildschirm öffnen — hier anpassen
+# =========================
+
+# Methoden, die eine Anzeige ausführen darf (= öffentliche API von AudienceWindow)
+AUDIENCE_METHODS = frozenset({
+    "configure_players", "set_video", "preload_videos", "set_volume", "play", "pause", "stop",
+    "show_waiting_center", "set_answers_grid", "reveal_answer", "update_selection", "set_votes", "set_scores",
+    "set_global_preparing", "prepare_grid", "quit",
+})
+
+
+def encode(method: str, *args) -> bytes:
+    return (json.dumps([method, *args], ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class _Client:
+    __slots__ = ("sock", "resync")
+
+    def __init__(self, sock: QLocalSocket):
+        self.sock = sock
+        self.resync = False
+
+
+class RemoteAudience(QObject):
+    """Moderatorseite: verhält sich wie AudienceWindow, rendert aber nichts selbst."""
+
+    def __init__(self, displays: int = 1, parent=None):
+        super().__init__(parent)
+        self.server_name = f"blindpick-audience-{os.getpid()}-{id(self):x}"
+        self.server = QLocalServer(self)
+        QLocalServer.removeServer(self.server_name)
+        if not self.server.listen(self.server_name):
+            raise OSError(f"Lokaler Socket nicht verfügbar: {self.server.errorString()}")
+        self.server.newConnection.connect(self._on_new_connection)
+        self.clients: List[_Client] = []
+        self.processes: List[QProcess] = []
+        self._closing = False
+
+        # Aktueller Stand für neu verbundene Anzeigen
+        self._players: Optional[bytes] = None
+        self._preparing = encode("set_global_preparing", True)
+        self._volume: Optional[bytes] = None
+        self._video: Optional[bytes] = None
+        self._playback: Optional[bytes] = None
+        self._preload: Optional[bytes] = None
+        self._center: Optional[bytes] = None           # Raster oder Warteanzeige
+        self._center_diffs: Dict[tuple, bytes] = {}   # Aufdecken/Auswahl seit dem letzten Raster (letzter Stand je Schlüssel)
+        self._scores: Dict[str, int] = {}
+
+        for i in range(displays):
+            self._spawn(i)
+
+    # ----- Prozesse / Verbindungen -----
+
+    def _spawn(self, screen: int):
+        proc = QProcess(self)
+        proc.setProcessChannelMode(QProcess.ForwardedChannels)
+        proc.finished.connect(lambda *_a, p=proc, s=screen: self._on_process_finished(p, s))
+        args = [os.path.abspath(__file__), "--server", self.server_name, "--screen", str(screen)]
+        if REMOTE_FULLSCREEN:
+            args.append("--fullscreen")
+        proc.start(sys.executable, args)
+        self.processes.append(proc)
+
+    def _on_process_finished(self, proc: QProcess, screen: int):
+        if proc in self.processes:
+            self.processes.remove(proc)
+        proc.deleteLater()
+        if REMOTE_RESTART and not self._closing:
+            QTimer.singleShot(REMOTE_RESTART_DELAY_MS, lambda: None if self._closing else self._spawn(screen))
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            client = _Client(self.server.nextPendingConnection())
+            client.sock.disconnected.connect(lambda c=client: self._on_disconnected(c))
+            client.sock.bytesWritten.connect(lambda _n, c=client: self._on_bytes_written(c))
+            self.clients.append(client)
+            self._send_state(client)
+
+    def _on_disconnected(self, client: _Client):
+        if client in self.clients:
+            self.clients.remove(client)
+        client.sock.deleteLater()
+
+    def _on_bytes_written(self, client: _Client):
+        if client.resync and client.sock.bytesToWrite() == 0:
+            client.resync = False
+            self._send_state(client)
+
+    def _state(self) -> List[bytes]:
+        out = [m for m in (self._players, self._preparing, self._volume, self._preload, self._video,
+                           self._playback, self._center) if m is not None]
+        out.extend(self._center_diffs.values())
+        if self._scores:
+            out.append(encode("set_scores", self._scores))
+        return out
+
+    def _send_state(self, client: _Client):
+        client.sock.write(b"".join(self._state()))
+
+    def _broadcast(self, msg: bytes):
+        for c in self.clients:
+            if c.resync:
+                continue  # Anzeige bekommt nach dem Abarbeiten ohnehin den vollständigen Stand
+            if c.sock.bytesToWrite() > REMOTE_MAX_BACKLOG:
+                c.resync = True
+                continue
+            c.sock.write(msg)
+
+    @property
+    def display_count(self) -> int:
+        return len(self.clients)
+
+    # ----- API wie AudienceWindow -----
+
+    def show(self):
+        pass  # Anzeigen öffnen ihre Fenster selbst
+
+    def close(self):
+        self._closing = True
+        self._broadcast(encode("quit"))
+        for c in self.clients:
+            c.sock.flush()
+            c.sock.disconnected.disconnect()
+        self.clients = []
+        for proc in list(self.processes):
+            if not proc.waitForFinished(2000):
+                proc.kill()
+                proc.waitForFinished(1000)
+        self.server.close()
+        return True
+
+    def set_global_preparing(self, on: bool):
+        self._preparing = encode("set_global_preparing", bool(on))
+        self._broadcast(self._preparing)
+
+    def configure_players(self, players: List[str]):
+        self._players = encode("configure_players", list(players))
+        self._scores = {}
+        self._broadcast(self._players)
+
+    def set_video(self, path: str):
+        self._video = encode("set_video", path)
+        self._playback = None
+        self._broadcast(self._video)
+
+    def preload_videos(self, paths: List[str]):
+        self._preload = encode("preload_videos", list(paths))
+        self._broadcast(self._preload)
+
+    def set_volume(self, vol: float):
+        self._volume = encode("set_volume", float(vol))
+        self._broadcast(self._volume)
+
+    def _cue(self, method: str):
+        self._playback = encode(method)
+        self._broadcast(self._playback)
+
+    def play(self): self._cue("play")
+    def pause(self): self._cue("pause")
+    def stop(self): self._cue("stop")
+
+    def show_waiting_center(self):
+        self._center = encode("show_waiting_center")
+        self._center_diffs.clear()
+        self._broadcast(self._center)
+
+    def set_answers_grid(self, slots: List[Dict], revealed: List[bool], col_players: List[str],
+                         selections: Dict[str, Optional[int]]):
+        self._center = encode("set_answers_grid", list(slots), list(revealed), list(col_players), dict(selections))
+        self._center_diffs.clear()
+        self._broadcast(self._center)
+
+    def prepare_grid(self, col_players: List[str], n_rows: int):
+        # nur Vorarbeit der Anzeigen: kein Zustand, wird neuen Anzeigen nicht nachgeschickt
+        self._broadcast(encode("prepare_grid", list(col_players), n_rows))
+
+    def reveal_answer(self, row_index: int, author: str):
+        msg = encode("reveal_answer", row_index, author)
+        self._center_diffs[("reveal", row_index)] = msg
+        self._broadcast(msg)
+
+    def update_selection(self, pname: str, selected_row: Optional[int]):
+        msg = encode("update_selection", pname, selected_row)
+        self._center_diffs[("sel", pname)] = msg
+        self._broadcast(msg)
+
+    def set_votes(self, row_index: int, n: int):
+        msg = encode("set_votes", row_index, n)
+        self._center_diffs[("votes", row_index)] = msg
+        self._broadcast(msg)
+
+    def set_scores(self, scores: Dict[str, int]):
+        changed = {k: v for k, v in scores.items() if self._scores.get(k) != v}
+        if not changed:
+            return
+        self._scores.update(changed)
+        self._broadcast(encode("set_scores", changed))
+
+# ------------------------
+# Anzeige-Prozess
+# ------------------------
+
+class AudienceClient(QObject):
+    """Anzeigeseite: liest JSON-Zeilen und ruft die gleichnamigen Methoden am AudienceWindow auf."""
+
+    def __init__(self, window, server_name: str, parent=None):
+        super().__init__(parent)
+        self.window = window
+        self.sock = QLocalSocket(self)
+        self.sock.readyRead.connect(self._on_ready_read)
+        self.sock.disconnected.connect(self._quit)
+        self.sock.errorOccurred.connect(lambda _e: self._quit())
+        self.sock.connectToServer(server_name)
+
+    def _on_ready_read(self):
+        while self.sock.canReadLine():
+            line = bytes(self.sock.readLine())
+            try:
+                method, *args = json.loads(line)
+            except (ValueError, TypeError):
+                continue
+            if method not in AUDIENCE_METHODS:
+                continue
+            if method == "quit":
+                self._quit()
+                return
+            getattr(self.window, method)(*args)
+
+    def _quit(self):
+        from PySide6.QtWidgets import QApplication
+        QApplication.quit()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Blind Pick — Zuschauer-Anzeige (eigener Prozess)")
+    ap.add_argument("--server", required=True, help="Name des lokalen Sockets der Moderation")
+    ap.add_argument("--screen", type=int, default=0, help="Bildschirm-Index für das Fenster")
+    ap.add_argument("--fullscreen", action="store_true")
+    args = ap.parse_args(argv)
+
+    from PySide6.QtWidgets import QApplication
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from quiz_blindpick import AudienceWindow
+
+    app = QApplication(sys.argv[:1])
+    win = AudienceWindow()
+    win.setWindowTitle(f"{win.windowTitle()} ({args.screen + 1})")
+    screens = app.screens()
+    if screens:
+        win.move(screens[args.screen % len(screens)].geometry().topLeft())
+    client = AudienceClient(win, args.server)  # noqa: F841 (lebt bis zum Ende der Event-Loop)
+    if args.fullscreen:
+        win.showFullScreen()
+    else:
+        win.show()
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,342 @@
+# quiz_blindpick_replay.py
+# Wiedergabe aufgezeichneter Shows (Sitzungsprotokolle aus quiz_blindpick_session.py) im Zuschauerfenster
+# - SessionReplay: spielt Runde, Mischen, Auswahl, Aufdecken und Lautstärke mit 1×, 10× oder maximaler Geschwindigkeit ab
+#   (z.B. für Zusammenschnitte oder um einen Anzeigefehler nachzustellen)
+# - Pro Takt werden alle fälligen Ereignisse nur auf den Zustand angewendet und danach einmal gezeichnet:
+#   Neuaufbau des Rasters nur bei Runde/Mischen, sonst nur die letzte Änderung je Zeile/Spieler
+# - Vorspulen (seek, Geschwindigkeit "Max"): Zwischenstände werden übersprungen, sichtbar wird nur der Endstand
+# - ReplayControls: Play/Pause, Geschwindigkeit, Positions-Slider
+# Start: python quiz_blindpick_replay.py [protokoll.log] [--speed 1|10|max] [--to N]   (ohne Pfad: neuestes Protokoll)
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Sequence
+
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
+from PySide6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QPushButton, QSlider, QWidget
+
+from quiz_blindpick_engine import BlindPickEngine, NO_SELECTION
+from quiz_blindpick_session import SESSION_DIR, apply_event, initial_state, read_events
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+REPLAY_SPEEDS = ((1, "1×"), (10, "10×"), (0, "Max"))   # 0 = so schnell wie möglich — hier anpassen
+REPLAY_FRAME_MS = 16          # Zeitbudget je Takt bei "Max" (danach wird gezeichnet) — hier anpassen
+REPLAY_MAX_GAP_MS = 5000      # längere Pausen der Show werden auf diese Dauer gekürzt — hier anpassen
+# =========================
+
+
+def load_rounds(path: str):
+    """Template synchron laden (Wiedergabe ist offline); fehlt es, bleiben Video und richtige Antwort leer."""
+    from quiz_blindpick import RoundTemplate, normalize_round
+    from quiz_blindpick_loader import LazyRounds, TemplateFormatError, check_round_fields, iter_template
+    raw = []
+    if path and os.path.exists(path):
+        try:
+            for kind, a, b in iter_template(path):
+                if kind == "round":
+                    fields, _ = check_round_fields(a, b)
+                    if fields is not None:
+                        raw.append(normalize_round(a, fields))
+        except (OSError, UnicodeDecodeError, TemplateFormatError):
+            pass   # bis zum Fehler geladene Runden reichen für die Wiedergabe
+    return LazyRounds(RoundTemplate, raw)
+
+
+def newest_session() -> Optional[str]:
+    try:
+        names = sorted(n for n in os.listdir(SESSION_DIR) if n.endswith(".log"))
+    except OSError:
+        return None
+    return os.path.join(SESSION_DIR, names[-1]) if names else None
+
+
+class SessionReplay(QObject):
+    """Spielt ein Sitzungsprotokoll gegen ein Zuschauerfenster (AudienceWindow oder RemoteAudience) ab."""
+
+    position = Signal(int, int)     # angewendete Ereignisse, Gesamtzahl
+    finished = Signal()
+
+    def __init__(self, path: str, audience, templates: Optional[Sequence] = None, parent=None):
+        super().__init__(parent)
+        self.header, self.events = read_events(path)
+        self.audience = audience
+        self.players: List[str] = list(self.header.get("players", []))
+        self.templates = templates if templates is not None else load_rounds(self.header.get("template", ""))
+        self._pidx = {p: i for i, p in enumerate(self.players)}
+        self.engine = BlindPickEngine()   # ohne Beobachter: nur für Ansichten (Slots, Spalten, Punkte)
+        # virtuelle Zeitachse (ms) mit gekürzten Pausen
+        self._vt: List[int] = []
+        last_t = vt = 0
+        for ev in self.events:
+            t = ev.get("t", last_t)
+            vt += min(max(0, t - last_t), REPLAY_MAX_GAP_MS)
+            last_t = t
+            self._vt.append(vt)
+        self._snaps = [i for i, ev in enumerate(self.events) if ev.get("e") == "snap"]
+        self.speed = 1
+        self.index = 0                    # Anzahl angewendeter Ereignisse
+        self.state = initial_state(len(self.players))
+        self.renders = 0                  # Neuaufbauten des Rasters (Diagnose)
+        self._needs_full = True
+        self._pending: Dict = {}          # vorgemerkte Einzeländerungen seit dem letzten Zeichnen
+        self._round_shown = -1
+        self._pos_ms = 0.0
+        self._wall = 0.0
+        self._playing = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+        audience.configure_players(self.players)
+        audience.set_global_preparing(False)
+
+    # ----- Steuerung -----
+
+    @property
+    def playing(self) -> bool:
+        return self._playing
+
+    def play(self):
+        if self.index >= len(self.events):
+            self.seek(0)
+        self._playing = True
+        self._wall = time.perf_counter()
+        self._schedule()
+
+    def pause(self):
+        self._playing = False
+        self._timer.stop()
+
+    def set_speed(self, speed: int):
+        self.speed = speed
+        self._wall = time.perf_counter()
+        if self._playing:
+            self._schedule()
+
+    def seek(self, index: int):
+        """Springt zu `index` (Anzahl angewendeter Ereignisse); nur der Endstand wird gezeichnet."""
+        index = max(0, min(index, len(self.events)))
+        if index < self.index:
+            # zurück: ab dem letzten Snapshot davor neu aufbauen
+            self.state = initial_state(len(self.players))
+            self.index = 0
+            for s in reversed(self._snaps):
+                if s < index:
+                    self.index = s
+                    break
+        self._needs_full = True
+        self._advance(index)
+        self._pos_ms = float(self._vt[index - 1]) if index else 0.0
+        self._wall = time.perf_counter()
+        if self._playing:
+            self._schedule()
+
+    # ----- Ablauf -----
+
+    def _schedule(self):
+        if self.index >= len(self.events):
+            self._playing = False
+            self.finished.emit()
+            return
+        if self.speed <= 0:
+            self._timer.start(0)
+        else:
+            self._timer.start(max(0, int((self._vt[self.index] - self._pos_ms) / self.speed)))
+
+    def _tick(self):
+        if not self._playing:
+            return
+        now = time.perf_counter()
+        if self.speed <= 0:
+            # Max: so viele Ereignisse wie ins Zeitbudget passen, dann einmal zeichnen
+            end = self.index
+            deadline = now + REPLAY_FRAME_MS / 1000.0
+            while end < len(self.events):
+                end = min(len(self.events), end + 256)
+                self._apply(self.index, end)
+                if time.perf_counter() >= deadline:
+                    break
+            self._render()
+            if self.index:
+                self._pos_ms = float(self._vt[self.index - 1])
+        else:
+            self._pos_ms += (now - self._wall) * 1000.0 * self.speed
+            end = self.index
+            while end < len(self.events) and self._vt[end] <= self._pos_ms:
+                end += 1
+            self._advance(max(end, self.index + 1))
+        self._wall = now
+        self._schedule()
+
+    def _advance(self, end: int):
+        self._apply(self.index, end)
+        self._render()
+
+    def _apply(self, start: int, end: int):
+        # Zustand fortschreiben, Anzeige-Änderungen nur vormerken
+        pending = self._pending
+        for ev in self.events[start:end]:
+            kind = ev.get("e")
+            prev = NO_SELECTION
+            if kind == "select":
+                try:
+                    prev = self.state["sel"][ev["p"]]   # vorige Zeile verliert eine Stimme
+                except (KeyError, IndexError, TypeError):
+                    pass
+            try:
+                apply_event(self.state, ev, self._pidx)
+            except (KeyError, IndexError, TypeError):
+                continue   # beschädigtes Ereignis: überspringen, Rest bleibt abspielbar
+            if kind in ("round", "shuffle"):
+                self._needs_full = True
+                pending.clear()
+            elif kind == "select":
+                pending[("sel", ev["p"])] = ev["r"]
+                pending[("votes", ev["r"])] = True
+                if prev != NO_SELECTION:
+                    pending[("votes", prev)] = True
+            elif kind == "reveal":
+                pending[("reveal", ev["r"])] = True
+                pending["scores"] = True
+            elif kind == "volume":
+                pending["volume"] = ev["v"]
+        self.index = max(self.index, end)
+
+    def _render(self):
+        pending, self._pending = self._pending, {}
+        full = self._needs_full
+        if not full and not pending:
+            self.position.emit(self.index, len(self.events))
+            return
+        a = self.audience
+        self.engine.restore(self.players, self.templates, self.state)
+        eng = self.engine
+        if full:
+            self._needs_full = False
+            self.renders += 1
+            templ = eng.template
+            if templ is not None and eng.round_index != self._round_shown:
+                a.set_video(templ.video)
+                nxt = eng.round_index + 1
+                a.preload_videos([self.templates[nxt].video] if nxt < len(self.templates) else [])
+            self._round_shown = eng.round_index
+            if eng.runtime.shuffled:
+                a.set_answers_grid(eng.view_slots(), list(eng.runtime.revealed), eng.rotated_players(),
+                                   eng.selections_dict())
+            else:
+                a.show_waiting_center()
+            a.set_scores(eng.scores_dict())
+            if self.state.get("volume") is not None:
+                a.set_volume(self.state["volume"])
+        else:
+            for key, value in pending.items():
+                if key == "scores":
+                    continue
+                if key == "volume":
+                    a.set_volume(value)
+                elif key[0] == "sel":
+                    a.update_selection(self.players[key[1]], None if value == NO_SELECTION else value)
+                elif key[0] == "votes":
+                    a.set_votes(key[1], eng.runtime.votes(key[1]))
+                elif key[0] == "reveal":
+                    a.reveal_answer(key[1], eng.slot(key[1])[0])
+            if pending.get("scores"):
+                a.set_scores(eng.scores_dict())
+        self.position.emit(self.index, len(self.events))
+
+
+class ReplayControls(QWidget):
+    def __init__(self, replay: SessionReplay, parent=None):
+        super().__init__(parent)
+        self.replay = replay
+        self.setWindowTitle("Blind Pick — Wiedergabe")
+        h = QHBoxLayout(self)
+        self.btn_play = QPushButton("Play")
+        self.cmb_speed = QComboBox()
+        for speed, label in REPLAY_SPEEDS:
+            self.cmb_speed.addItem(label, speed)
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(0, len(replay.events))
+        self.slider.setMinimumWidth(300)
+        self.lbl = QLabel("")
+        h.addWidget(self.btn_play)
+        h.addWidget(self.cmb_speed)
+        h.addWidget(self.slider, 1)
+        h.addWidget(self.lbl)
+
+        self.btn_play.clicked.connect(self.toggle)
+        self.cmb_speed.currentIndexChanged.connect(lambda _i: replay.set_speed(self.cmb_speed.currentData()))
+        self.slider.sliderReleased.connect(lambda: replay.seek(self.slider.value()))
+        replay.position.connect(self.on_position)
+        replay.finished.connect(lambda: self.btn_play.setText("Play"))
+        self.on_position(replay.index, len(replay.events))
+
+    def set_speed(self, speed: int):
+        i = self.cmb_speed.findData(speed)
+        if i >= 0:
+            self.cmb_speed.setCurrentIndex(i)
+
+    def toggle(self):
+        if self.replay.playing:
+            self.replay.pause()
+            self.btn_play.setText("Play")
+        else:
+            self.replay.play()
+            self.btn_play.setText("Pause")
+
+    def on_position(self, index: int, total: int):
+        if not self.slider.isSliderDown():
+            self.slider.setValue(index)
+        self.lbl.setText(f"Ereignis {index}/{total}, Runde {self.replay.state['round'] + 1}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Blind Pick — aufgezeichnete Show wiedergeben")
+    ap.add_argument("log", nargs="?", help="Sitzungsprotokoll (Standard: neuestes in ~/.blindpick-sessions)")
+    ap.add_argument("--speed", default="1", choices=[label.rstrip("×").lower() for _, label in REPLAY_SPEEDS])
+    ap.add_argument("--to", type=int, default=None, help="zuerst bis zu diesem Ereignis vorspulen (pausiert)")
+    ap.add_argument("--template", default=None, help="anderes Template als im Protokoll verwenden")
+    ap.add_argument("--exit-at-end", action="store_true", help="nach dem letzten Ereignis beenden (Dauer ausgeben)")
+    args = ap.parse_args(argv)
+
+    path = args.log or newest_session()
+    if not path:
+        print("Kein Sitzungsprotokoll gefunden.", file=sys.stderr)
+        return 2
+
+    from PySide6.QtWidgets import QApplication
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from quiz_blindpick import AudienceWindow
+
+    app = QApplication(sys.argv[:1])
+    audience = AudienceWindow()
+    try:
+        replay = SessionReplay(path, audience, load_rounds(args.template) if args.template else None)
+    except (OSError, ValueError) as e:
+        print(f"Protokoll nicht lesbar: {e}", file=sys.stderr)
+        return 2
+    controls = ReplayControls(replay)
+    controls.set_speed(0 if args.speed == "max" else int(args.speed))
+    audience.show()
+    controls.show()
+    if args.to is not None:
+        replay.seek(args.to)
+    else:
+        controls.toggle()
+    if args.exit_at_end:
+        t0 = time.perf_counter()
+
+        def done():
+            print(f"{replay.index} Ereignisse in {time.perf_counter() - t0:.3f} s, {replay.renders} Neuaufbau(ten)")
+            app.quit()
+        replay.finished.connect(done)
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# quiz_blindpick_save.py
+# Atomares Speichern im Hintergrund für den Runden-Editor
+# - atomic_write_json: temporäre Datei im Zielordner, fsync, rename (kein halb geschriebenes Template nach Absturz)
+# - TemplateWriter: ein Schreib-Thread; Serialisierung passiert dort, der GUI-Thread übergibt nur einen Snapshot (Tupel)
+# - Schnell aufeinanderfolgende Speicherungen auf dieselbe Datei werden zu einem Schreibvorgang zusammengefasst
+# - error(path): Fehler des letzten Schreibvorgangs auf `path` (None = geschrieben) — auch ohne das failed-Signal abzuwarten
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+
+def atomic_write_json(path: str, payload, **dump_kwargs):
+    """Schreibt JSON so, dass `path` immer entweder den alten oder den vollständigen neuen Inhalt hat."""
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, **dump_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # rename selbst dauerhaft machen (POSIX); unter Windows nicht nötig/möglich
+        try:
+            dfd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dfd)
+            finally:
+                os.close(dfd)
+        except OSError:
+            pass
+
+
+def template_payload(rows: Sequence[Tuple[str, str, str]]) -> Dict:
+    return {
+        "quiz_type": "blindpick",
+        "rounds": [{"title": t, "video": v, "truth": tr} for t, v, tr in rows],
+    }
+
+
+class _Job:
+    __slots__ = ("path", "rows", "tag", "requested", "coalesced")
+
+    def __init__(self, path: str, rows: List[Tuple[str, str, str]], tag):
+        self.path = path
+        self.rows = rows
+        self.tag = tag
+        self.requested = time.monotonic()
+        self.coalesced = 0
+
+
+class TemplateWriter(QObject):
+    saved = Signal(str, float, float, int, object)   # Pfad, Wartezeit+Schreiben (s), nur Schreiben (s), zusammengefasst, tag
+    failed = Signal(str, str, object)                # Pfad, Fehlermeldung, tag
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="template-save")
+        self._lock = threading.Lock()
+        self._pending: Dict[str, _Job] = {}   # je Pfad nur der neueste Snapshot
+        self._errors: Dict[str, str] = {}     # je Pfad: Fehler des letzten Schreibvorgangs
+        self._busy = False
+        self._idle = threading.Event()
+        self._idle.set()
+
+    @property
+    def busy(self) -> bool:
+        return not self._idle.is_set()
+
+    def submit(self, path: str, rows: List[Tuple[str, str, str]], tag=None):
+        """Reiht einen Snapshot ein. Wartet für `path` schon ein Snapshot, ersetzt dieser ihn."""
+        job = _Job(path, rows, tag)
+        with self._lock:
+            old = self._pending.pop(path, None)
+            if old is not None:
+                job.coalesced = old.coalesced + 1
+                job.requested = old.requested  # Latenz ab der ersten offenen Anforderung
+            self._pending[path] = job
+            if self._busy:
+                return
+            self._busy = True
+            self._idle.clear()
+        self._pool.submit(self._drain)
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._busy = False
+                    self._idle.set()
+                    return
+                job = self._pending.pop(next(iter(self._pending)))
+            t0 = time.monotonic()
+            try:
+                atomic_write_json(job.path, template_payload(job.rows), indent=2)
+            except (OSError, ValueError, TypeError) as e:
+                with self._lock:
+                    self._errors[job.path] = str(e)
+                self.failed.emit(job.path, str(e), job.tag)
+                continue
+            with self._lock:
+                self._errors.pop(job.path, None)
+            done = time.monotonic()
+            self.saved.emit(job.path, done - job.requested, done - t0, job.coalesced, job.tag)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blockiert, bis alle eingereihten Schreibvorgänge erledigt sind (z.B. beim Schließen)."""
+        return self._idle.wait(timeout)
+
+    def error(self, path: str) -> Optional[str]:
+        """Fehlermeldung, wenn der letzte abgeschlossene Schreibvorgang auf `path` gescheitert ist."""
+        with self._lock:
+            return self._errors.get(path)
@@ -0,0 +1,91 @@
+# quiz_blindpick_search.py
+# Suchindex für den Runden-Editor (Titel, richtige Antwort, Videopfad)
+# - Invertierter Token-Index: Token -> Schlüssel der Runden, die es enthalten
+# - Teilwortsuche läuft über das Vokabular (einmalige Tokens) statt über alle Runden
+# - Beim Weitertippen grenzt das Ergebnis des kürzeren Begriffs die Kandidaten ein
+# - Änderungen an einzelnen Runden aktualisieren nur deren Einträge
+
+from __future__ import annotations
+
+import re
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Optional, Set
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+MATCH_CACHE = 64    # gemerkte Suchbegriffe (Teilwort -> passende Tokens) — hier anpassen
+# =========================
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.casefold())
+
+
+class SearchIndex:
+    def __init__(self):
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._tokens: Dict[Hashable, FrozenSet[str]] = {}
+        self._matches: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tokens
+
+    def add(self, key: Hashable, texts: Iterable[str]):
+        toks = frozenset(t for text in texts for t in tokenize(text or ""))
+        self._tokens[key] = toks
+        for t in toks:
+            keys = self._postings.get(t)
+            if keys is None:
+                self._postings[t] = {key}
+                self._matches.clear()  # Vokabular geändert
+            else:
+                keys.add(key)
+
+    def remove(self, key: Hashable):
+        for t in self._tokens.pop(key, ()):
+            keys = self._postings[t]
+            keys.discard(key)
+            if not keys:
+                del self._postings[t]
+                self._matches.clear()
+
+    def update(self, key: Hashable, texts: Iterable[str]):
+        self.remove(key)
+        self.add(key, texts)
+
+    def _tokens_containing(self, term: str) -> List[str]:
+        hit = self._matches.get(term)
+        if hit is None:
+            # Ein bereits gesuchter Teilbegriff enthält alle Kandidaten (Tippen verlängert den Begriff)
+            pool: Iterable[str] = self._postings.keys()
+            best = None
+            for prev, toks in self._matches.items():
+                if prev in term and (best is None or len(toks) < len(best)):
+                    best = toks
+            if best is not None:
+                pool = best
+            hit = [t for t in pool if term in t]
+            if len(self._matches) >= MATCH_CACHE:
+                self._matches.clear()
+            self._matches[term] = hit
+        return hit
+
+    def search(self, query: str) -> Optional[Set[Hashable]]:
+        """Schlüssel aller Runden, die jeden Suchbegriff (als Teilwort) enthalten; None = kein Filter."""
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)  # lange Begriffe grenzen stärker ein
+        if not terms:
+            return None
+        result: Optional[Set[Hashable]] = None
+        for term in terms:
+            keys: Set[Hashable] = set()
+            for t in self._tokens_containing(term):
+                keys |= self._postings[t]
+            result = keys if result is None else result & keys
+            if not result:
+                break
+        return result
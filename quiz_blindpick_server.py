@@ -0,0 +1,748 @@
+# quiz_blindpick_server.py
+# Antwort-Server im LAN: Spieler schicken Antworten und Stimmen vom eigenen Gerät (Browser)
+# - asyncio (nur Standardbibliothek) in einem eigenen Thread: GET / (Antwortseite), WebSocket /ws, POST /answer + /vote
+# - AnswerHub: Rundenzustand + gesammelte Eingaben; eine Sperre trennt Server-Thread und GUI-Thread
+#   Antworten nur in der Antwortphase, Stimmen nur bis zum ersten Aufdecken, jeweils mit Runden-ID (veraltete werden abgelehnt)
+# - Die GUI holt Eingaben gebündelt ab (take_batch); je Spieler zählt die letzte Eingabe
+# - Gegendruck: Verbindungslimit, Token-Bucket je Client, Obergrenze für unverarbeitete Eingaben (HTTP 429/503)
+# - Lastgenerator: python quiz_blindpick_server.py selftest --clients 300 | loadgen --port 8765 --players "A,B,C"
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import statistics
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+SERVER_HOST = "0.0.0.0"         # im ganzen LAN erreichbar; "127.0.0.1" = nur dieser Rechner — hier anpassen
+SERVER_PORT = 8765              # TCP-Port — hier anpassen
+MAX_CLIENTS = 1000              # gleichzeitige Verbindungen — hier anpassen
+RATE_PER_S = 5.0                # Eingaben pro Sekunde und Client (Token-Bucket) — hier anpassen
+RATE_BURST = 10                 # kurzzeitig erlaubte Spitze — hier anpassen
+MAX_PENDING = 5000              # unverarbeitete Eingaben, danach 503 — hier anpassen
+MAX_ANSWER_LEN = 300            # Zeichen je Antwort — hier anpassen
+BATCH_INTERVAL_MS = 50          # GUI holt Eingaben höchstens so oft ab (ms) — hier anpassen
+# =========================
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_HEADER = 8192
+MAX_BODY = 4096
+
+# ------------------------
+# Rundenzustand (thread-sicher)
+# ------------------------
+
+class AnswerHub:
+    """Gemeinsamer Zustand von Server-Thread und GUI. Phasen: "closed" | "answer" | "vote"."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.players: Dict[str, str] = {}        # casefold -> Anzeigename
+        self.round_id = 0
+        self.phase = "closed"
+        self.title = ""
+        self.rows: List[str] = []
+        self._answers: Dict[str, str] = {}
+        self._votes: Dict[str, int] = {}
+        self.state_json = self._encode_state()
+        self.on_state: Optional[Callable[[], None]] = None     # Server-Thread: Zustand an Clients senden
+        self.on_pending: Optional[Callable[[], None]] = None   # GUI: es liegen neue Eingaben bereit
+        self.accepted = 0
+        self.rejected = 0
+
+    def _encode_state(self) -> str:
+        return json.dumps({"type": "state", "round": self.round_id, "phase": self.phase,
+                           "title": self.title, "rows": self.rows}, ensure_ascii=False)
+
+    def _changed(self):
+        self.state_json = self._encode_state()
+        if self.on_state is not None:
+            self.on_state()
+
+    # ----- GUI-Seite -----
+
+    def open_round(self, players: List[str], title: str = ""):
+        with self._lock:
+            self.players = {p.casefold(): p for p in players}
+            self.round_id += 1
+            self.phase = "answer"
+            self.title = title
+            self.rows = []
+            self._answers.clear()
+            self._votes.clear()
+            self._changed()
+
+    def open_voting(self, rows: List[str]):
+        with self._lock:
+            self.round_id += 1   # Antworten der alten Phase sind ab jetzt veraltet
+            self.phase = "vote"
+            self.rows = list(rows)
+            self._answers.clear()
+            self._votes.clear()
+            self._changed()
+
+    def close(self):
+        with self._lock:
+            # Noch nicht abgeholte Eingaben verwerfen, sonst landen sie nach dem Aufdecken in der Engine
+            self._answers.clear()
+            self._votes.clear()
+            if self.phase != "closed":
+                self.phase = "closed"
+                self._changed()
+
+    def take_batch(self) -> Tuple[Dict[str, str], Dict[str, int]]:
+        with self._lock:
+            answers, votes = self._answers, self._votes
+            self._answers, self._votes = {}, {}
+        return answers, votes
+
+    # ----- Server-Seite -----
+
+    def player(self, name: str) -> Optional[str]:
+        return self.players.get((name or "").strip().casefold())
+
+    def submit(self, kind: str, name: str, round_id, value) -> Tuple[int, str]:
+        """Liefert (HTTP-Status, Meldung). 202 = angenommen."""
+        with self._lock:
+            status, msg = self._check(kind, name, round_id, value)
+            if status == 202:
+                player = self.players[name.strip().casefold()]
+                first = not self._answers and not self._votes
+                if kind == "answer":
+                    self._answers[player] = str(value)[:MAX_ANSWER_LEN]
+                else:
+                    self._votes[player] = int(value)
+                self.accepted += 1
+            else:
+                self.rejected += 1
+                first = False
+        if first and self.on_pending is not None:
+            self.on_pending()
+        return status, msg
+
+    def _check(self, kind: str, name, round_id, value) -> Tuple[int, str]:
+        if not isinstance(name, str) or name.strip().casefold() not in self.players:
+            return 403, "Unbekannter Spieler"
+        if round_id != self.round_id:
+            return 409, "Runde ist vorbei"
+        if len(self._answers) + len(self._votes) >= MAX_PENDING:
+            return 503, "Server ausgelastet"
+        if kind == "answer":
+            if self.phase != "answer":
+                return 409, "Antworten sind geschlossen"
+            if not isinstance(value, str):
+                return 400, "Antwort fehlt"
+        elif kind == "vote":
+            if self.phase != "vote":
+                return 409, "Abstimmung ist geschlossen"
+            if not isinstance(value, int) or isinstance(value, bool) or not (0 <= value < len(self.rows)):
+                return 400, "Ungültige Zeile"
+        else:
+            return 400, "Unbekannte Eingabe"
+        return 202, "ok"
+
+
+def local_url(port: int) -> str:
+    """Adresse, unter der Geräte im LAN den Server erreichen (beste Schätzung, ohne Pakete zu senden)."""
+    import socket
+    host = "127.0.0.1"
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("192.0.2.1", 9))   # Dokumentationsnetz: wählt nur die ausgehende Schnittstelle
+            host = s.getsockname()[0]
+    except OSError:
+        pass
+    return f"http://{host}:{port}/"
+
+
+def follow_engine(engine, hub: AnswerHub):
+    """Verbindet eine BlindPickEngine mit dem Hub: neue Runde -> Antworten, Mischen -> Abstimmung, Aufdecken -> zu."""
+    def on_event(event: str, *args):
+        if event == "round":
+            templ = engine.template
+            hub.open_round(engine.players, templ.title if templ is not None else "")
+        elif event == "shuffle":
+            hub.open_voting([s["text"] for s in engine.view_slots()])
+        elif event == "reveal":
+            hub.close()
+    engine.subscribe(on_event)
+    on_event("round")
+    return on_event
+
+# ------------------------
+# HTTP / WebSocket (asyncio)
+# ------------------------
+
+class _Bucket:
+    __slots__ = ("tokens", "stamp")
+
+    def __init__(self):
+        self.tokens = float(RATE_BURST)
+        self.stamp = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(RATE_BURST, self.tokens + (now - self.stamp) * RATE_PER_S)
+        self.stamp = now
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+
+def ws_accept_key(key: str) -> str:
+    return base64.b64encode(hashlib.sha1((key + WS_GUID).encode("ascii")).digest()).decode("ascii")
+
+
+def ws_frame(payload: bytes, opcode: int = 0x1, mask: bool = False) -> bytes:
+    n = len(payload)
+    head = bytes([0x80 | opcode])
+    mbit = 0x80 if mask else 0
+    if n < 126:
+        head += bytes([mbit | n])
+    elif n < 65536:
+        head += bytes([mbit | 126]) + struct.pack("!H", n)
+    else:
+        head += bytes([mbit | 127]) + struct.pack("!Q", n)
+    if not mask:
+        return head + payload
+    key = os.urandom(4)
+    return head + key + _unmask(payload, key)
+
+
+def _unmask(data: bytes, key: bytes) -> bytes:
+    n = len(data)
+    if not n:
+        return data
+    full = (key * (n // 4 + 1))[:n]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(full, "big")).to_bytes(n, "big")
+
+
+async def ws_read(reader: asyncio.StreamReader, limit: int = MAX_BODY) -> Tuple[int, bytes]:
+    """Liest einen (unfragmentierten) Frame; liefert (opcode, payload)."""
+    b1, b2 = await reader.readexactly(2)
+    opcode, masked, n = b1 & 0x0F, b2 & 0x80, b2 & 0x7F
+    if not b1 & 0x80:
+        raise ValueError("fragmentierte Frames werden nicht unterstützt")
+    if n == 126:
+        n = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif n == 127:
+        n = struct.unpack("!Q", await reader.readexactly(8))[0]
+    if n > limit:
+        raise ValueError("Nachricht zu groß")
+    key = await reader.readexactly(4) if masked else b""
+    data = await reader.readexactly(n)
+    return opcode, _unmask(data, key) if masked else data
+
+
+class _WsClient:
+    __slots__ = ("writer", "dirty", "bucket")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.dirty = asyncio.Event()
+        self.dirty.set()            # sofort den aktuellen Stand schicken
+        self.bucket = _Bucket()
+
+
+class AnswerHttpServer:
+    """Läuft in einem eigenen Thread mit eigener Event-Loop."""
+
+    def __init__(self, hub: AnswerHub, host: str = SERVER_HOST, port: int = SERVER_PORT):
+        self.hub = hub
+        self.host = host
+        self.port = port
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self.ws_clients: List[_WsClient] = []
+        self._writers = set()
+        self.connections = 0
+        self._http_buckets: Dict[str, _Bucket] = {}
+        hub.on_state = self._state_changed
+
+    # ----- Thread -----
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="answer-server", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self._server = self.loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port, limit=MAX_HEADER))
+            self.port = self._server.sockets[0].getsockname()[1]   # Port 0 -> vom System vergeben
+        except OSError as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self._server.close()
+            # Verbindungen wurden in _shutdown geschlossen; ihre Tasks laufen jetzt regulär aus
+            tasks = asyncio.all_tasks(self.loop)
+            if tasks:
+                self.loop.run_until_complete(asyncio.wait(tasks, timeout=2))
+            self.loop.close()
+
+    def stop(self):
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._shutdown)
+        if self._thread is not None:
+            self._thread.join(5)
+
+    def _shutdown(self):
+        self._server.close()
+        for w in list(self._writers):
+            w.close()
+        self.loop.stop()
+
+    def _state_changed(self):
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self._mark_dirty)
+
+    def _mark_dirty(self):
+        for c in self.ws_clients:
+            c.dirty.set()   # Writer schickt nur den jeweils neuesten Stand (ältere werden übersprungen)
+
+    # ----- Verbindungen -----
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        if self.connections >= MAX_CLIENTS:
+            try:
+                await self._respond(writer, 503, {"error": "Zu viele Verbindungen"}, close=True)
+            except ConnectionError:
+                pass
+            finally:
+                writer.close()
+            return
+        self.connections += 1
+        self._writers.add(writer)
+        peer = (writer.get_extra_info("peername") or ("?",))[0]
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, path, _ = lines[0].split(" ", 2)
+                except ValueError:
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    k, sep, v = line.partition(":")
+                    if sep:
+                        headers[k.strip().lower()] = v.strip()
+                path = path.split("?", 1)[0]
+                if method == "GET" and path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                    await self._websocket(reader, writer, headers)
+                    return
+                try:
+                    length = int(headers.get("content-length", "0") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {"error": "Ungültige Content-Length"}, close=True)
+                    return
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, {"error": "Anfrage zu groß"}, close=True)
+                    return
+                body = await reader.readexactly(length) if length else b""
+                keep = headers.get("connection", "").lower() != "close"
+                await self._http(method, path, body, writer, peer, keep)
+                if not keep:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _respond(self, writer, status: int, payload, ctype: str = "application/json; charset=utf-8",
+                       close: bool = False, extra: str = ""):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        reason = {200: "OK", 202: "Accepted", 400: "Bad Request", 403: "Forbidden", 404: "Not Found",
+                  409: "Conflict", 413: "Payload Too Large", 429: "Too Many Requests",
+                  503: "Service Unavailable"}.get(status, "")
+        writer.write((f"HTTP/1.1 {status} {reason}\r\nContent-Type: {ctype}\r\nContent-Length: {len(body)}\r\n"
+                      f"Cache-Control: no-store\r\n{extra}Connection: {'close' if close else 'keep-alive'}\r\n\r\n"
+                      ).encode("latin-1") + body)
+        await writer.drain()
+
+    async def _http(self, method: str, path: str, body: bytes, writer, peer: str, keep: bool):
+        if method == "GET" and path == "/":
+            await self._respond(writer, 200, ANSWER_PAGE.encode("utf-8"), "text/html; charset=utf-8", close=not keep)
+            return
+        if method == "GET" and path == "/state":
+            await self._respond(writer, 200, self.hub.state_json.encode("utf-8"), close=not keep)
+            return
+        if method == "POST" and path in ("/answer", "/vote"):
+            bucket = self._http_buckets.setdefault(peer, _Bucket())
+            if not bucket.take():
+                await self._respond(writer, 429, {"error": "Zu viele Eingaben"}, close=not keep, extra="Retry-After: 1\r\n")
+                return
+            try:
+                data = json.loads(body or b"{}")
+                kind = path[1:]
+                status, msg = self.hub.submit(kind, data.get("name"), data.get("round"),
+                                              data.get("text") if kind == "answer" else data.get("row"))
+            except (ValueError, AttributeError):
+                status, msg = 400, "Ungültiges JSON"
+            await self._respond(writer, status, {"status": msg}, close=not keep,
+                                extra="Retry-After: 1\r\n" if status == 503 else "")
+            return
+        await self._respond(writer, 404, {"error": "Nicht gefunden"}, close=not keep)
+
+    async def _websocket(self, reader, writer, headers: Dict[str, str]):
+        key = headers.get("sec-websocket-key")
+        if not key:
+            await self._respond(writer, 400, {"error": "Sec-WebSocket-Key fehlt"}, close=True)
+            return
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {ws_accept_key(key)}\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+        client = _WsClient(writer)
+        self.ws_clients.append(client)
+        sender = asyncio.ensure_future(self._ws_sender(client))
+        name = None
+        try:
+            while True:
+                opcode, data = await ws_read(reader)
+                if opcode == 0x8:
+                    writer.write(ws_frame(b"", 0x8))
+                    return
+                if opcode == 0x9:
+                    writer.write(ws_frame(data, 0xA))
+                    continue
+                if opcode != 0x1:
+                    continue
+                try:
+                    msg = json.loads(data)
+                    kind = msg.get("type")
+                except (ValueError, AttributeError):
+                    continue
+                if kind == "join":
+                    name = self.hub.player(msg.get("name"))
+                    reply = {"type": "joined", "name": name} if name else {"type": "error", "error": "Unbekannter Spieler"}
+                elif kind in ("answer", "vote"):
+                    if not client.bucket.take():
+                        reply = {"type": "error", "error": "Zu viele Eingaben", "status": 429}
+                    else:
+                        status, text = self.hub.submit(kind, name or "", msg.get("round"),
+                                                       msg.get("text") if kind == "answer" else msg.get("row"))
+                        reply = {"type": "ack", "for": kind, "status": status, "id": msg.get("id")}
+                        if status != 202:
+                            reply.update(type="error", error=text)
+                else:
+                    continue
+                writer.write(ws_frame(json.dumps(reply, ensure_ascii=False).encode("utf-8")))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            sender.cancel()
+            self.ws_clients.remove(client)
+
+    async def _ws_sender(self, client: _WsClient):
+        try:
+            while True:
+                await client.dirty.wait()
+                client.dirty.clear()
+                client.writer.write(ws_frame(self.hub.state_json.encode("utf-8")))
+                await client.writer.drain()   # langsamer Client: nur er wartet; dazwischen gesetzte Stände fallen zusammen
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+# ------------------------
+# Qt-Anbindung
+# ------------------------
+
+try:
+    from PySide6.QtCore import QObject, QTimer, Signal
+except ImportError:  # Lastgenerator/Selbsttest laufen auch ohne PySide6
+    QObject = None
+
+if QObject is not None:
+    class AnswerServer(QObject):
+        """Server + Hub für das Moderatorfenster. `batch` liefert gebündelte Eingaben im GUI-Thread."""
+
+        pending = Signal()
+        batch = Signal(dict, dict)   # Antworten {Spieler: Text}, Stimmen {Spieler: Zeile}
+
+        def __init__(self, engine, host: str = SERVER_HOST, port: int = SERVER_PORT, parent=None):
+            super().__init__(parent)
+            self.hub = AnswerHub()
+            self.hub.on_pending = self.pending.emit    # aus dem Server-Thread -> queued in den GUI-Thread
+            self.http = AnswerHttpServer(self.hub, host, port)
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.setInterval(BATCH_INTERVAL_MS)
+            self._timer.timeout.connect(self._drain)
+            self.pending.connect(self._schedule)
+            self.engine = engine
+            self._follow = follow_engine(engine, self.hub)
+
+        def start(self):
+            self.http.start()
+
+        def stop(self):
+            self.engine.unsubscribe(self._follow)
+            self.http.stop()
+
+        @property
+        def port(self) -> int:
+            return self.http.port
+
+        def _schedule(self):
+            if not self._timer.isActive():
+                self._timer.start()
+
+        def _drain(self):
+            answers, votes = self.hub.take_batch()
+            if answers or votes:
+                self.batch.emit(answers, votes)
+
+# ------------------------
+# Lastgenerator / Selbsttest
+# ------------------------
+
+class WsTestClient:
+    def __init__(self, reader, writer):
+        self.reader, self.writer = reader, writer
+        self.state: Dict = {}   # zuletzt empfangener Rundenzustand
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "WsTestClient":
+        reader, writer = await asyncio.open_connection(host, port)
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        writer.write((f"GET /ws HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode("latin-1"))
+        head = await reader.readuntil(b"\r\n\r\n")
+        if b" 101 " not in head.split(b"\r\n", 1)[0]:
+            raise ConnectionError(head.split(b"\r\n", 1)[0].decode("latin-1"))
+        return cls(reader, writer)
+
+    async def send(self, msg: Dict):
+        self.writer.write(ws_frame(json.dumps(msg).encode("utf-8"), mask=True))
+        await self.writer.drain()
+
+    async def recv(self) -> Dict:
+        while True:
+            opcode, data = await ws_read(self.reader, limit=1 << 24)  # Zustand mit allen Antworten
+            if opcode == 0x1:
+                msg = json.loads(data)
+                if msg.get("type") == "state":
+                    self.state = msg
+                return msg
+            if opcode == 0x8:
+                raise ConnectionError("geschlossen")
+
+    async def wait_state(self, phase: str) -> Dict:
+        while self.state.get("phase") != phase:
+            await self.recv()
+        return self.state
+
+    async def request(self, msg: Dict) -> Tuple[Dict, float]:
+        t0 = time.perf_counter()
+        await self.send(msg)
+        while True:
+            reply = await self.recv()
+            if reply.get("type") in ("ack", "error", "joined"):
+                return reply, time.perf_counter() - t0
+
+    def close(self):
+        self.writer.close()
+
+
+async def _simulate_player(host: str, port: int, name: str, stats: Dict, timeout: float, rng: random.Random):
+    try:
+        c = await asyncio.wait_for(WsTestClient.connect(host, port), timeout)
+    except (OSError, asyncio.TimeoutError) as e:
+        stats["errors"].append(f"{name}: {e}")
+        return
+    try:
+        await asyncio.wait_for(c.request({"type": "join", "name": name}), timeout)
+        state = await asyncio.wait_for(c.wait_state("answer"), timeout)
+        reply, dt = await asyncio.wait_for(c.request({"type": "answer", "round": state["round"],
+                                                      "text": f"Antwort von {name}"}), timeout)
+        stats["answer"].append(dt)
+        if reply["type"] != "ack":
+            stats["errors"].append(f"{name}: {reply.get('error')}")
+        state = await asyncio.wait_for(c.wait_state("vote"), timeout)
+        reply, dt = await asyncio.wait_for(c.request({"type": "vote", "round": state["round"],
+                                                      "row": rng.randrange(len(state["rows"]))}), timeout)
+        stats["vote"].append(dt)
+        if reply["type"] != "ack":
+            stats["errors"].append(f"{name}: {reply.get('error')}")
+    except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+        stats["errors"].append(f"{name}: {type(e).__name__} {e}")
+    finally:
+        c.close()
+
+
+def _report(stats: Dict, elapsed: float):
+    for kind in ("answer", "vote"):
+        ms = sorted(v * 1000 for v in stats[kind])
+        if ms:
+            p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+            print(f"{kind:7} n={len(ms):5}  p50 {statistics.median(ms):7.2f} ms  p95 {p95:7.2f} ms  max {ms[-1]:7.2f} ms")
+    print(f"Fehler: {len(stats['errors'])}  Dauer: {elapsed:.2f} s")
+    for e in stats["errors"][:10]:
+        print("  " + e)
+
+
+async def loadgen(host: str, port: int, names: List[str], timeout: float = 30.0, seed: int = 1) -> Dict:
+    """Simuliert je Name einen Spieler: verbinden, anmelden, antworten, nach dem Mischen abstimmen."""
+    stats: Dict = {"answer": [], "vote": [], "errors": []}
+    rng = random.Random(seed)
+    await asyncio.gather(*(_simulate_player(host, port, n, stats, timeout, rng) for n in names))
+    return stats
+
+
+def selftest(clients: int, port: int = 0) -> int:
+    """Headless: Engine + Server auf localhost, `clients` simulierte Spieler, Bündelung wie in der GUI."""
+    from quiz_blindpick_engine import BlindPickEngine
+    from types import SimpleNamespace
+
+    names = [f"Spieler{i + 1}" for i in range(clients)]
+    engine = BlindPickEngine(random.Random(7))
+    hub = AnswerHub()
+    server = AnswerHttpServer(hub, "127.0.0.1", port)
+    server.start()
+    engine.setup(names, [SimpleNamespace(title="Selbsttest", video="", truth="Richtig")])
+    follow_engine(engine, hub)
+    answers: Dict[str, str] = {}
+    batches = 0
+
+    async def moderator():
+        # Rolle der GUI: alle BATCH_INTERVAL_MS abholen; wenn alle geantwortet haben, mischen
+        nonlocal batches
+        while True:
+            await asyncio.sleep(BATCH_INTERVAL_MS / 1000)
+            got, votes = hub.take_batch()
+            if got or votes:
+                batches += 1
+            answers.update(got)
+            for p, row in votes.items():
+                engine.select(p, row)
+            if hub.phase == "answer" and len(answers) == len(names):
+                engine.shuffle([answers[p] for p in names])
+            if hub.phase == "vote" and sum(s >= 0 for s in engine.runtime.selections) == len(names):
+                return
+
+    async def run():
+        t0 = time.perf_counter()
+        mod = asyncio.ensure_future(moderator())
+        stats = await loadgen("127.0.0.1", server.port, names)
+        try:
+            await asyncio.wait_for(mod, 5)
+        except asyncio.TimeoutError:
+            stats["errors"].append("Moderator: nicht alle Stimmen angekommen")
+        return stats, time.perf_counter() - t0
+
+    stats, elapsed = asyncio.run(run())
+    server.stop()
+    _report(stats, elapsed)
+    voted = sum(s >= 0 for s in engine.runtime.selections)
+    print(f"Antworten übernommen: {len(answers)}/{clients}  Stimmen: {voted}/{clients}  GUI-Bündel: {batches}  "
+          f"angenommen {hub.accepted}, abgelehnt {hub.rejected}")
+    return 0 if not stats["errors"] and voted == clients else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Blind Pick — Antwort-Server: Lastgenerator und Selbsttest")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    st = sub.add_parser("selftest", help="Server + simulierte Spieler auf localhost")
+    st.add_argument("--clients", type=int, default=300)
+    lg = sub.add_parser("loadgen", help="simulierte Spieler gegen einen laufenden Server")
+    lg.add_argument("--host", default="127.0.0.1")
+    lg.add_argument("--port", type=int, default=SERVER_PORT)
+    lg.add_argument("--players", required=True, help="Spielernamen wie im Setup, kommagetrennt")
+    lg.add_argument("--timeout", type=float, default=120.0, help="Wartezeit je Schritt (Moderator muss mischen)")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "selftest":
+        return selftest(args.clients)
+    names = [n.strip() for n in args.players.split(",") if n.strip()]
+    t0 = time.perf_counter()
+    stats = asyncio.run(loadgen(args.host, args.port, names, args.timeout))
+    _report(stats, time.perf_counter() - t0)
+    return 1 if stats["errors"] else 0
+
+
+ANSWER_PAGE = """<!doctype html>
+<html lang="de"><head><meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
+<title>Blind Pick</title>
+<style>
+body{font-family:sans-serif;margin:1em;max-width:32em}button{font-size:1.1em;margin:.2em 0;padding:.5em;width:100%}
+input{font-size:1.1em;width:100%;padding:.4em;box-sizing:border-box}.sel{background:#0d6efd;color:#fff}#msg{color:#777}
+</style></head><body>
+<h2>Blind Pick</h2>
+<div id="join"><input id="name" placeholder="Dein Name (wie beim Moderator)"><button onclick="join()">Mitspielen</button></div>
+<div id="game" hidden><h3 id="title"></h3><div id="phase"></div></div>
+<p id="msg"></p>
+<script>
+let ws, me = localStorage.getItem("bp-name") || "", state = null, voted = null;
+const $ = id => document.getElementById(id);
+$("name").value = me;
+function connect() {
+  ws = new WebSocket((location.protocol === "https:" ? "wss://" : "ws://") + location.host + "/ws");
+  ws.onopen = () => { if (me) ws.send(JSON.stringify({type: "join", name: me})); };
+  ws.onmessage = e => {
+    const m = JSON.parse(e.data);
+    if (m.type === "state") { if (!state || m.round !== state.round) voted = null; state = m; render(); }
+    else if (m.type === "joined") { $("join").hidden = true; $("game").hidden = false; $("msg").textContent = ""; }
+    else if (m.type === "ack") { $("msg").textContent = m.for === "answer" ? "Antwort gespeichert." : "Stimme gespeichert."; }
+    else if (m.type === "error") { $("msg").textContent = m.error; }
+  };
+  ws.onclose = () => { $("msg").textContent = "Verbindung getrennt — neuer Versuch …"; setTimeout(connect, 1000); };
+}
+function join() { me = $("name").value.trim(); localStorage.setItem("bp-name", me); ws.send(JSON.stringify({type: "join", name: me})); }
+function render() {
+  $("title").textContent = state.title || "";
+  const p = $("phase"); p.innerHTML = "";
+  if (state.phase === "answer") {
+    const i = document.createElement("input"); i.placeholder = "Deine Antwort"; i.maxLength = 300;
+    const b = document.createElement("button"); b.textContent = "Antwort senden";
+    b.onclick = () => ws.send(JSON.stringify({type: "answer", round: state.round, text: i.value}));
+    p.append(i, b);
+  } else if (state.phase === "vote") {
+    state.rows.forEach((t, r) => {
+      const b = document.createElement("button"); b.textContent = t || "(leer)";
+      if (voted === r) b.className = "sel";
+      b.onclick = () => { voted = r; render(); ws.send(JSON.stringify({type: "vote", round: state.round, row: r})); };
+      p.append(b);
+    });
+  } else { p.textContent = "Bitte warten …"; }
+}
+connect();
+</script></body></html>
+"""
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,351 @@
+# quiz_blindpick_session.py
+# Sitzungsprotokoll für laufende Shows (Fortsetzen nach Absturz)
+# - SessionRecorder beobachtet die Engine: Runde, Mischen, Auswahl, Aufdecken (+ Punkte) als je eine JSON-Zeile (append-only)
+# - Alle SESSION_SNAPSHOT_EVENTS Ereignisse ein vollständiger Snapshot als eigene Zeile: Fortsetzen liest nur ab dem letzten
+# - Schreiben im Hintergrund-Thread: der GUI-Thread legt nur ein kleines dict in die Queue (kein I/O in reveal_row),
+#   fsync höchstens alle SESSION_FSYNC_INTERVAL_S
+# - read_session(): Kopfzeile + Zustand (letzter Snapshot + spätere Ereignisse) für BlindPickEngine.restore()
+# - Protokolle bleiben nach dem Spiel erhalten (die letzten SESSION_KEEP), ein Zeiger merkt sich die laufende Sitzung;
+#   Wiedergabe fertiger Shows: quiz_blindpick_replay.py
+#
+# Format (Version 2; Version 1 = ohne "volume"), eine JSON-Zeile je Eintrag, "t" = ms seit Sitzungsbeginn:
+#   Kopf     {"session": 2, "started", "template", "key", "players"}
+#   snap     {"e": "snap", "round", "scores", "answers", "order", "revealed", "sel", "volume"?, "t"}
+#   round    {"e": "round", "i": Rundenindex}
+#   shuffle  {"e": "shuffle", "a": Antworten je Spieler, "o": shuffled_order}
+#   select   {"e": "select", "p": Spielerindex, "r": Zeile}
+#   reveal   {"e": "reveal", "r": Zeile, "g": {Spieler: Punkte}}
+#   volume   {"e": "volume", "v": 0.0–1.0}
+#   end      {"e": "end"}   (regulär beendet)
+# Unbekannte Einträge werden beim Lesen übersprungen (neuere Protokolle bleiben abspielbar).
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from quiz_blindpick_engine import NO_SELECTION
+from quiz_blindpick_journal import file_key
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+SESSION_DIR = os.path.join(os.path.expanduser("~"), ".blindpick-sessions")   # Ablage der Protokolle — hier anpassen
+SESSION_SNAPSHOT_EVENTS = 100      # nach so vielen Ereignissen ein Snapshot — hier anpassen
+SESSION_FSYNC_INTERVAL_S = 0.5     # spätestens nach dieser Zeit liegen Ereignisse auf der Platte — hier anpassen
+SESSION_KEEP = 1000                # so viele alte Protokolle behalten (Wiederholungen, Liga-Statistik) — hier anpassen
+SESSION_FILE = os.path.join(os.path.expanduser("~"), ".blindpick-session")   # Zeiger auf die laufende Sitzung
+# =========================
+
+SESSION_VERSION = 2
+SESSION_VERSIONS = (1, 2)   # lesbare Versionen
+_SNAP_PREFIX = '{"e":"snap"'
+
+
+def _line(rec: Dict) -> str:
+    return json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+# ------------------------
+# Sitzungszeiger (welches Protokoll lief beim Absturz?)
+# ------------------------
+
+def session_log() -> Optional[str]:
+    try:
+        with open(SESSION_FILE, "r", encoding="utf-8") as f:
+            path = f.read().strip()
+    except OSError:
+        return None
+    return path if path and os.path.exists(path) else None
+
+
+def _set_session(path: str):
+    try:
+        with open(SESSION_FILE, "w", encoding="utf-8") as f:
+            f.write(path)
+    except OSError:
+        pass  # ohne Zeiger kein Fortsetzen-Angebot, das Protokoll selbst bleibt vollständig
+
+
+def clear_session(path: str):
+    try:
+        with open(SESSION_FILE, "r", encoding="utf-8") as f:
+            current = f.read().strip()
+        if current == path:
+            os.remove(SESSION_FILE)
+    except OSError:
+        pass
+
+
+def _prune(keep: int, current: str):
+    try:
+        names = sorted(n for n in os.listdir(SESSION_DIR) if n.endswith(".log"))
+    except OSError:
+        return
+    for n in names[:max(0, len(names) - keep)]:
+        p = os.path.join(SESSION_DIR, n)
+        if p != current:
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+
+# ------------------------
+# Lesen / Anwenden
+# ------------------------
+
+def initial_state(n_players: int, round_index: int = 0) -> Dict:
+    return {"round": round_index, "scores": [0] * n_players, "answers": [""] * n_players,
+            "order": [], "revealed": [], "sel": [NO_SELECTION] * n_players, "volume": None}
+
+
+def apply_event(state: Dict, ev: Dict, pidx: Dict[str, int]):
+    """Ein Protokoll-Ereignis auf einen Zustand (Format wie BlindPickEngine.state()) anwenden."""
+    kind = ev.get("e")
+    n = len(state["scores"])
+    if kind == "snap":
+        # Kopien: das Ereignis bleibt unverändert (Wiedergabe springt zu Snapshots zurück)
+        state.update((k, list(ev[k])) for k in ("scores", "answers", "order", "revealed", "sel"))
+        state["round"] = ev["round"]
+        state["volume"] = ev.get("volume", state.get("volume"))
+    elif kind == "round":
+        state.update(round=ev["i"], answers=[""] * n, order=[], revealed=[], sel=[NO_SELECTION] * n)
+    elif kind == "shuffle":
+        state.update(answers=list(ev["a"]), order=list(ev["o"]), revealed=[False] * len(ev["o"]),
+                     sel=[NO_SELECTION] * n)
+    elif kind == "select":
+        state["sel"][ev["p"]] = ev["r"]
+    elif kind == "reveal":
+        state["revealed"][ev["r"]] = True
+        for name, pts in ev.get("g", {}).items():
+            state["scores"][pidx[name]] += pts
+    elif kind == "volume":
+        state["volume"] = ev["v"]
+    elif kind == "end":
+        state["ended"] = True
+
+
+def read_header(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            header = json.loads(f.readline())
+        except ValueError:
+            raise ValueError("Sitzungsprotokoll ohne gültige Kopfzeile") from None
+    if not isinstance(header, dict) or header.get("session") not in SESSION_VERSIONS:
+        raise ValueError("Unbekanntes Sitzungsformat")
+    return header
+
+
+def read_events(path: str) -> Tuple[Dict, List[Dict]]:
+    """Kopfzeile + alle Ereignisse; eine beim Absturz abgeschnittene letzte Zeile wird ignoriert."""
+    header = read_header(path)
+    events: List[Dict] = []
+    with open(path, "r", encoding="utf-8") as f:
+        f.readline()
+        for line in f:
+            try:
+                ev = json.loads(line)
+            except ValueError:
+                break
+            if isinstance(ev, dict):
+                events.append(ev)
+    return header, events
+
+
+def read_session(path: str) -> Tuple[Dict, Dict, int]:
+    """(Kopfzeile, Zustand, Anzahl nachgespielter Ereignisse). Nur ab dem letzten Snapshot wird JSON gelesen."""
+    header = read_header(path)
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()[1:]
+    start = skip = 0
+    for i in range(len(lines) - 1, -1, -1):
+        if lines[i].startswith(_SNAP_PREFIX):
+            start, skip = i, 1
+            break
+    players = header.get("players", [])
+    pidx = {p: i for i, p in enumerate(players)}
+    state = initial_state(len(players))
+    applied = 0
+    for line in lines[start:]:
+        try:
+            ev = json.loads(line)
+            apply_event(state, ev, pidx)
+        except ValueError:
+            break   # abgeschnittene letzte Zeile
+        except (KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"Ereignis {start + applied + 1} nicht anwendbar: {e}") from None
+        applied += 1
+    return header, state, max(0, applied - skip)
+
+# ------------------------
+# Schreiben
+# ------------------------
+
+class SessionRecorder:
+    """Hängt Engine-Ereignisse an das Protokoll der laufenden Sitzung an. Fehler beim Öffnen landen in `error`
+    (das Spiel läuft ohne Protokoll weiter)."""
+
+    def __init__(self, engine, template_path: str = ""):
+        self.engine = engine
+        self.template_path = template_path
+        self.path: Optional[str] = None
+        self.error = ""
+        self.volume: Optional[float] = None
+        self._pidx: Dict[str, int] = {}
+        self._t0 = time.monotonic()
+        self._since_snap = 0
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        engine.subscribe(self._on_event)
+
+    # ----- Engine-Ereignisse (GUI-Thread: nur Queue) -----
+
+    def _put(self, rec: Dict):
+        if self.path is None:
+            return
+        rec["t"] = int((time.monotonic() - self._t0) * 1000)
+        self._queue.put(rec)
+        self._since_snap += 1
+        if self._since_snap >= SESSION_SNAPSHOT_EVENTS:
+            self.snapshot()
+
+    def _on_event(self, event: str, *args):
+        eng = self.engine
+        if event == "setup":
+            self._open_new()
+        elif event == "round":
+            self._put({"e": "round", "i": eng.round_index})
+        elif event == "shuffle":
+            self._put({"e": "shuffle", "a": list(eng.runtime.players_answers), "o": list(args[0])})
+        elif event == "select":
+            pname, row = args
+            self._put({"e": "select", "p": self._pidx[pname], "r": row})
+        elif event == "reveal":
+            row, _author, gained = args
+            self._put({"e": "reveal", "r": row, "g": dict(gained)})
+
+    def set_volume(self, vol: float):
+        # Lautstärke liegt nicht in der Engine; das Moderatorfenster meldet sie direkt
+        vol = round(vol, 3)
+        if vol != self.volume:
+            self.volume = vol
+            self._put({"e": "volume", "v": vol})
+
+    def snapshot(self):
+        if self.path is None:
+            return
+        self._since_snap = 0
+        # "e" zuerst: read_session() findet den letzten Snapshot per Zeilenanfang, ohne JSON zu parsen
+        rec = {"e": "snap"}
+        rec.update(self.engine.state())
+        if self.volume is not None:
+            rec["volume"] = self.volume
+        rec["t"] = int((time.monotonic() - self._t0) * 1000)
+        self._queue.put(rec)
+
+    # ----- Dateien -----
+
+    def _open(self, path: str, header: Optional[Dict]):
+        self.close(ended=False)
+        self.error = ""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            f = open(path, "a", encoding="utf-8")
+            if header is not None:
+                f.write(_line(header))
+                f.flush()
+        except OSError as e:
+            self.error = str(e)
+            return
+        self.path = path
+        self._pidx = {p: i for i, p in enumerate(self.engine.players)}
+        self._since_snap = 0
+        self._thread = threading.Thread(target=self._writer, args=(f,), name="session-log", daemon=True)
+        self._thread.start()
+        _set_session(path)
+        self.snapshot()
+
+    def _open_new(self):
+        self._t0 = time.monotonic()
+        base = os.path.join(SESSION_DIR, time.strftime("session-%Y%m%d-%H%M%S") + f"-{os.getpid()}")
+        path, k = base + ".log", 1
+        while os.path.exists(path):   # mehrere Setups in derselben Sekunde
+            k += 1
+            path = f"{base}-{k}.log"
+        self._open(path, {"session": SESSION_VERSION, "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                          "template": self.template_path, "key": file_key(self.template_path),
+                          "players": list(self.engine.players)})
+        _prune(SESSION_KEEP, path)
+
+    def resume(self, path: str, header: Dict, templates: Sequence, state: Dict):
+        """Engine aus einem gelesenen Zustand wiederherstellen und dasselbe Protokoll fortschreiben."""
+        self.template_path = header.get("template", "")
+        # restore() meldet setup/round/shuffle für die Anzeigen; das Protokoll bekommt stattdessen einen Snapshot
+        self.engine.unsubscribe(self._on_event)
+        try:
+            self.engine.restore(header.get("players", []), templates, state)
+        finally:
+            self.engine.subscribe(self._on_event)
+        self._t0 = time.monotonic() - self._last_t(path) / 1000.0
+        self._open(path, None)
+
+    @staticmethod
+    def _last_t(path: str) -> int:
+        # Zeitachse fortsetzen: "t" der letzten vollständigen Zeile (nur das Dateiende lesen)
+        try:
+            with open(path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 65536))
+                tail = f.read().decode("utf-8", "replace").splitlines()
+        except OSError:
+            return 0
+        for line in reversed(tail):
+            try:
+                return int(json.loads(line).get("t", 0))
+            except (ValueError, AttributeError):
+                continue
+        return 0
+
+    def _writer(self, f):
+        dirty = False
+        last_sync = time.monotonic()
+        while True:
+            try:
+                rec = self._queue.get(timeout=SESSION_FSYNC_INTERVAL_S if dirty else None)
+            except queue.Empty:
+                rec = ...   # nur fsync
+            try:
+                if rec is None:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    f.close()
+                    return
+                if rec is not ...:
+                    f.write(_line(rec))
+                    f.flush()
+                    dirty = True
+                now = time.monotonic()
+                if dirty and (rec is ... or now - last_sync >= SESSION_FSYNC_INTERVAL_S):
+                    os.fsync(f.fileno())
+                    dirty = False
+                    last_sync = now
+            except OSError as e:
+                self.error = str(e)   # Platte voll o.ä.: weiter annehmen, nichts mehr schreiben
+                if rec is None:
+                    return
+
+    def close(self, ended: bool = True):
+        """Protokoll schließen; `ended` = Spiel regulär beendet (kein Fortsetzen-Angebot beim nächsten Start)."""
+        if self.path is None:
+            return
+        if ended:
+            self._queue.put({"e": "end", "t": int((time.monotonic() - self._t0) * 1000)})
+        self._queue.put(None)
+        self._thread.join(5)
+        if ended:
+            clear_session(self.path)
+        self.path = None
+        self._thread = None
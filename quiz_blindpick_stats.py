@@ -0,0 +1,284 @@
+# quiz_blindpick_stats.py
+# Statistik über viele Shows (z.B. Wochenliga) aus den Sitzungsprotokollen (quiz_blindpick_session.py)
+# - load_stats(): liest alle Protokolle und legt spaltenweise NumPy-Arrays an (eine Zeile je abgegebener Stimme
+#   bzw. je Spieler und Show); Auswertung in wenigen vektorisierten Durchläufen (bincount/lexsort), keine Python-Schleifen je Stimme
+# - LeagueStats: player_stats() (Reinfall-Quote, Wahrheit gefunden, andere getäuscht, Punkte, Siege), round_stats()
+#   (welche Runden am häufigsten täuschen), leaderboard()
+# - StatsWindow: Ansicht für den Startscreen (Rangliste / Spieler / Runden)
+# - NumPy ist optional (pip install numpy); ohne NumPy meldet die Ansicht das statt zu starten
+
+from __future__ import annotations
+
+import glob
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Statistik ist optional, das Spiel läuft ohne NumPy
+    np = None
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTabWidget, QTableWidget,
+                               QTableWidgetItem, QAbstractItemView)
+
+from quiz_blindpick_loader import TemplateFormatError, iter_template
+from quiz_blindpick_session import SESSION_DIR, apply_event, initial_state, read_events
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+STATS_MIN_VOTES = 3        # Runden mit weniger Stimmen erscheinen nicht in der Runden-Rangliste — hier anpassen
+STATS_TOP = 50             # Einträge je Rangliste in der Ansicht — hier anpassen
+# =========================
+
+TRUTH = -1   # Autor-ID der richtigen Antwort in der Stimmen-Tabelle
+
+
+def available() -> bool:
+    return np is not None
+
+# ------------------------
+# Laden (Protokolle -> Spalten)
+# ------------------------
+
+def _played_rounds(events: Iterable[Dict], players: List[str]):
+    """Endstand jeder gespielten Runde (mind. eine Zeile aufgedeckt) + Endpunkte der Show."""
+    pidx = {p: i for i, p in enumerate(players)}
+    state = initial_state(len(players))
+    rounds: List[Tuple[int, List[int], List[int]]] = []
+
+    def flush():
+        if any(state["revealed"]):
+            rounds.append((state["round"], list(state["order"]), list(state["sel"])))
+
+    for ev in events:
+        if ev.get("e") in ("round", "shuffle"):
+            flush()
+        try:
+            apply_event(state, ev, pidx)
+        except (KeyError, IndexError, TypeError):
+            break   # beschädigtes Protokoll: bis hierher zählen
+    flush()
+    return rounds, state["scores"]
+
+
+class LeagueStats:
+    """Spalten (alle gleich lang je Tabelle):
+    Stimmen: v_session, v_round (Runden-ID), v_voter (Spieler-ID), v_author (Spieler-ID oder TRUTH)
+    Teilnahmen: s_session, s_player, s_score (Endpunkte der Show)"""
+
+    def __init__(self, players: List[str], rounds: List[Tuple[str, int]], sessions: List[str],
+                 votes: Dict[str, "np.ndarray"], seats: Dict[str, "np.ndarray"], titles: Optional[Dict] = None):
+        self.players = players          # Spieler-ID -> Name (über alle Shows, gleicher Name = gleicher Spieler)
+        self.rounds = rounds            # Runden-ID -> (Template, Rundenindex)
+        self.sessions = sessions        # Show-ID -> Protokollpfad
+        self.titles = titles or {}
+        self.v_session = votes["session"]
+        self.v_round = votes["round"]
+        self.v_voter = votes["voter"]
+        self.v_author = votes["author"]
+        self.s_session = seats["session"]
+        self.s_player = seats["player"]
+        self.s_score = seats["score"]
+
+    def round_label(self, rid: int) -> str:
+        template, index = self.rounds[rid]
+        title = self.titles.get((template, index)) or f"Runde {index + 1}"
+        return f"{title} ({os.path.basename(template) or '?'})"
+
+    # ----- Auswertung -----
+
+    def player_stats(self) -> Dict[str, "np.ndarray"]:
+        """Je Spieler-ID: votes, truth_found, fooled (auf fremde Antwort reingefallen), fooled_rate, truth_rate,
+        fools (andere mit der eigenen Antwort getäuscht), shows, points, avg_points, wins."""
+        n = len(self.players)
+        voter, author = self.v_voter, self.v_author
+        truth = author == TRUTH
+        fooled = ~truth & (author != voter)
+        votes = np.bincount(voter, minlength=n)
+        truth_found = np.bincount(voter, weights=truth, minlength=n)
+        fooled_n = np.bincount(voter, weights=fooled, minlength=n)
+        fools = np.bincount(author[fooled], minlength=n)
+        shows = np.bincount(self.s_player, minlength=n)
+        points = np.bincount(self.s_player, weights=self.s_score, minlength=n)
+        # Sieg = höchste Punktzahl der Show (Gleichstand zählt für alle)
+        best = np.full(len(self.sessions), np.iinfo(np.int64).min)
+        np.maximum.at(best, self.s_session, self.s_score)
+        wins = np.bincount(self.s_player, weights=self.s_score == best[self.s_session], minlength=n)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {
+                "votes": votes, "truth_found": truth_found.astype(np.int64), "fooled": fooled_n.astype(np.int64),
+                "truth_rate": np.where(votes > 0, truth_found / votes, np.nan),
+                "fooled_rate": np.where(votes > 0, fooled_n / votes, np.nan),
+                "fools": fools, "shows": shows, "points": points.astype(np.int64),
+                "avg_points": np.where(shows > 0, points / shows, np.nan), "wins": wins.astype(np.int64),
+            }
+
+    def round_stats(self) -> Dict[str, "np.ndarray"]:
+        """Je Runden-ID: plays (Shows), votes, truth_rate, fool_rate (Anteil der Stimmen auf fremde
+        Spielerantworten an allen Stimmen, die nicht auf die eigene Antwort gingen — wie fooled in player_stats)."""
+        m = len(self.rounds)
+        truth = self.v_author == TRUTH
+        foreign = self.v_author != self.v_voter
+        votes = np.bincount(self.v_round, minlength=m)
+        found = np.bincount(self.v_round, weights=truth, minlength=m)
+        foreign_n = np.bincount(self.v_round, weights=foreign, minlength=m)
+        fooled_n = np.bincount(self.v_round, weights=~truth & foreign, minlength=m)
+        # Shows je Runde: eindeutige (Runde, Show)-Paare
+        pairs = np.unique(self.v_round.astype(np.int64) * len(self.sessions) + self.v_session)
+        plays = np.bincount(pairs // max(1, len(self.sessions)), minlength=m)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            truth_rate = np.where(votes > 0, found / votes, np.nan)
+            fool_rate = np.where(foreign_n > 0, fooled_n / foreign_n, np.nan)
+        return {"plays": plays, "votes": votes, "truth_rate": truth_rate, "fool_rate": fool_rate}
+
+    def leaderboard(self, by: str = "points", top: Optional[int] = None) -> List[Dict]:
+        """Spieler absteigend nach `by` (Schlüssel aus player_stats); Gleichstand: mehr Siege, dann Name."""
+        st = self.player_stats()
+        key = np.nan_to_num(st[by].astype(float), nan=-np.inf)
+        name_rank = np.argsort(np.argsort(np.array(self.players, dtype=str)))
+        order = np.lexsort((name_rank, -st["wins"], -key))
+        if top is not None:
+            order = order[:top]
+        return [dict({k: v[i].item() for k, v in st.items()}, name=self.players[i], rank=r + 1)
+                for r, i in enumerate(order)]
+
+    def trickiest_rounds(self, min_votes: int = STATS_MIN_VOTES, top: Optional[int] = None) -> List[Dict]:
+        st = self.round_stats()
+        ids = np.flatnonzero(st["votes"] >= min_votes)
+        ids = ids[np.lexsort((-st["votes"][ids], -st["fool_rate"][ids]))]
+        if top is not None:
+            ids = ids[:top]
+        return [dict({k: v[i].item() for k, v in st.items()}, label=self.round_label(int(i))) for i in ids]
+
+
+def session_paths(folder: str = SESSION_DIR) -> List[str]:
+    return sorted(glob.glob(os.path.join(folder, "*.log")))
+
+
+def _template_titles(path: str) -> Dict[int, str]:
+    titles: Dict[int, str] = {}
+    try:
+        for kind, a, b in iter_template(path):
+            if kind == "round" and isinstance(b, dict):
+                titles[a] = b.get("title") or ""
+    except (OSError, UnicodeDecodeError, TemplateFormatError):
+        pass
+    return titles
+
+
+def load_stats(paths: Optional[List[str]] = None, with_titles: bool = True) -> LeagueStats:
+    """Alle Protokolle einlesen (unlesbare werden übersprungen) und als Spalten ablegen."""
+    if np is None:
+        raise RuntimeError("NumPy ist nicht installiert (pip install numpy)")
+    if paths is None:
+        paths = session_paths()
+    player_ids: Dict[str, int] = {}
+    round_ids: Dict[Tuple[str, int], int] = {}
+    sessions: List[str] = []
+    cols = {k: [] for k in ("session", "round", "voter", "author")}
+    seat_cols = {k: [] for k in ("session", "player", "score")}
+    for path in paths:
+        try:
+            header, events = read_events(path)
+        except (OSError, ValueError):
+            continue
+        players = list(header.get("players", []))
+        rounds, scores = _played_rounds(events, players)
+        if not rounds:
+            continue   # Show ohne aufgedeckte Runde (z.B. nur ausprobiert)
+        sid = len(sessions)
+        sessions.append(path)
+        gid = [player_ids.setdefault(p, len(player_ids)) for p in players]
+        template = header.get("template") or ""
+        n = len(players)
+        for round_index, order, sel in rounds:
+            rid = round_ids.setdefault((template, round_index), len(round_ids))
+            for pi, row in enumerate(sel):
+                if not (0 <= row < len(order)):
+                    continue
+                slot = order[row]
+                cols["session"].append(sid)
+                cols["round"].append(rid)
+                cols["voter"].append(gid[pi])
+                cols["author"].append(gid[slot] if slot < n else TRUTH)
+        seat_cols["session"].extend([sid] * n)
+        seat_cols["player"].extend(gid)
+        seat_cols["score"].extend(scores)
+    titles: Dict[Tuple[str, int], str] = {}
+    if with_titles:
+        for template in {t for t, _ in round_ids}:
+            if template and os.path.exists(template):
+                titles.update(((template, i), t) for i, t in _template_titles(template).items())
+    votes = {k: np.asarray(v, dtype=np.int64) for k, v in cols.items()}
+    seats = {k: np.asarray(v, dtype=np.int64) for k, v in seat_cols.items()}
+    players = sorted(player_ids, key=player_ids.get)
+    rounds = sorted(round_ids, key=round_ids.get)
+    return LeagueStats(players, rounds, sessions, votes, seats, titles)
+
+# ------------------------
+# Ansicht (Startscreen)
+# ------------------------
+
+def _pct(x: float) -> str:
+    return "–" if x != x else f"{x * 100:.0f} %"
+
+
+def _fill_table(table: QTableWidget, headers: List[str], rows: List[List]):
+    """Tabelle neu befüllen; Zellen als Wert oder (Sortierwert, Anzeigetext)."""
+    table.setSortingEnabled(False)
+    table.clear()
+    table.setColumnCount(len(headers))
+    table.setHorizontalHeaderLabels(headers)
+    table.setRowCount(len(rows))
+    for r, row in enumerate(rows):
+        for c, value in enumerate(row):
+            item = QTableWidgetItem()
+            if isinstance(value, tuple):
+                item.setData(Qt.EditRole, value[0])
+                item.setData(Qt.DisplayRole, value[1])
+            else:
+                item.setData(Qt.DisplayRole, value)
+            table.setItem(r, c, item)
+    table.setSortingEnabled(True)
+    table.resizeColumnsToContents()
+
+
+class StatsWindow(QWidget):
+    def __init__(self, folder: str = SESSION_DIR, parent=None):
+        super().__init__(parent)
+        self.folder = folder
+        self.setWindowTitle("Blind Pick — Statistik")
+        self.resize(820, 560)
+        v = QVBoxLayout(self)
+        top = QHBoxLayout()
+        self.lbl = QLabel("")
+        self.btn_reload = QPushButton("Neu laden")
+        self.btn_reload.clicked.connect(self.reload)
+        top.addWidget(self.lbl, 1)
+        top.addWidget(self.btn_reload)
+        v.addLayout(top)
+        self.tabs = QTabWidget()
+        self.tbl_board, self.tbl_players, self.tbl_rounds = (QTableWidget() for _ in range(3))
+        for tbl, title in ((self.tbl_board, "Rangliste"), (self.tbl_players, "Spieler"),
+                           (self.tbl_rounds, "Knifflige Runden")):
+            tbl.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            tbl.verticalHeader().setVisible(False)
+            self.tabs.addTab(tbl, title)
+        v.addWidget(self.tabs, 1)
+        self.reload()
+
+    def reload(self):
+        stats = load_stats(session_paths(self.folder))
+        self.lbl.setText(f"{len(stats.sessions)} Shows, {len(stats.players)} Spieler, "
+                         f"{len(stats.v_voter)} Stimmen — {self.folder}")
+        _fill_table(self.tbl_board, ["#", "Spieler", "Punkte", "Siege", "Shows", "Ø Punkte"], [
+            [r["rank"], r["name"], r["points"], r["wins"], r["shows"], (r["avg_points"], f"{r['avg_points']:.1f}")]
+            for r in stats.leaderboard(top=STATS_TOP)])
+        _fill_table(self.tbl_players, ["Spieler", "Stimmen", "Wahrheit gefunden", "Reingefallen", "Andere getäuscht"], [
+            [r["name"], r["votes"], (r["truth_rate"], _pct(r["truth_rate"])),
+             (r["fooled_rate"], _pct(r["fooled_rate"])), r["fools"]] for r in stats.leaderboard(by="votes")])
+        _fill_table(self.tbl_rounds, ["Runde", "Shows", "Stimmen", "Getäuscht (ohne eigene)", "Wahrheit gefunden"], [
+            [r["label"], r["plays"], r["votes"], (r["fool_rate"], _pct(r["fool_rate"])),
+             (r["truth_rate"], _pct(r["truth_rate"]))] for r in stats.trickiest_rounds(top=STATS_TOP)])
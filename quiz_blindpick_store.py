@@ -0,0 +1,266 @@
+# quiz_blindpick_store.py
+# Optionaler Runden-Speicher auf SQLite-Basis (stdlib sqlite3) für sehr große Fragenkataloge
+# - RoundStore: verhält sich wie eine Liste von Runden (len, [i], insert, del, move), Änderungen
+#   betreffen nur einzelne Datensätze; Reihenfolge über Gleitkomma-Positionen (Einfügen ohne Umnummerieren)
+# - Indizes auf Position, Titel und richtiger Antwort; Änderungen bleiben bis commit() in einer Transaktion
+# - Import/Export zum bestehenden Format {"quiz_type":"blindpick","rounds":[...]}
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from collections.abc import MutableSequence
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from quiz_blindpick_loader import iter_template, check_round_fields
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+STORE_SUFFIXES = (".bpdb", ".sqlite", ".db")  # Dateiendungen für Runden-Datenbanken — hier anpassen
+POS_STEP = 1024.0        # Abstand zwischen Positionen nach Import/Umnummerierung — hier anpassen
+POS_MIN_GAP = 1e-6       # kleinster Abstand, danach wird umnummeriert — hier anpassen
+IMPORT_CHUNK = 5000      # Zeilen pro executemany beim Import — hier anpassen
+# =========================
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rounds (
+    id    INTEGER PRIMARY KEY,
+    pos   REAL NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    video TEXT NOT NULL DEFAULT '',
+    truth TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_rounds_pos   ON rounds(pos);
+CREATE INDEX IF NOT EXISTS idx_rounds_title ON rounds(title);
+CREATE INDEX IF NOT EXISTS idx_rounds_truth ON rounds(truth);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+def is_store_path(path: str) -> bool:
+    return path.lower().endswith(STORE_SUFFIXES)
+
+
+class RoundStore(MutableSequence):
+    """Listen-Schnittstelle über einer SQLite-Tabelle. `factory(title, video, truth)` erzeugt Runden-Objekte;
+    bereits gelesene Objekte werden gecacht, damit Änderungen am Objekt über store[i] = obj zurückgeschrieben werden."""
+
+    def __init__(self, path: str, factory: Callable):
+        self.path = path
+        self._factory = factory
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+        # Reihenfolge im Speicher: nur IDs und Positionen (kompakt, Zugriff per Index in O(1))
+        self._ids: List[int] = []
+        self._pos: List[float] = []
+        self._cache: Dict[int, object] = {}
+        self._reload_order()
+
+    # ----- Transaktion -----
+
+    @property
+    def dirty(self) -> bool:
+        return self.conn.in_transaction
+
+    def commit(self):
+        self.conn.commit()
+
+    def rollback(self):
+        self.conn.rollback()
+        self._reload_order()
+
+    def close(self):
+        self.conn.close()
+
+    def _reload_order(self):
+        rows = self.conn.execute("SELECT id, pos FROM rounds ORDER BY pos, id").fetchall()
+        self._ids = [r[0] for r in rows]
+        self._pos = [r[1] for r in rows]
+        self._cache.clear()
+
+    # ----- Lesen -----
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _load(self, rid: int):
+        obj = self._cache.get(rid)
+        if obj is None:
+            row = self.conn.execute("SELECT title, video, truth FROM rounds WHERE id = ?", (rid,)).fetchone()
+            obj = self._factory(*row)
+            self._cache[rid] = obj
+        return obj
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.page(*self._slice_bounds(i))
+        return self._load(self._ids[i])
+
+    def _slice_bounds(self, sl: slice) -> Tuple[int, int]:
+        start, stop, step = sl.indices(len(self._ids))
+        if step != 1:
+            raise ValueError("RoundStore unterstützt nur zusammenhängende Slices")
+        return start, max(0, stop - start)
+
+    def page(self, offset: int, limit: int) -> List:
+        """Liest einen zusammenhängenden Bereich mit einer Abfrage (für Listenansichten)."""
+        ids = self._ids[offset:offset + limit]
+        missing = [rid for rid in ids if rid not in self._cache]
+        for k in range(0, len(missing), 900):  # SQLite-Parameterlimit beachten
+            chunk = missing[k:k + 900]
+            q = f"SELECT id, title, video, truth FROM rounds WHERE id IN ({','.join('?' * len(chunk))})"
+            for rid, title, video, truth in self.conn.execute(q, chunk):
+                self._cache[rid] = self._factory(title, video, truth)
+        return [self._cache[rid] for rid in ids]
+
+    def titles(self) -> List[str]:
+        return [r[0] for r in self.conn.execute("SELECT title FROM rounds ORDER BY pos, id")]
+
+    def index_of_id(self, rid: int) -> int:
+        return self._ids.index(rid)
+
+    def first_invalid(self) -> Optional[Tuple[int, str]]:
+        """Erste Runde mit leerem Video bzw. leerer richtiger Antwort (Index, Feld)."""
+        row = self.conn.execute(
+            "SELECT id, trim(video) = '' FROM rounds WHERE trim(video) = '' OR trim(truth) = '' "
+            "ORDER BY pos, id LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        return self._ids.index(row[0]), "video" if row[1] else "truth"
+
+    def fill_empty_titles(self):
+        """Leere Titel auf "Runde n" setzen (n = Position), wie beim JSON-Speichern."""
+        rows = self.conn.execute("SELECT id FROM rounds WHERE trim(title) = ''").fetchall()
+        for (rid,) in rows:
+            title = f"Runde {self._ids.index(rid) + 1}"
+            self.conn.execute("UPDATE rounds SET title = ? WHERE id = ?", (title, rid))
+            obj = self._cache.get(rid)
+            if obj is not None:
+                obj.title = title
+
+    # ----- Schreiben (je Operation nur betroffene Datensätze) -----
+
+    def __setitem__(self, i: int, obj):
+        rid = self._ids[i]
+        self.conn.execute("UPDATE rounds SET title = ?, video = ?, truth = ? WHERE id = ?",
+                          (obj.title, obj.video, obj.truth, rid))
+        self._cache[rid] = obj
+
+    def __delitem__(self, i: int):
+        rid = self._ids.pop(i)
+        self._pos.pop(i)
+        self.conn.execute("DELETE FROM rounds WHERE id = ?", (rid,))
+        self._cache.pop(rid, None)
+
+    def _pos_between(self, i: int) -> float:
+        """Position für ein Element, das an Index i eingefügt wird."""
+        n = len(self._pos)
+        if n == 0:
+            return POS_STEP
+        if i <= 0:
+            return self._pos[0] - POS_STEP
+        if i >= n:
+            return self._pos[-1] + POS_STEP
+        lo, hi = self._pos[i - 1], self._pos[i]
+        if hi - lo < POS_MIN_GAP:
+            self._renumber()
+            lo, hi = self._pos[i - 1], self._pos[i]
+        return (lo + hi) / 2.0
+
+    def _renumber(self):
+        self._pos = [(k + 1) * POS_STEP for k in range(len(self._ids))]
+        self.conn.executemany("UPDATE rounds SET pos = ? WHERE id = ?", zip(self._pos, self._ids))
+
+    def insert(self, i: int, obj):
+        i = max(0, min(i, len(self._ids)))
+        pos = self._pos_between(i)
+        cur = self.conn.execute("INSERT INTO rounds (pos, title, video, truth) VALUES (?, ?, ?, ?)",
+                                (pos, obj.title, obj.video, obj.truth))
+        rid = cur.lastrowid
+        self._ids.insert(i, rid)
+        self._pos.insert(i, pos)
+        self._cache[rid] = obj
+
+    def move(self, src: int, dst: int):
+        """Verschiebt eine Runde von src nach dst (Index nach dem Verschieben); ändert nur eine Zeile."""
+        if src == dst:
+            return
+        if abs(src - dst) == 1:
+            # Nachbarn: Positionen tauschen (kein Halbieren der Lücke, zwei Zeilen)
+            a, b = self._ids[src], self._ids[dst]
+            pa, pb = self._pos[src], self._pos[dst]
+            self.conn.executemany("UPDATE rounds SET pos = ? WHERE id = ?", ((pb, a), (pa, b)))
+            self._ids[src], self._ids[dst] = b, a
+            return
+        rid = self._ids.pop(src)
+        self._pos.pop(src)
+        pos = self._pos_between(dst)
+        self.conn.execute("UPDATE rounds SET pos = ? WHERE id = ?", (pos, rid))
+        self._ids.insert(dst, rid)
+        self._pos.insert(dst, pos)
+
+    # ----- Import / Export -----
+
+    def get_meta(self, key: str, default: str = "") -> str:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key: str, value: str):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def append_many(self, rows: Iterable[Tuple[str, str, str]]):
+        """Hängt viele Runden effizient an (Positionen fortlaufend)."""
+        base = self._pos[-1] if self._pos else 0.0
+        batch = []
+
+        def flush():
+            nonlocal batch
+            if not batch:
+                return
+            first_new = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM rounds").fetchone()[0] + 1
+            self.conn.executemany("INSERT INTO rounds (id, pos, title, video, truth) VALUES (?, ?, ?, ?, ?)",
+                                  [(first_new + k, *b) for k, b in enumerate(batch)])
+            self._ids.extend(range(first_new, first_new + len(batch)))
+            self._pos.extend(b[0] for b in batch)
+            batch = []
+
+        for title, video, truth in rows:
+            base += POS_STEP
+            batch.append((base, title, video, truth))
+            if len(batch) >= IMPORT_CHUNK:
+                flush()
+        flush()
+
+    def import_json(self, path: str, normalize: Callable[[int, Dict[str, str]], tuple]) -> List[str]:
+        """Importiert ein Template-JSON (gestreamt) ans Ende; liefert Warnungen."""
+        warnings: List[str] = []
+
+        def rows():
+            for kind, a, b in iter_template(path):
+                if kind == "meta" and a == "quiz_type":
+                    self.set_meta("quiz_type", str(b))
+                elif kind == "round":
+                    fields, w = check_round_fields(a, b)
+                    warnings.extend(w)
+                    if fields is not None:
+                        yield normalize(a, fields)
+
+        self.append_many(rows())
+        return warnings
+
+    def export_json(self, path: str):
+        """Schreibt das bekannte Template-Format zeilenweise (ohne alles im Speicher zu halten)."""
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write('{\n  "quiz_type": "blindpick",\n  "rounds": [')
+            first = True
+            cur = self.conn.execute("SELECT title, video, truth FROM rounds ORDER BY pos, id")
+            for title, video, truth in cur:
+                rec = json.dumps({"title": title, "video": video, "truth": truth}, ensure_ascii=False, indent=2)
+                f.write(("\n" if first else ",\n") + "\n".join("    " + ln for ln in rec.splitlines()))
+                first = False
+            f.write("\n  ]\n}" if not first else "]\n}")
+        os.replace(tmp, path)
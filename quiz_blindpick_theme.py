@@ -0,0 +1,81 @@
+# quiz_blindpick_theme.py
+# Zentrales Stylesheet für Blind Pick (einmal an der QApplication installiert)
+# - Widgets bekommen nur einen objectName (z.B. "answerRow", "answerAuthor") statt eines eigenen Stylesheets
+# - Zustände (Aufdecken-Button: "show" / "done") laufen über dynamische Properties:
+#   set_state() setzt die Property und poliert das Widget neu, das CSS wird nicht neu geparst
+# - Farben/Abstände aus der Konfiguration von quiz_blindpick werden beim Installieren eingesetzt
+
+from __future__ import annotations
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+FONT_ANSWER_HEADER_PX = 16   # Kopfzeile "Antworten" im Zuschauerfenster — hier anpassen
+FONT_COLUMN_HEADER_PX = 14   # Spielernamen über den Checkbox-Spalten — hier anpassen
+FONT_AUTHOR_PX = 14          # "Autor: …" in jeder Antwortzeile — hier anpassen
+FONT_ANSWER_PX = 20          # Antworttext im Zuschauerfenster — hier anpassen
+FONT_PREP_PX = 28            # "Das Quiz wird vorbereitet …" — hier anpassen
+FONT_WAIT_PX = 22            # "Warte auf Antworten …" — hier anpassen
+FONT_SCORE_PT = 12           # Punkteanzeige unter den Slots — hier anpassen
+FONT_VOTES_PX = 14           # Stimmenzahl je Antwortzeile — hier anpassen
+COLOR_AUTHOR = "#CCC"        # Schriftfarbe "Autor: …" — hier anpassen
+COLOR_WAIT = "#AAA"          # Schriftfarbe Warte-Hinweis — hier anpassen
+COLOR_VOTES = "#8ab4f8"      # Schriftfarbe Stimmenzahl — hier anpassen
+ROW_BORDER = "1px solid #777"             # Rahmen jeder Antwortzeile — hier anpassen
+ROW_BACKGROUND = "rgba(255,255,255,0.03)"  # Hintergrund jeder Antwortzeile — hier anpassen
+# =========================
+
+THEME_MARKER = "/* blindpick-theme */"
+
+THEME = """
+QFrame#answerRow {{ border: {row_border}; border-radius: 8px; background: {row_background}; }}
+QLabel#answerHeader {{ font-weight: bold; font-size: {answer_header}px; }}
+QLabel#columnHeader {{ font-weight: bold; font-size: {column_header}px; }}
+QLabel#answerAuthor {{ color: {author_color}; font-size: {author}px; }}
+QLabel#answerBody {{ font-size: {answer}px; }}
+QLabel#prepLabel {{ font-size: {prep}px; }}
+QLabel#waitLabel {{ font-size: {wait}px; color: {wait_color}; }}
+QLabel#voteCount {{ color: {votes_color}; font-size: {votes}px; }}
+QLabel#scoreLabel {{ font-weight: bold; font-size: {score}pt; }}
+QLabel#truthLabel {{ font-style: italic; }}
+QLabel#latencyTable {{ font-family: monospace; font-size: 11px; }}
+QCheckBox#audienceBox {{ margin: 0px {chk_padding}px; }}
+QCheckBox#pickBox {{ margin: {chk_padding}px; }}
+QPushButton#revealButton {{ color: white; border: none; padding: 6px 10px; border-radius: 6px; background-color: {show_color}; }}
+QPushButton#revealButton[state="done"] {{ background-color: {done_color}; }}
+"""
+
+
+def stylesheet(show_color: str, done_color: str, chk_padding: int) -> str:
+    return THEME_MARKER + THEME.format(
+        row_border=ROW_BORDER, row_background=ROW_BACKGROUND,
+        answer_header=FONT_ANSWER_HEADER_PX, column_header=FONT_COLUMN_HEADER_PX,
+        author=FONT_AUTHOR_PX, author_color=COLOR_AUTHOR, answer=FONT_ANSWER_PX,
+        prep=FONT_PREP_PX, wait=FONT_WAIT_PX, wait_color=COLOR_WAIT, score=FONT_SCORE_PT,
+        votes=FONT_VOTES_PX, votes_color=COLOR_VOTES,
+        chk_padding=chk_padding, show_color=show_color, done_color=done_color,
+    )
+
+
+def install(show_color: str, done_color: str, chk_padding: int):
+    """Theme an die QApplication hängen (einmalig; ein vorhandenes App-Stylesheet bleibt davor erhalten)."""
+    app = QApplication.instance()
+    if app is None:
+        return
+    current = app.styleSheet()
+    if THEME_MARKER in current:
+        return
+    app.setStyleSheet(current + stylesheet(show_color, done_color, chk_padding))
+
+
+def set_state(w: QWidget, value: str, name: str = "state"):
+    """Zustand über dynamische Property wechseln: Property setzen + neu polieren (kein neues Stylesheet)."""
+    if w.property(name) == value:
+        return
+    w.setProperty(name, value)
+    st = w.style()
+    st.unpolish(w)
+    st.polish(w)
+    w.update()
@@ -0,0 +1,559 @@
+# quiz_blindpick_views.py
+# Virtualisierte Ansichten für Blind Pick (Model/View statt Widget pro Zelle)
+# - AnswersTableModel: Antworten (Autor/Text/Sichtbarkeit/Stimmenzahl) + Auswahl je Spieler als Tabelle
+# - AnswerRowDelegate: zeichnet gerahmte Zeilen, Autor/Text und Auswahlmarken direkt per QPainter
+# - AnswersTableView: nicht-interaktive Tabelle für das Zuschauerfenster
+# - SelectionGridModel/-View: Moderator-Auswahlraster (exklusiv je Spieler) + Aufdecken je Zeile
+# - RoundListModel: Rundenliste des Editors (liest nur sichtbare Zeilen, optional gefiltert)
+# - MediaListModel: Medienstatus je Runde im Setup-Dialog (Titel aus den Roh-Tupeln, ohne Runden zu erzeugen)
+# Speicher- und Layoutkosten bleiben flach, egal wie viele Spieler (Spalten) es gibt.
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import List, Dict, Optional, Sequence
+
+from PySide6.QtCore import Qt, QAbstractListModel, QAbstractTableModel, QModelIndex, QRect, QRectF, QSize, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
+from PySide6.QtWidgets import (
+    QStyledItemDelegate, QStyleOptionViewItem, QStyleOptionButton, QStyle, QTableView,
+    QHeaderView, QAbstractItemView, QApplication
+)
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+TABLE_TEXT_WIDTH = 1000     # Breite der Antwortspalte (px) — hier anpassen
+TABLE_CHECK_WIDTH = 90      # Breite je Auswahlspalte (px) — hier anpassen
+TABLE_ROW_PADDING = 10      # Innenabstand in jeder Antwort-Zeile (px) — hier anpassen
+TABLE_ROW_SPACING = 8       # vertikaler Abstand zwischen Antwort-Zeilen (px) — hier anpassen
+TABLE_FRAME_RADIUS = 8      # Eckenradius des Zeilenrahmens (px) — hier anpassen
+GRID_INFO_WIDTH = 420       # Moderator: Breite der Spalte "Autor / Antwort" (px) — hier anpassen
+GRID_CHECK_WIDTH = 60       # Moderator: Breite je Auswahlspalte (px) — hier anpassen
+GRID_STATUS_WIDTH = 110     # Moderator: Breite der Spalte "Status" (px) — hier anpassen
+GRID_ROW_HEIGHT = 34        # Moderator: Zeilenhöhe (px) — hier anpassen
+# =========================
+
+AuthorRole = Qt.UserRole + 1     # str: "Autor: …" bzw. "Autor: ???"
+RevealedRole = Qt.UserRole + 2   # bool: Zeile aufgedeckt
+VotesRole = Qt.UserRole + 3      # str: "3 Stimmen" (leer, wenn ausgeblendet)
+
+
+def votes_text(n: int) -> str:
+    return "keine Stimme" if n == 0 else "1 Stimme" if n == 1 else f"{n} Stimmen"
+
+
+def count_votes(n_rows: int, selections: Dict[str, Optional[int]]) -> List[int]:
+    """Stimmen je Zeile aus einer Auswahl-Zuordnung (nur beim Neuaufbau; danach kommen Einzelwerte per set_votes)."""
+    votes = [0] * n_rows
+    for sel in selections.values():
+        if sel is not None and 0 <= sel < n_rows:
+            votes[sel] += 1
+    return votes
+
+# ------------------------
+# Modell
+# ------------------------
+
+class AnswersTableModel(QAbstractTableModel):
+    """Spalte 0 = Antwort (Autor + Text), Spalte 1..N = Auswahl je Spieler (rotiert)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._slots: List[Dict] = []
+        self._revealed: List[bool] = []
+        self._col_players: List[str] = []
+        self._col_of: Dict[str, int] = {}
+        self._selections: Dict[str, Optional[int]] = {}
+        self._votes: List[int] = []
+        self.show_votes = True   # Stimmenzahl in der Autorzeile zeichnen
+
+    # Vollständiges Layout (nur bei neuem Mischen)
+    def set_layout(self, slots: List[Dict], revealed: List[bool], col_players: List[str],
+                   selections: Dict[str, Optional[int]]):
+        self.beginResetModel()
+        self._slots = list(slots)
+        self._revealed = list(revealed)
+        self._col_players = list(col_players)
+        self._col_of = {p: c for c, p in enumerate(self._col_players, start=1)}
+        self._selections = {p: selections.get(p) for p in self._col_players}
+        self._votes = count_votes(len(self._slots), selections)
+        self.endResetModel()
+
+    def clear(self):
+        self.set_layout([], [], [], {})
+
+    # Diff-Updates (emittieren nur dataChanged der betroffenen Zellen)
+    def reveal(self, row: int, author: str):
+        if not (0 <= row < len(self._slots)):
+            return
+        self._revealed[row] = True
+        self._slots[row] = dict(self._slots[row], author=author)
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx, [AuthorRole, RevealedRole])
+
+    def set_selection(self, pname: str, row: Optional[int]):
+        col = self._col_of.get(pname)
+        if col is None:
+            return
+        prev = self._selections.get(pname)
+        if prev == row:
+            return
+        self._selections[pname] = row
+        for r in (prev, row):
+            if r is not None and 0 <= r < len(self._slots):
+                idx = self.index(r, col)
+                self.dataChanged.emit(idx, idx, [Qt.CheckStateRole])
+
+    def set_votes(self, row: int, n: int):
+        if 0 <= row < len(self._votes) and self._votes[row] != n:
+            self._votes[row] = n
+            idx = self.index(row, 0)
+            self.dataChanged.emit(idx, idx, [VotesRole])
+
+    # QAbstractTableModel
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._slots)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() or not self._slots else len(self._col_players) + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r, c = index.row(), index.column()
+        if c == 0:
+            slot = self._slots[r]
+            if role == Qt.DisplayRole:
+                return slot["text"] or "(leer)"
+            if role == AuthorRole:
+                return f"Autor: {slot['author'] if self._revealed[r] else '???'}"
+            if role == RevealedRole:
+                return self._revealed[r]
+            if role == VotesRole:
+                return votes_text(self._votes[r]) if self.show_votes else ""
+            return None
+        if role == Qt.CheckStateRole:
+            pname = self._col_players[c - 1]
+            return Qt.Checked if self._selections.get(pname) == r else Qt.Unchecked
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation != Qt.Horizontal or role != Qt.DisplayRole:
+            return None
+        if section == 0:
+            return "Antworten"
+        if 0 < section <= len(self._col_players):
+            return self._col_players[section - 1]
+        return None
+
+    def flags(self, index: QModelIndex):
+        return Qt.ItemIsEnabled if index.isValid() else Qt.NoItemFlags
+
+# ------------------------
+# Delegate
+# ------------------------
+
+class AnswerRowDelegate(QStyledItemDelegate):
+    """Zeichnet jede Zeile als gerahmten Container über alle Spalten (ohne Widgets)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.author_font = QFont(); self.author_font.setPixelSize(14)
+        self.text_font = QFont(); self.text_font.setPixelSize(20)
+        self.frame_pen = QPen(QColor("#777")); self.frame_pen.setWidth(1)
+        self.frame_fill = QColor(255, 255, 255, 8)
+        self.author_color = QColor("#CCC")
+
+    def row_height(self) -> int:
+        fm_a = QFontMetrics(self.author_font)
+        fm_t = QFontMetrics(self.text_font)
+        return fm_a.height() + 5 + 2 * fm_t.height() + 2 * TABLE_ROW_PADDING + TABLE_ROW_SPACING
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        w = TABLE_TEXT_WIDTH if index.column() == 0 else TABLE_CHECK_WIDTH
+        return QSize(w, self.row_height())
+
+    def _paint_frame(self, painter: QPainter, cell: QRect, col: int, last_col: int):
+        # Rahmen über die ganze Zeile: jede Zelle zeichnet ihren Ausschnitt eines gemeinsamen Rechtecks
+        half = TABLE_ROW_SPACING // 2
+        ext = 2 * TABLE_FRAME_RADIUS + 2
+        frame = QRectF(cell.adjusted(0 if col == 0 else -ext, half,
+                                     0 if col == last_col else ext, -half)).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.save()
+        painter.setClipRect(cell)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(self.frame_pen)
+        painter.setBrush(self.frame_fill)
+        painter.drawRoundedRect(frame, TABLE_FRAME_RADIUS, TABLE_FRAME_RADIUS)
+        painter.restore()
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        model = index.model()
+        col = index.column()
+        self._paint_frame(painter, option.rect, col, model.columnCount() - 1)
+        inner = option.rect.adjusted(TABLE_ROW_PADDING, TABLE_ROW_SPACING // 2 + TABLE_ROW_PADDING,
+                                     -TABLE_ROW_PADDING, -(TABLE_ROW_SPACING // 2 + TABLE_ROW_PADDING))
+        painter.save()
+        if col == 0:
+            fm_a = QFontMetrics(self.author_font)
+            painter.setFont(self.author_font)
+            painter.setPen(self.author_color)
+            a_rect = QRect(inner.left(), inner.top(), inner.width(), fm_a.height())
+            painter.drawText(a_rect, Qt.AlignLeft | Qt.AlignVCenter, index.data(AuthorRole) or "")
+            painter.drawText(a_rect, Qt.AlignRight | Qt.AlignVCenter, index.data(VotesRole) or "")
+            painter.setFont(self.text_font)
+            painter.setPen(option.palette.text().color())
+            t_rect = QRect(inner.left(), a_rect.bottom() + 5, inner.width(), inner.bottom() - a_rect.bottom() - 5)
+            painter.drawText(t_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, index.data(Qt.DisplayRole) or "")
+        else:
+            # Auswahlmarke: Stil-Checkbox (deaktiviert, nur Anzeige) zentriert zeichnen
+            opt = QStyleOptionButton()
+            style = option.widget.style() if option.widget else QApplication.style()
+            opt.rect = QRect(0, 0, style.pixelMetric(QStyle.PM_IndicatorWidth),
+                             style.pixelMetric(QStyle.PM_IndicatorHeight))
+            opt.rect.moveCenter(option.rect.center())
+            checked = index.data(Qt.CheckStateRole) == Qt.Checked
+            opt.state = QStyle.State_On if checked else QStyle.State_Off
+            style.drawPrimitive(QStyle.PE_IndicatorCheckBox, opt, painter, option.widget)
+        painter.restore()
+
+# ------------------------
+# View
+# ------------------------
+
+class AnswersTableView(QTableView):
+    """Nicht-interaktive Antworttabelle für das Zuschauerfenster."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.answers_model = AnswersTableModel(self)
+        self.row_delegate = AnswerRowDelegate(self)
+        self.setModel(self.answers_model)
+        self.setItemDelegate(self.row_delegate)
+        self.setShowGrid(False)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setFrameShape(QTableView.NoFrame)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalHeader().hide()
+        vh = self.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(self.row_delegate.row_height())
+        hh = self.horizontalHeader()
+        hh.setSectionResizeMode(QHeaderView.Fixed)
+        hh.setDefaultSectionSize(TABLE_CHECK_WIDTH)
+        hh.setHighlightSections(False)
+        hh.setDefaultAlignment(Qt.AlignCenter)
+        hf = QFont(); hf.setPixelSize(14); hf.setBold(True)
+        hh.setFont(hf)
+        self.answers_model.modelReset.connect(self._apply_column_widths)
+
+    def _apply_column_widths(self):
+        if self.answers_model.columnCount() > 0:
+            self.horizontalHeader().resizeSection(0, TABLE_TEXT_WIDTH)
+
+# ------------------------
+# Moderator: Auswahlraster
+# ------------------------
+
+class SelectionGridModel(QAbstractTableModel):
+    """Spalte 0 = Autor/Antwort, 1..N = Auswahl je Spieler (exklusiv pro Spalte), N+1 = Status."""
+
+    selection_changed = Signal(str, int)  # pname, Zeilenindex (Anzeige-Reihenfolge)
+    reveal_requested = Signal(int)        # Zeilenindex
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._infos: List[str] = []
+        self._revealed: List[bool] = []
+        self._col_players: List[str] = []
+        self._col_of: Dict[str, int] = {}
+        self._selections: Dict[str, Optional[int]] = {}
+        self._votes: List[int] = []
+
+    @property
+    def status_column(self) -> int:
+        return len(self._col_players) + 1
+
+    def set_layout(self, slots: List[Dict], revealed: List[bool], col_players: List[str],
+                   selections: Dict[str, Optional[int]]):
+        self.beginResetModel()
+        self._infos = [f"{s['author']} — {(s['text'] or '(leer)')[:100]}" for s in slots]
+        self._revealed = list(revealed)
+        self._col_players = list(col_players)
+        self._col_of = {p: c for c, p in enumerate(self._col_players, start=1)}
+        self._selections = {p: selections.get(p) for p in self._col_players}
+        self._votes = count_votes(len(self._infos), selections)
+        self.endResetModel()
+
+    def clear(self):
+        self.set_layout([], [], [], {})
+
+    def set_votes(self, row: int, n: int):
+        if 0 <= row < len(self._votes) and self._votes[row] != n:
+            self._votes[row] = n
+            idx = self.index(row, self.status_column)
+            self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def set_revealed(self, row: int):
+        if 0 <= row < len(self._revealed) and not self._revealed[row]:
+            self._revealed[row] = True
+            idx = self.index(row, self.status_column)
+            self.dataChanged.emit(idx, idx, [Qt.DisplayRole, RevealedRole])
+
+    def set_selection(self, pname: str, row: Optional[int], col: Optional[int] = None):
+        if col is None:
+            col = self._col_of.get(pname)
+            if col is None:
+                return
+        prev = self._selections[pname]
+        if prev == row:
+            return
+        self._selections[pname] = row
+        for r in (prev, row):
+            if r is not None and 0 <= r < len(self._infos):
+                idx = self.index(r, col)
+                self.dataChanged.emit(idx, idx, [Qt.CheckStateRole])
+
+    def cell_clicked(self, index: QModelIndex):
+        if not index.isValid():
+            return
+        r, c = index.row(), index.column()
+        if 1 <= c <= len(self._col_players):
+            # Wie QButtonGroup(exclusive): erneutes Klicken lässt die Auswahl bestehen
+            pname = self._col_players[c - 1]
+            self.set_selection(pname, r, c)
+            self.selection_changed.emit(pname, r)
+        elif c == self.status_column and not self._revealed[r]:
+            self.reveal_requested.emit(r)
+
+    # QAbstractTableModel
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._infos)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() or not self._infos else len(self._col_players) + 2
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r, c = index.row(), index.column()
+        if c == 0:
+            return self._infos[r] if role == Qt.DisplayRole else None
+        if c == self.status_column:
+            if role == Qt.DisplayRole:
+                return f"{'Aufgedeckt' if self._revealed[r] else 'Aufdecken'} ({self._votes[r]})"
+            if role == RevealedRole:
+                return self._revealed[r]
+            return None
+        if role == Qt.CheckStateRole:
+            pname = self._col_players[c - 1]
+            return Qt.Checked if self._selections.get(pname) == r else Qt.Unchecked
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation != Qt.Horizontal or role != Qt.DisplayRole:
+            return None
+        if section == 0:
+            return "Autor / Antwort"
+        if section == self.status_column:
+            return "Status"
+        if 0 < section <= len(self._col_players):
+            return self._col_players[section - 1]
+        return None
+
+    def flags(self, index: QModelIndex):
+        return Qt.ItemIsEnabled if index.isValid() else Qt.NoItemFlags
+
+
+class SelectionGridDelegate(QStyledItemDelegate):
+    """Zeichnet Auswahl-Checkboxen und den Aufdecken-Button je Zeile ohne echte Widgets."""
+
+    def __init__(self, color_show: str, color_done: str, parent=None):
+        super().__init__(parent)
+        self.color_show = QColor(color_show)
+        self.color_done = QColor(color_done)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        model = index.model()
+        col = index.column()
+        if col == 0:
+            super().paint(painter, option, index)
+            return
+        style = option.widget.style() if option.widget else QApplication.style()
+        painter.save()
+        if col == model.status_column:
+            revealed = bool(index.data(RevealedRole))
+            btn = QRectF(option.rect.adjusted(4, 3, -4, -3))
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.color_done if revealed else self.color_show)
+            painter.drawRoundedRect(btn, 6, 6)
+            painter.setPen(QColor("white"))
+            painter.drawText(btn, Qt.AlignCenter, index.data(Qt.DisplayRole) or "")
+        else:
+            opt = QStyleOptionButton()
+            opt.rect = QRect(0, 0, style.pixelMetric(QStyle.PM_IndicatorWidth),
+                             style.pixelMetric(QStyle.PM_IndicatorHeight))
+            opt.rect.moveCenter(option.rect.center())
+            checked = index.data(Qt.CheckStateRole) == Qt.Checked
+            opt.state = QStyle.State_Enabled | (QStyle.State_On if checked else QStyle.State_Off)
+            style.drawPrimitive(QStyle.PE_IndicatorCheckBox, opt, painter, option.widget)
+        painter.restore()
+
+
+class SelectionGridView(QTableView):
+    """Moderator-Auswahlraster: einmal pro Sitzung erzeugt, pro Runde nur neu befüllt."""
+
+    def __init__(self, color_show: str, color_done: str, parent=None):
+        super().__init__(parent)
+        self.grid_model = SelectionGridModel(self)
+        self.setModel(self.grid_model)
+        self.setItemDelegate(SelectionGridDelegate(color_show, color_done, self))
+        self.setShowGrid(False)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setWordWrap(False)
+        self.setTextElideMode(Qt.ElideRight)
+        self.verticalHeader().hide()
+        vh = self.verticalHeader()
+        vh.setSectionResizeMode(QHeaderView.Fixed)
+        vh.setDefaultSectionSize(GRID_ROW_HEIGHT)
+        hh = self.horizontalHeader()
+        hh.setSectionResizeMode(QHeaderView.Fixed)
+        hh.setDefaultSectionSize(GRID_CHECK_WIDTH)
+        hh.setHighlightSections(False)
+        self.grid_model.modelReset.connect(self._apply_column_widths)
+        # pressed statt clicked: reagiert sofort, unabhängig von der Spielerzahl
+        self.pressed.connect(self.grid_model.cell_clicked)
+
+    def _apply_column_widths(self):
+        if self.grid_model.columnCount() > 0:
+            hh = self.horizontalHeader()
+            hh.resizeSection(0, GRID_INFO_WIDTH)
+            hh.resizeSection(self.grid_model.status_column, GRID_STATUS_WIDTH)
+
+# ------------------------
+# Editor: Rundenliste
+# ------------------------
+
+class RoundListModel(QAbstractListModel):
+    """Zeigt die Titel einer Runden-Sequenz (Liste, LazyRounds oder RoundStore).
+    Titel werden erst gelesen, wenn die Zeile gezeichnet wird. Mit Filter zeigt Zeile k die Runde rows[k]."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rounds: Sequence = []
+        self._rows: Optional[List[int]] = None   # sortierte Rundenindizes oder None = alle
+
+    def set_rounds(self, rounds: Sequence):
+        self.beginResetModel()
+        self._rounds = rounds
+        self._rows = None
+        self.endResetModel()
+
+    def set_filter(self, rows: Optional[List[int]]):
+        self.beginResetModel()
+        self._rows = None if rows is None else sorted(rows)
+        self.endResetModel()
+
+    @property
+    def filtered(self) -> bool:
+        return self._rows is not None
+
+    def round_at(self, row: int) -> int:
+        return self._rows[row] if self._rows is not None else row
+
+    def row_of(self, index: int) -> int:
+        """Zeile der Runde `index` in der Ansicht, -1 wenn herausgefiltert."""
+        if self._rows is None:
+            return index if 0 <= index < len(self._rounds) else -1
+        k = bisect_left(self._rows, index)
+        return k if k < len(self._rows) and self._rows[k] == index else -1
+
+    # Einzeländerungen (ohne Filter; mit Filter wird neu gefiltert)
+    def round_changed(self, index: int):
+        row = self.row_of(index)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx, [Qt.DisplayRole])
+
+    def rounds_inserted(self, first: int, count: int):
+        if self._rows is None and count > 0:
+            self.beginInsertRows(QModelIndex(), first, first + count - 1)
+            self.endInsertRows()
+
+    def round_removed(self, index: int):
+        if self._rows is None:
+            self.beginRemoveRows(QModelIndex(), index, index)
+            self.endRemoveRows()
+
+    def round_moved(self, src: int, dst: int):
+        if self._rows is None and src != dst:
+            self.beginMoveRows(QModelIndex(), src, src, QModelIndex(), dst + 1 if dst > src else dst)
+            self.endMoveRows()
+
+    # QAbstractListModel
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows) if self._rows is not None else len(self._rounds)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self._rounds[self.round_at(index.row())].title or "(ohne Titel)"
+
+# ------------------------
+# Setup: Medienstatus
+# ------------------------
+
+class MediaListModel(QAbstractListModel):
+    """Eine Zeile je Runde: Titel + Prüfergebnis. Liest Titel erst beim Zeichnen und direkt aus dem Roh-Tupel
+    (LazyRounds.raw_at), Ergebnisse aus dem Dict des Dialogs (Rundenindex -> MediaInfo)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rounds = None
+        self._infos: Dict[int, object] = {}
+        self._count = 0   # angezeigte Runden (wächst mit rounds_appended)
+
+    def reset(self, rounds, infos: Dict[int, object]):
+        self.beginResetModel()
+        self._rounds = rounds
+        self._infos = infos
+        self._count = 0
+        self.endResetModel()
+
+    def rounds_appended(self, count: int):
+        if count > 0:
+            self.beginInsertRows(QModelIndex(), self._count, self._count + count - 1)
+            self._count += count
+            self.endInsertRows()
+
+    def infos_changed(self, first: int, last: int):
+        """Ergebnisse für die Runden first..last liegen vor (ein Signal je Block)."""
+        last = min(last, self._count - 1)
+        if first <= last:
+            self.dataChanged.emit(self.index(first), self.index(last), [Qt.DisplayRole])
+
+    def _title(self, i: int) -> str:
+        it = self._rounds.raw_at(i) if hasattr(self._rounds, "raw_at") else self._rounds[i]
+        return it[0] if type(it) is tuple else it.title
+
+    # QAbstractListModel
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._count
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        r = index.row()
+        info = self._infos.get(r)
+        if info is None:
+            return f"… {self._title(r)} — wird geprüft"
+        return f"{'✔' if info.ok else '✖'} {self._title(r)} — {info.summary()}"
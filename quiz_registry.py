@@ -0,0 +1,188 @@
+# quiz_registry.py
+# Modul-Registry für den Startscreen, ohne die Module selbst zu importieren
+# - Module beschreiben sich mit MODULE_INFO = {"name": ..., "entry": ..., "order": ..., "description": ...} (reines Literal)
+# - Suche: quiz_*.py im Modulordner (per ast gelesen, Ergebnis nach mtime/Größe gecacht) + Python-Entry-Points
+# - ModuleInfo.load() importiert das Modul erst, wenn es gestartet wird (z.B. QtMultimedia erst bei "Starten")
+# - StartupReport: Zeitmarken für Importe und erstes Bild (Kaltstart-Analyse)
+
+from __future__ import annotations
+
+import ast
+import importlib
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QEvent
+
+# =========================
+# Konfiguration (anpassen)
+# =========================
+MODULES_DIR = os.path.dirname(os.path.abspath(__file__))  # Ordner mit den Quiz-Modulen — hier anpassen
+MODULE_PREFIX = "quiz_"                     # nur Dateien mit diesem Präfix werden gelesen — hier anpassen
+ENTRY_POINT_GROUP = "quiz_suite.modules"    # Entry-Point-Gruppe für installierte Module — hier anpassen
+REGISTRY_CACHE = ".module-registry.json"    # Metadaten-Cache im Modulordner — hier anpassen
+# =========================
+
+CACHE_VERSION = 1
+
+
+@dataclass
+class ModuleInfo:
+    name: str
+    module: str           # importierbarer Modulname
+    entry: str            # Klasse/Callable mit on_close=...
+    order: int = 100
+    description: str = ""
+    source: str = "dir"   # "dir" | "entry_point"
+
+    def load(self):
+        mod = importlib.import_module(self.module)
+        return getattr(mod, self.entry)
+
+
+def _file_key(path: str) -> Optional[List[int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def read_module_info(path: str) -> Optional[Dict]:
+    """Liest MODULE_INFO per ast (ohne Import); None, wenn die Datei kein Modul beschreibt."""
+    with open(path, "rb") as f:
+        src = f.read()
+    if b"MODULE_INFO" not in src:
+        return None
+    try:
+        tree = ast.parse(src, filename=path)
+    except SyntaxError:
+        return None
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "MODULE_INFO" for t in node.targets):
+            try:
+                info = ast.literal_eval(node.value)
+            except ValueError:
+                return None
+            if isinstance(info, dict) and isinstance(info.get("name"), str) and isinstance(info.get("entry"), str):
+                return info
+    return None
+
+
+def _scan_dir(directory: str) -> List[ModuleInfo]:
+    cache_file = os.path.join(directory, REGISTRY_CACHE)
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("version") != CACHE_VERSION:
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    old = cache.get("files", {})
+    files: Dict[str, Dict] = {}
+    changed = False
+    out: List[ModuleInfo] = []
+    for fn in sorted(os.listdir(directory)):
+        if not (fn.startswith(MODULE_PREFIX) and fn.endswith(".py")):
+            continue
+        path = os.path.join(directory, fn)
+        key = _file_key(path)
+        entry = old.get(fn)
+        if entry is None or entry.get("key") != key:
+            try:
+                info = read_module_info(path)
+            except OSError:
+                continue
+            entry = {"key": key, "info": info}
+            changed = True
+        files[fn] = entry
+        info = entry["info"]
+        if info:
+            out.append(ModuleInfo(
+                name=info["name"], module=fn[:-3], entry=info["entry"],
+                order=int(info.get("order", 100)), description=str(info.get("description", "")),
+            ))
+    if changed or set(files) != set(old):
+        try:
+            tmp = cache_file + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "files": files}, f)
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass  # Cache ist optional (z.B. schreibgeschützter Ordner)
+    return out
+
+
+def _scan_entry_points() -> List[ModuleInfo]:
+    try:
+        from importlib.metadata import entry_points
+        eps = entry_points(group=ENTRY_POINT_GROUP)
+    except Exception:
+        return []
+    out = []
+    for ep in eps:
+        module, _, attr = ep.value.partition(":")
+        if module and attr:
+            out.append(ModuleInfo(name=ep.name, module=module.strip(), entry=attr.strip(), source="entry_point"))
+    return out
+
+
+def discover_modules(directory: str = MODULES_DIR, entry_points: bool = True) -> List[ModuleInfo]:
+    """Alle Modul-Beschreibungen, sortiert nach order/Name; bei gleichem Namen gewinnt der Modulordner."""
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    found: Dict[str, ModuleInfo] = {}
+    for info in _scan_dir(directory) + (_scan_entry_points() if entry_points else []):
+        found.setdefault(info.name, info)
+    return sorted(found.values(), key=lambda m: (m.order, m.name))
+
+# ------------------------
+# Startzeit-Report
+# ------------------------
+
+class _FirstPaint(QObject):
+    def __init__(self, report: "StartupReport", label: str, target: QObject):
+        super().__init__(target)
+        self.report = report
+        self.label = label
+        self.target = target
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            self.target.removeEventFilter(self)
+            self.report.mark(self.label)
+            self.report.emit()
+            self.deleteLater()
+        return False
+
+
+class StartupReport:
+    """Sammelt (Bezeichnung, Zeitpunkt) relativ zu t0; emit() gibt den Report auf stderr aus, falls aktiviert."""
+
+    def __init__(self, t0: Optional[float] = None, enabled: bool = False):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.enabled = enabled
+        self.marks: List[Tuple[str, float]] = []
+
+    def mark(self, label: str):
+        self.marks.append((label, time.perf_counter()))
+
+    def watch_first_paint(self, target: QObject, label: str):
+        """Markiert das nächste Paint-Event von `target` (Widget oder QApplication für beliebige Fenster)."""
+        target.installEventFilter(_FirstPaint(self, label, target))
+
+    def format(self) -> str:
+        lines = ["Startzeit-Report (ms seit Programmstart, Δ zum vorigen Schritt):"]
+        prev = self.t0
+        for label, t in self.marks:
+            lines.append(f"  {(t - self.t0) * 1000:8.1f}  Δ {(t - prev) * 1000:7.1f}  {label}")
+            prev = t
+        return "\n".join(lines)
+
+    def emit(self):
+        if self.enabled:
+            print(self.format(), file=sys.stderr, flush=True)